@@ -10,8 +10,32 @@ def str_to_bool(value):
 class Config:
     BASE_URL = os.getenv("BASE_URL", "https://demo.nopcommerce.com/")
     BROWSER = os.getenv("BROWSER", "chrome")
-    IMPLICIT_WAIT = int(os.getenv("IMPLICIT_WAIT", 10))
     EXPLICIT_WAIT = int(os.getenv("EXPLICIT_WAIT", 20))
+
+    # Explicit timeouts per action class, see utils/wait_policy.py
+    NAVIGATION_TIMEOUT = int(os.getenv("NAVIGATION_TIMEOUT", 30))
+    AJAX_TIMEOUT = int(os.getenv("AJAX_TIMEOUT", EXPLICIT_WAIT))
+    ELEMENT_TIMEOUT = int(os.getenv("ELEMENT_TIMEOUT", 10))
+    NEGATIVE_CHECK_TIMEOUT = int(os.getenv("NEGATIVE_CHECK_TIMEOUT", 3))
+    POLL_FREQUENCY = float(os.getenv("POLL_FREQUENCY", 0.25))
+
+    # Multiplier for every explicit timeout; measured at session start unless set here,
+    # see utils/latency_calibration.py
+    TIMEOUT_SCALE = float(os.getenv("TIMEOUT_SCALE", 1.0))
+    CALIBRATE_TIMEOUTS = str_to_bool(os.getenv("CALIBRATE_TIMEOUTS", "True"))
+    CALIBRATION_PROBES = int(os.getenv("CALIBRATION_PROBES", 3))
+    CALIBRATION_REFERENCE_RTT = float(os.getenv("CALIBRATION_REFERENCE_RTT", 0.3))
+    CALIBRATION_REFERENCE_LOAD = float(os.getenv("CALIBRATION_REFERENCE_LOAD", 1.5))
+    MIN_TIMEOUT_SCALE = float(os.getenv("MIN_TIMEOUT_SCALE", 0.5))
+    MAX_TIMEOUT_SCALE = float(os.getenv("MAX_TIMEOUT_SCALE", 4.0))
+
+    # Per-locator timeouts learned from earlier runs, see utils/adaptive_timeouts.py
+    ADAPTIVE_TIMEOUTS = str_to_bool(os.getenv("ADAPTIVE_TIMEOUTS", "True"))
+    ADAPTIVE_SAFETY_FACTOR = float(os.getenv("ADAPTIVE_SAFETY_FACTOR", 2.0))
+    ADAPTIVE_MIN_SAMPLES = int(os.getenv("ADAPTIVE_MIN_SAMPLES", 5))
+    ADAPTIVE_MIN_TIMEOUT = float(os.getenv("ADAPTIVE_MIN_TIMEOUT", 2))
+    ADAPTIVE_TIMEOUT_CEILING = float(os.getenv("ADAPTIVE_TIMEOUT_CEILING", 30))
+    ADAPTIVE_MAX_SAMPLES = int(os.getenv("ADAPTIVE_MAX_SAMPLES", 200))
     HEADLESS = str_to_bool(os.getenv("HEADLESS", "False"))
     TEST_DATA_PATH = os.path.join(os.path.dirname(__file__), "testdata.json")
 
@@ -22,10 +46,82 @@ class Config:
     if not os.path.exists(REPORTS_DIR):
         os.makedirs(REPORTS_DIR)
 
+    WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "main")
+    PERF_DIR = os.getenv("PERF_DIR", os.path.join(REPORTS_DIR, "perf"))
+    WAIT_HISTORY_DIR = os.getenv("WAIT_HISTORY_DIR", os.path.join(REPORTS_DIR, "wait_history"))
+
+    LOG_DIR = os.getenv("LOG_DIR", os.path.join(REPORTS_DIR, "logs"))
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG")
+    # Keep DEBUG/INFO for each test in memory and write it out only if the test fails;
+    # the per-worker log file then only receives LOG_FILE_LEVEL and above.
+    LOG_FAILURES_ONLY = str_to_bool(os.getenv("LOG_FAILURES_ONLY", "True"))
+    LOG_FILE_LEVEL = os.getenv("LOG_FILE_LEVEL", "WARNING")
+    LOG_BUFFER_MAX_RECORDS = int(os.getenv("LOG_BUFFER_MAX_RECORDS", 5000))
+    LOG_BUFFER_MAX_BYTES = int(os.getenv("LOG_BUFFER_MAX_BYTES", 2 * 1024 * 1024))
+
     SCREENSHOT_DIR = os.getenv("SCREENSHOT_DIR", "./screenshots")
     if not os.path.exists(SCREENSHOT_DIR):
         os.makedirs(SCREENSHOT_DIR)
     SCREENSHOT_ON_FAILURE = str_to_bool(os.getenv("SCREENSHOT_ON_FAILURE", "True"))
+    # Locator failures in BasePage attach a crop of the element and its outer HTML;
+    # the full-window shot is only taken on top of that when this is enabled.
+    FULL_PAGE_SCREENSHOT_ON_FAILURE = str_to_bool(os.getenv("FULL_PAGE_SCREENSHOT_ON_FAILURE", "False"))
+    # Chrome only: keep the last few seconds of CDP screencast frames and attach them as a clip on failure.
+    SCREENCAST_ON_FAILURE = str_to_bool(os.getenv("SCREENCAST_ON_FAILURE", "False"))
+    SCREENCAST_SECONDS = float(os.getenv("SCREENCAST_SECONDS", 10))
+    SCREENCAST_MAX_FRAMES = int(os.getenv("SCREENCAST_MAX_FRAMES", 150))
+    SCREENCAST_EVERY_NTH_FRAME = int(os.getenv("SCREENCAST_EVERY_NTH_FRAME", 6))
+    SCREENCAST_MAX_WIDTH = int(os.getenv("SCREENCAST_MAX_WIDTH", 960))
+    SCREENCAST_QUALITY = int(os.getenv("SCREENCAST_QUALITY", 50))
+    # Console messages, JS errors and document/XHR/fetch request summaries, dumped on failure.
+    # Off by default like the screencast: on Chrome, opening the CDP session can hold up driver setup.
+    BROWSER_EVENTS_ON_FAILURE = str_to_bool(os.getenv("BROWSER_EVENTS_ON_FAILURE", "False"))
+    BROWSER_EVENTS_MAX = int(os.getenv("BROWSER_EVENTS_MAX", 500))
+
+    # Navigation Timing, resource summary, LCP, CLS and TBT for every page load, see utils/page_metrics.py.
+    PAGE_METRICS = str_to_bool(os.getenv("PAGE_METRICS", "True"))
+    # Per-route budgets; breaches are soft unless the test is marked perf_budget_strict.
+    PERF_BUDGETS_PATH = os.getenv("PERF_BUDGETS_PATH", os.path.join(os.path.dirname(__file__), "perf_budgets.json"))
+    PERF_BUDGETS = str_to_bool(os.getenv("PERF_BUDGETS", "True"))
+    # Run-over-run history of page timings and the regression check against it, see utils/perf_history.py.
+    PERF_HISTORY = str_to_bool(os.getenv("PERF_HISTORY", "True"))
+    PERF_HISTORY_DB = os.getenv("PERF_HISTORY_DB", os.path.join(PERF_DIR, "history.sqlite"))
+    PERF_BASELINE_RUNS = int(os.getenv("PERF_BASELINE_RUNS", 5))
+    PERF_REGRESSION_ALPHA = float(os.getenv("PERF_REGRESSION_ALPHA", 0.05))
+    PERF_MIN_REGRESSION = float(os.getenv("PERF_MIN_REGRESSION", 0.1))
+    PERF_MIN_SAMPLES = int(os.getenv("PERF_MIN_SAMPLES", 5))
+    # Per-test split of harness, WebDriver wire, wait, sleep and fixture time, see utils/time_breakdown.py.
+    TIME_BREAKDOWN = str_to_bool(os.getenv("TIME_BREAKDOWN", "True"))
+    # Per-test profiles for --profile-tests and @pytest.mark.profile, see utils/test_profiler.py.
+    PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(PERF_DIR, "profiles"))
+    PROFILE_MODE = os.getenv("PROFILE_MODE", "sample")
+    PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", 5))
+    PROFILE_TOP_FRAMES = int(os.getenv("PROFILE_TOP_FRAMES", 20))
+    # Spans for page-object methods, exported as OTLP JSON, see utils/tracing.py.
+    TRACING = str_to_bool(os.getenv("TRACING", "True"))
+    TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "nopcommerce-e2e")
+    TRACE_BATCH_SPANS = int(os.getenv("TRACE_BATCH_SPANS", 1000))
+    TRACE_TOP_FLOWS = int(os.getenv("TRACE_TOP_FLOWS", 10))
+    # Page-object spans replayed as Allure steps at test end; needs TRACING, see utils/allure_steps.py.
+    ALLURE_STEPS = str_to_bool(os.getenv("ALLURE_STEPS", "True"))
+    ALLURE_STEP_MIN_MS = float(os.getenv("ALLURE_STEP_MIN_MS", 0))
+    ALLURE_STEP_ARG_LENGTH = int(os.getenv("ALLURE_STEP_ARG_LENGTH", 120))
+    ALLURE_REDACT_PATTERN = os.getenv("ALLURE_REDACT_PATTERN", "pass|cvv|cvc|card|secret|token")
+    # Longest-first xdist scheduling from previous runs' durations, see utils/duration_scheduler.py.
+    DURATION_SCHEDULING = str_to_bool(os.getenv("DURATION_SCHEDULING", "True"))
+    TEST_DURATIONS_PATH = os.getenv("TEST_DURATIONS_PATH", os.path.join(PERF_DIR, "test_durations.json"))
+    TEST_DURATIONS_WEIGHT = float(os.getenv("TEST_DURATIONS_WEIGHT", 0.5))
+    DEFAULT_TEST_DURATION = float(os.getenv("DEFAULT_TEST_DURATION", 30))
+
+    # Network profiles for --net-profile, applied with CDP Network.emulateNetworkConditions.
+    NET_PROFILES = {
+        "slow3g": {"latency_ms": 400, "download_kbps": 400, "upload_kbps": 400},
+        "fast3g": {"latency_ms": 150, "download_kbps": 1600, "upload_kbps": 750},
+        "slow4g": {"latency_ms": 100, "download_kbps": 4000, "upload_kbps": 3000},
+    }
+    # webp, jpg or png; anything but png needs Pillow and falls back to png without it.
+    SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "webp").lower()
+    SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", 80))
 
     CHROME_DRIVER_PATH = os.getenv("CHROME_DRIVER_PATH",
                                    os.path.join(os.path.dirname(__file__), "drivers", "chromedriver.exe"))
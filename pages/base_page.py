@@ -1,31 +1,65 @@
-from selenium.common import TimeoutException
+from selenium.common import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.select import Select
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import logging
+from utils.allure_steps import REDACTED, is_sensitive_locator
+from utils.evidence import Evidence
+from utils.latency_histogram import record_latency
+from utils.lazy_element import lazy_element
+from utils.page_metrics import PageMetrics
+from utils.tracing import Traced
+from utils.wait_policy import WaitPolicy
 from utils.wait_util import WaitUtil
 
 
-class BasePage:
+# Resolves a locator and checks visibility inside the browser, so a negative
+# check costs one round trip instead of a find_elements plus is_displayed calls.
+PRESENCE_SCRIPT = """
+const [strategy, value] = arguments;
+let nodes = [];
+if (strategy === 'xpath') {
+    const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+} else if (strategy === 'link text' || strategy === 'partial link text') {
+    nodes = Array.from(document.querySelectorAll('a')).filter(a => {
+        const text = a.innerText.trim();
+        return strategy === 'link text' ? text === value : text.includes(value);
+    });
+} else {
+    nodes = Array.from(document.querySelectorAll(value));
+}
+return nodes.some(node => {
+    const style = window.getComputedStyle(node);
+    return style.visibility !== 'hidden' && style.display !== 'none' && node.getClientRects().length > 0;
+});
+"""
+
+
+class BasePage(Traced):
     def __init__(self, driver):
         self.driver = driver
         self.logger = logging.getLogger(self.__class__.__name__)
-        logging.basicConfig(level=logging.INFO)
 
+    @record_latency()
     def open_url(self, url):
         self.driver.get(url)
-        self.logger.info(f"Opened URL: {url}")
+        PageMetrics.after_navigation(self.driver)
+        self.logger.info("Opened URL: %s", url)
 
+    @record_latency()
     def enter_text(self, locator, text: str):
-        self.logger.info(f"Entering text '{text}' into field: {locator}")
+        shown = REDACTED if is_sensitive_locator(locator) else text
+        self.logger.info("Entering text '%s' into field: %s", shown, locator)
         field = self.wait_for_element(*locator)
         if field:
             field.clear()
             field.send_keys(text)
-            self.logger.info(f"Text entered into field: {locator}")
+            self.logger.debug("Text entered into field: %s", locator)
         else:
-            self.logger.error(f"Field {locator} not found. Cannot enter text.")
+            self.logger.error("Field %s not found. Cannot enter text.", locator)
 
+    @record_latency()
     def click(self, locator):
         if isinstance(locator, tuple):
             by, value = locator
@@ -35,20 +69,24 @@ class BasePage:
 
         if element:
             try:
-                self.driver.execute_script("arguments[0].click();", element)
-                self.logger.info(f"Clicked on element: {locator}")
+                try:
+                    self.driver.execute_script("arguments[0].click();", element)
+                except StaleElementReferenceException:
+                    element.refresh()
+                    self.driver.execute_script("arguments[0].click();", element)
+                self.logger.info("Clicked on element: %s", locator)
                 return True
             except Exception as e:
-                self.logger.error(f"Error clicking element: {locator} - {str(e)}")
+                self.logger.error("Error clicking element: %s - %s", locator, e)
                 return False
         else:
-            self.logger.error(f"Element not found: {locator}")
+            self.logger.error("Element not found: %s", locator)
             return False
 
     def extract_alert_text(self):
-        alert = WebDriverWait(self.driver, 5).until(EC.alert_is_present())
+        alert = self.wait_until(EC.alert_is_present(), WaitPolicy.AJAX)
         alert_text = alert.text
-        self.logger.info(f"Alert Text: {alert_text}")
+        self.logger.info("Alert Text: %s", alert_text)
         return alert_text
 
     def assert_alert_message(self, alert_text, expected_message):
@@ -69,103 +107,158 @@ class BasePage:
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
             self.logger.info("Scrolled element into view.")
         except Exception as e:
-            self.logger.error(f"Error scrolling element into view: {str(e)}")
+            self.logger.error("Error scrolling element into view: %s", e)
+
+    @record_latency()
+    def wait_until(self, condition, action=WaitPolicy.ELEMENT, timeout=None, locator=None):
+        return WaitPolicy.until(self.driver, condition, action, timeout, locator=locator)
+
+    def capture_evidence(self, locator, reason):
+        """Attach a crop and the outer HTML of the element behind a failed locator check."""
+        Evidence.capture(self.driver, locator, reason)
 
-    def wait_for_element(self, by, value=None, timeout=10):
-        self.logger.info(f"Waiting for element {value} to appear.")
+    def _lazy(self, locator, element, index=0):
+        return lazy_element(self.driver, locator, index, element=element)
+
+    @record_latency()
+    def wait_for_element(self, by, value=None, timeout=None, capture=True):
+        """Wait for the element to be visible; optional probes pass capture=False to skip failure evidence."""
+        locator = by if isinstance(by, tuple) else (by, value)
+        by, value = locator
+        self.logger.debug("Waiting for element %s to appear.", value)
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located((by, value))
-            )
-            self.logger.info(f"Element {value} found: {element}")
+            element = self._lazy(locator, self.wait_until(EC.visibility_of_element_located(locator),
+                                                          timeout=timeout, locator=locator))
+            self.logger.debug("Element %s found: %s", value, element)
             return element
         except Exception as e:
-            self.logger.error(f"Error while waiting for element {value}: {str(e)}")
+            self.logger.error("Error while waiting for element %s: %s", value, e)
+            if capture:
+                self.capture_evidence(locator, f"Element not visible: {value}")
             raise
 
-    def wait_for_element_to_be_visible(self, locator, timeout=10):
-        self.logger.info(f"Waiting for element to be visible: {locator}")
-        return WaitUtil.wait_for_element_to_be_visible(self.driver, locator, timeout)
+    @record_latency()
+    def wait_for_element_to_be_visible(self, locator, timeout=None):
+        self.logger.debug("Waiting for element to be visible: %s", locator)
+        return self._lazy(locator, WaitUtil.wait_for_element_to_be_visible(self.driver, locator, timeout))
 
     def is_element_visible(self, by, value):
+        # A boolean check, so it waits directly rather than through wait_for_element's evidence capture.
         try:
-            self.wait_for_element(by, value)
+            self.wait_until(EC.visibility_of_element_located((by, value)), locator=(by, value))
             return True
         except Exception as e:
-            self.logger.error(f"Error while checking visibility of element {value}: {str(e)}")
+            self.logger.error("Error while checking visibility of element %s: %s", value, e)
             return False
 
-    def wait_for_placeholder(self, driver, field_locator, expected_placeholder, timeout=10):
-        self.logger.info(f"Waiting for placeholder on field: {field_locator}")
+    def is_present_now(self, by, value):
+        """Check in a single round trip whether the element is displayed, without waiting."""
+        if by == By.ID:
+            by, value = By.CSS_SELECTOR, f'[id="{value}"]'
+        elif by == By.NAME:
+            by, value = By.CSS_SELECTOR, f'[name="{value}"]'
+        elif by == By.CLASS_NAME:
+            by, value = By.CSS_SELECTOR, f".{value}"
+        elif by == By.TAG_NAME:
+            by = By.CSS_SELECTOR
+
+        # A failing script is not evidence of absence, so its error propagates.
+        present = bool(self.driver.execute_script(PRESENCE_SCRIPT, by, value))
+        self.logger.debug("Element %s present: %s", value, present)
+        return present
+
+    @record_latency()
+    def wait_until_absent(self, by, value, timeout=None):
+        """Wait for the element to disappear; returns immediately if it is already gone, raises on timeout."""
         try:
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located(field_locator)
-            )
+            self.wait_until(lambda driver: not self.is_present_now(by, value), WaitPolicy.NEGATIVE, timeout)
+        except TimeoutException:
+            timeout = WaitPolicy.resolve(WaitPolicy.NEGATIVE, timeout)
+            self.logger.error("Element %s still displayed after %s seconds.", value, timeout)
+            raise TimeoutException(f"Element {(by, value)} still displayed after {timeout} seconds.")
+
+    def wait_for_placeholder(self, driver, field_locator, expected_placeholder, timeout=None):
+        self.logger.info("Waiting for placeholder on field: %s", field_locator)
+        try:
+            element = WaitPolicy.until(driver, EC.presence_of_element_located(field_locator), timeout=timeout,
+                                       locator=field_locator)
             actual_placeholder = element.get_attribute("placeholder")
             assert actual_placeholder == expected_placeholder, f"Expected placeholder '{expected_placeholder}', but got '{actual_placeholder}'."
-            self.logger.info(f"Placeholder for field {field_locator} is correct: '{expected_placeholder}'")
+            self.logger.info("Placeholder for field %s is correct: '%s'", field_locator, expected_placeholder)
         except Exception as e:
-            self.logger.error(f"Error occurred while checking placeholder: {str(e)}")
+            self.logger.error("Error occurred while checking placeholder: %s", e)
             raise
 
     def validate_placeholder(self, field_locator, expected_placeholder):
         field_element = self.wait_for_element(field_locator)
         actual_placeholder = field_element.get_attribute("placeholder")
-        self.logger.info(f"Placeholder for {field_locator}: '{actual_placeholder}'")
+        self.logger.info("Placeholder for %s: '%s'", field_locator, actual_placeholder)
 
         assert actual_placeholder == expected_placeholder, \
             f"Expected placeholder for field '{field_locator}' to be '{expected_placeholder}', but found '{actual_placeholder}'"
-        self.logger.info(f"Placeholder for field '{field_locator}' is correct: '{actual_placeholder}'")
+        self.logger.info("Placeholder for field '%s' is correct: '%s'", field_locator, actual_placeholder)
 
+    @record_latency()
     def select_dropdown_option(self, dropdown_locator, option_text: str):
         try:
             dropdown_element = self.wait_for_element(dropdown_locator[0], dropdown_locator[1])
-            WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(dropdown_element))
+            self.wait_until(EC.element_to_be_clickable(dropdown_element))
 
             select = Select(dropdown_element)
 
             available_options = [option.text for option in select.options]
-            self.logger.info(f"Available options in dropdown {dropdown_locator}: {available_options}")
+            self.logger.info("Available options in dropdown %s: %s", dropdown_locator, available_options)
 
             select.select_by_visible_text(option_text)
-            self.logger.info(f"Selected '{option_text}' from dropdown {dropdown_locator}")
+            self.logger.info("Selected '%s' from dropdown %s", option_text, dropdown_locator)
 
         except Exception as e:
-            self.logger.error(f"Error selecting option '{option_text}' from dropdown {dropdown_locator}: {str(e)}")
+            self.logger.error("Error selecting option '%s' from dropdown %s: %s", option_text, dropdown_locator, e)
             raise
 
     def are_field_errors_displayed(self, error_locators):
         self.logger.info("Checking if error messages are displayed for each field.")
         for error_locator in error_locators:
             if not self.is_element_visible(*error_locator):
-                self.logger.error(f"Error message not displayed for {error_locator}")
+                self.logger.error("Error message not displayed for %s", error_locator)
+                self.capture_evidence(error_locator, f"Error message not displayed: {error_locator[1]}")
                 return False
         return True
 
-    def get_elements(self, locator):
-        elements = self.driver.find_elements(*locator)
-        if not elements:
-            self.logger.error(f"No elements found for locator: {locator}")
-        else:
-            self.logger.info(f"Found {len(elements)} elements for locator: {locator}")
+    @record_latency()
+    def wait_for_elements(self, locator, timeout=None):
+        """Wait for at least one matching element; returns an empty list on timeout."""
+        try:
+            elements = self.wait_until(EC.presence_of_all_elements_located(locator), timeout=timeout, locator=locator)
+            return [self._lazy(locator, element, index) for index, element in enumerate(elements)]
+        except TimeoutException:
+            self.logger.error("No elements found for locator: %s", locator)
+            return []
+
+    def get_elements(self, locator, timeout=None):
+        """Like wait_for_elements, and logs how many were found."""
+        elements = self.wait_for_elements(locator, timeout)
+        if elements:
+            self.logger.info("Found %s elements for locator: %s", len(elements), locator)
         return elements
 
-    def get_element(self, locator, timeout=10):
+    @record_latency()
+    def get_element(self, locator, timeout=None):
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
-            self.logger.info(f"Element found: {locator}")
+            element = self._lazy(locator, self.wait_until(EC.presence_of_element_located(locator),
+                                                          timeout=timeout, locator=locator))
+            self.logger.debug("Element found: %s", locator)
             return element
         except TimeoutException:
-            self.logger.error(f"Timeout waiting for element: {locator}")
+            self.logger.error("Timeout waiting for element: %s", locator)
+            self.capture_evidence(locator, f"Element not present: {locator[1]}")
             raise TimeoutException(f"Timeout waiting for element: {locator}")
 
+    @record_latency()
     def get_text_value(self, locator):
         try:
-            element = WebDriverWait(self.driver, 30).until(
-                EC.visibility_of_element_located(locator),
-            )
+            element = self._lazy(locator, self.wait_until(EC.visibility_of_element_located(locator),
+                                                          WaitPolicy.AJAX, locator=locator))
 
             if element.tag_name in ["input", "textarea", "select"]:
                 return element.get_attribute("value")
@@ -173,28 +266,34 @@ class BasePage:
                 return element.text.strip()
 
         except TimeoutException:
-            self.logger.error(f"Timeout while waiting for element with locator {locator}")
+            self.logger.error("Timeout while waiting for element with locator %s", locator)
             raise
 
     def get_selected_option(self, dropdown_locator):
         dropdown = self.find_element(dropdown_locator)
         return Select(dropdown).first_selected_option.text
 
-    def find_element(self, locator, timeout=20):
+    @record_latency()
+    def find_element(self, locator, timeout=None):
         try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator),
-            )
+            return self._lazy(locator, self.wait_until(EC.visibility_of_element_located(locator),
+                                                       WaitPolicy.AJAX, timeout, locator=locator))
         except TimeoutException:
-            self.logger.error(f"Element with locator {locator} not found within {timeout} seconds.")
+            timeout = WaitPolicy.resolve(WaitPolicy.AJAX, timeout, locator)
+            self.logger.error("Element with locator %s not found within %s seconds.", locator, timeout)
+            self.capture_evidence(locator, f"Element not visible: {locator[1]}")
             raise TimeoutException(f"Element with locator {locator} not found within {timeout} seconds.")
 
-    def get_element_text(self, locator, timeout=10):
+    @record_latency()
+    def get_element_text(self, locator, timeout=None):
         try:
-            element = WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(locator))
+            element = self._lazy(locator, self.wait_until(EC.visibility_of_element_located(locator),
+                                                          timeout=timeout, locator=locator))
             text = element.text
-            self.logger.info(f"Extracted text: '{text}' from element: {locator}")
+            self.logger.info("Extracted text: '%s' from element: %s", text, locator)
             return text
         except TimeoutException:
-            self.logger.error(f"Element with locator {locator} not found within {timeout} seconds.")
+            timeout = WaitPolicy.resolve(WaitPolicy.ELEMENT, timeout, locator)
+            self.logger.error("Element with locator %s not found within %s seconds.", locator, timeout)
+            self.capture_evidence(locator, f"Element not visible: {locator[1]}")
             raise TimeoutException(f"Element with locator {locator} not found within {timeout} seconds.")
@@ -2,7 +2,7 @@ from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
+from utils.wait_policy import WaitPolicy
 from pages.checkout.checkout_page import CheckoutPage
 
 
@@ -31,9 +31,12 @@ class BillingAddressSection(BasePage):
         billing_data = load_test_data["checkout_fields"]["mandatory_billing_address_section"]
 
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(self.COUNTRY_DROPDOWN) and
-                EC.element_to_be_clickable(self.STATE_DROPDOWN)
+            self.wait_until(
+                EC.all_of(
+                    EC.element_to_be_clickable(self.COUNTRY_DROPDOWN),
+                    EC.element_to_be_clickable(self.STATE_DROPDOWN)
+                ),
+                WaitPolicy.AJAX
             )
 
             self._select_dropdown(self.COUNTRY_DROPDOWN, billing_data["country_dropdown"])
@@ -46,16 +49,19 @@ class BillingAddressSection(BasePage):
             self.click(self.CONTINUE_BUTTON)
 
         except Exception as e:
-            self.logger.error(f"Failed to enter mandatory billing address: {str(e)}")
+            self.logger.error("Failed to enter mandatory billing address: %s", e)
             raise
 
     def enter_all_billing_address(self, load_test_data):
         all_billing_data = load_test_data["checkout_fields"]["all_billing_address_section"]
 
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(self.COUNTRY_DROPDOWN) and
-                EC.element_to_be_clickable(self.STATE_DROPDOWN)
+            self.wait_until(
+                EC.all_of(
+                    EC.element_to_be_clickable(self.COUNTRY_DROPDOWN),
+                    EC.element_to_be_clickable(self.STATE_DROPDOWN)
+                ),
+                WaitPolicy.AJAX
             )
 
             self._fill_billing_field(self.COMPANY_FIELD, all_billing_data["company"])
@@ -71,16 +77,19 @@ class BillingAddressSection(BasePage):
             self.click(self.CONTINUE_BUTTON)
 
         except Exception as e:
-            self.logger.error(f"Failed to enter mandatory billing address: {str(e)}")
+            self.logger.error("Failed to enter mandatory billing address: %s", e)
             raise
 
     def enter_full_billing_address(self, load_test_data):
         full_billing_data = load_test_data["checkout_fields"]["full_billing_address_section"]
 
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(self.COUNTRY_DROPDOWN) and
-                EC.element_to_be_clickable(self.STATE_DROPDOWN)
+            self.wait_until(
+                EC.all_of(
+                    EC.element_to_be_clickable(self.COUNTRY_DROPDOWN),
+                    EC.element_to_be_clickable(self.STATE_DROPDOWN)
+                ),
+                WaitPolicy.AJAX
             )
 
             self._fill_billing_field(self.FIRST_NAME_FIELD, full_billing_data["first_name"])
@@ -99,16 +108,16 @@ class BillingAddressSection(BasePage):
             self.click(self.CONTINUE_BUTTON)
 
         except Exception as e:
-            self.logger.error(f"Failed to enter mandatory billing address: {str(e)}")
+            self.logger.error("Failed to enter mandatory billing address: %s", e)
             raise
 
     def unselect_ship_to_same_address(self):
-        checkbox = self.driver.find_element(*self.SAME_ADDRESS_CHECKBOX)
+        checkbox = self.get_element(self.SAME_ADDRESS_CHECKBOX)
         if checkbox.is_selected():
             checkbox.click()
 
     def _select_dropdown(self, dropdown_locator, value):
-        select = Select(self.driver.find_element(*dropdown_locator))
+        select = Select(self.wait_for_element(*dropdown_locator))
         select.select_by_visible_text(value)
 
     def _fill_billing_field(self, field_locator, value):
@@ -157,14 +166,13 @@ class BillingAddressSection(BasePage):
         self.logger.info("All billing address fields have the correct placeholders.")
 
     def submit_billing_form_without_fields(self):
-        self.driver.find_element(*self.CONTINUE_BUTTON).click()
+        self.find_element(self.CONTINUE_BUTTON).click()
         self.logger.info("Submitted the billing form without filling in any fields.")
 
         try:
-            WebDriverWait(self.driver, 10).until(EC.alert_is_present())
-            alert = self.driver.switch_to.alert
+            alert = self.wait_until(EC.alert_is_present(), WaitPolicy.AJAX)
             alert_text = alert.text.strip()
-            self.logger.info(f"Alert text: {alert_text}")
+            self.logger.info("Alert text: %s", alert_text)
 
             expected_message_1 = "City is required, Street address is required, Phone is required, Zip / postal code is required, State / province is required."
             expected_message_2 = "City is required, Email is required., Street address is required, Last name is required., First name is required., Phone is required, Zip / postal code is required, State / province is required."
@@ -176,7 +184,7 @@ class BillingAddressSection(BasePage):
             self.logger.info("Alert accepted.")
 
         except Exception as e:
-            self.logger.error(f"Failed to handle alert: {e}")
+            self.logger.error("Failed to handle alert: %s", e)
             raise
 
     def checkout_as_signed_in_user_with_new_address(self, driver, load_test_data):
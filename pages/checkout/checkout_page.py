@@ -2,10 +2,10 @@ from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 import time
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
 from pages.checkout.test_data_provider import TestDataProvider
-import logging
 from pages.base_page import BasePage
+from utils.step_timings import timed_step
+from utils.wait_policy import WaitPolicy
 from pages.login_page import LoginPage
 from tests.test_login import TestUserLogin
 from tests.test_registration import TestUserRegistration
@@ -43,13 +43,8 @@ class CheckoutPage(BasePage):
     PASSWORD_FIELD = (By.ID, "Password")
     LOGIN_BUTTON = (By.CLASS_NAME, "button-1.login-button")
 
-    def __init__(self, driver):
-        super().__init__(driver)
-        self.logger = logging.getLogger("CheckoutPage")
-        logging.basicConfig(level=logging.INFO)
-
     def open_url(self, url="https://demo.nopcommerce.com/"):
-        self.driver.get(url)
+        super().open_url(url)
 
     def get_billing_address_section(self):
         from pages.checkout.billing_address_section import BillingAddressSection
@@ -75,18 +70,22 @@ class CheckoutPage(BasePage):
         from pages.checkout.confirm_order_section import ConfirmOrderSection
         return ConfirmOrderSection(self.driver)
 
+    @timed_step()
     def _login_as_user(self, driver, load_test_data):
         login_test = TestUserLogin()
         login_test.test_valid_login(driver, load_test_data)
 
+    @timed_step()
     def _logout_as_user(self, driver):
         login_page = LoginPage(driver)
         login_page.logout_user()
 
+    @timed_step()
     def _login_as_new_user(self, driver, load_test_data):
         login_page = LoginPage(driver)
         login_page.login_user_without_register(load_test_data)
 
+    @timed_step()
     def _register_as_user(self, driver, load_test_data):
         registration_test = TestUserRegistration()
         registration_test.test_mandatory_fields_registration(driver, load_test_data)
@@ -98,22 +97,27 @@ class CheckoutPage(BasePage):
         login_test = TestUserLogin()
         login_test.test_valid_login(driver, load_test_data)
 
+    @timed_step()
     def _search_and_add_product(self, driver, load_test_data):
         search_test = TestUserSearch()
         search_test.test_valid_product(driver, load_test_data)
         self.add_product_to_cart()
 
+    @timed_step()
     def _fill_billing_and_shipping_details(self, driver, load_test_data):
         self.verify_billing_details_match(driver, load_test_data, fill_full_address=True)
 
+    @timed_step()
     def _select_shipping_method(self, method):
         shipping_method_section = self.get_shipping_method_section()
         shipping_method_section.select_shipping_method(method)
 
+    @timed_step()
     def _select_payment_method(self, method):
         payment_method_section = self.get_payment_method_section()
         payment_method_section.select_payment_method(method)
 
+    @timed_step()
     def _complete_payment_and_order(self):
         payment_information_section = self.get_payment_information_section()
         payment_information_section.click(payment_information_section.CONTINUE_BUTTON)
@@ -122,6 +126,7 @@ class CheckoutPage(BasePage):
         confirm_order.confirm_order()
         confirm_order.complete_order()
 
+    @timed_step()
     def _complete_card_payment_and_order(self, load_test_data):
         payment_information_section = self.get_payment_information_section()
         payment_information_section.fill_payment_information(load_test_data)
@@ -132,22 +137,20 @@ class CheckoutPage(BasePage):
 
     def _validate_placeholder_for_field(self, driver, field_locator, expected_placeholder):
         try:
-            field = WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located(field_locator)
-            )
+            field = WaitPolicy.until(driver, EC.presence_of_element_located(field_locator), WaitPolicy.AJAX)
             if field:
                 actual_placeholder = field.get_attribute("placeholder")
                 if not actual_placeholder:
-                    self.logger.warning(f"No placeholder found for field '{field_locator}'. Skipping validation.")
+                    self.logger.warning("No placeholder found for field '%s'. Skipping validation.", field_locator)
                     return
                 assert actual_placeholder == expected_placeholder, \
                     f"Placeholder mismatch! Expected: '{expected_placeholder}', but got: '{actual_placeholder}'"
-                self.logger.info(f"Placeholder for field '{field_locator}' is correct.")
+                self.logger.info("Placeholder for field '%s' is correct.", field_locator)
             else:
-                self.logger.error(f"Element '{field_locator}' not found on the page.")
+                self.logger.error("Element '%s' not found on the page.", field_locator)
                 raise ValueError(f"Element '{field_locator}' is missing.")
         except Exception as e:
-            self.logger.error(f"Error during placeholder validation for '{field_locator}': {str(e)}")
+            self.logger.error("Error during placeholder validation for '%s': %s", field_locator, e)
             raise
 
     def verify_empty_cart(self):
@@ -166,6 +169,7 @@ class CheckoutPage(BasePage):
         self.click(self.AGREE_TERMS_CHECKBOX)
         self.click(self.CHECKOUT_BUTTON)
 
+    @timed_step()
     def continue_to_checkout(self):
         self.click(self.REGISTER_CONTINUE_BUTTON)
         self.click(self.SHOPPING_CART_BUTTON)
@@ -173,12 +177,8 @@ class CheckoutPage(BasePage):
         self.click(self.CHECKOUT_BUTTON)
 
     def hover_cart_button(self):
-        shopping_cart_button = WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.SHOPPING_CART_BUTTON)
-        )
-        cart_hover_button = WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.CART_HOVER_BUTTON)
-        )
+        shopping_cart_button = self.wait_until(EC.visibility_of_element_located(self.SHOPPING_CART_BUTTON))
+        cart_hover_button = self.wait_until(EC.visibility_of_element_located(self.CART_HOVER_BUTTON))
 
         actions = ActionChains(self.driver)
         actions.move_to_element(shopping_cart_button).perform()
@@ -188,9 +188,11 @@ class CheckoutPage(BasePage):
 
         actions.move_to_element(cart_hover_button).click().perform()
 
+    @timed_step()
     def proceed_as_guest(self):
         self.click(self.CHECKOUT_AS_GUEST_BUTTON)
 
+    @timed_step()
     def proceed_to_register(self):
         self.click(self.REGISTER_BUTTON)
 
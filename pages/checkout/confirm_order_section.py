@@ -67,7 +67,7 @@ class ConfirmOrderSection(BasePage):
                 "phone_number": self.get_text_value(self.BILLING_PHONE).replace("Phone:", "").strip(),
             }
         except Exception as e:
-            self.logger.error(f"Error extracting confirm order details: {str(e)}")
+            self.logger.error("Error extracting confirm order details: %s", e)
             raise
 
     def complete_order(self):
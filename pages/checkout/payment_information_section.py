@@ -2,7 +2,7 @@ from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
+from utils.wait_policy import WaitPolicy
 from .billing_address_section import BillingAddressSection
 from ..checkout.checkout_page import CheckoutPage
 
@@ -22,10 +22,13 @@ class PaymentInformationSection(BasePage):
         payment_data = load_test_data["payment_with_card"]
 
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(self.CARD_TYPE_DROPDOWN) and
-                EC.element_to_be_clickable(self.EXPIRY_DATE_MONTH_DROPDOWN) and
-                EC.element_to_be_clickable(self.EXPIRY_DATE_YEAR_DROPDOWN)
+            self.wait_until(
+                EC.all_of(
+                    EC.element_to_be_clickable(self.CARD_TYPE_DROPDOWN),
+                    EC.element_to_be_clickable(self.EXPIRY_DATE_MONTH_DROPDOWN),
+                    EC.element_to_be_clickable(self.EXPIRY_DATE_YEAR_DROPDOWN)
+                ),
+                WaitPolicy.AJAX
             )
 
             self._select_dropdown(self.CARD_TYPE_DROPDOWN, payment_data["card_type"])
@@ -38,11 +41,11 @@ class PaymentInformationSection(BasePage):
             self.click(self.CONTINUE_BUTTON)
 
         except Exception as e:
-            self.logger.error(f"Failed to enter payment information: {str(e)}")
+            self.logger.error("Failed to enter payment information: %s", e)
             raise
 
     def _select_dropdown(self, dropdown_locator, value):
-        select = Select(self.driver.find_element(*dropdown_locator))
+        select = Select(self.wait_for_element(*dropdown_locator))
         select.select_by_visible_text(value)
 
     def _fill_payment_field(self, field_locator, value):
@@ -60,7 +63,7 @@ class PaymentInformationSection(BasePage):
 
         billing_address_section = checkout_page.get_billing_address_section()
         billing_address_details = billing_address_section.get_billing_address_details()
-        self.logger.info(f"Billing Address Details: {billing_address_details}")
+        self.logger.info("Billing Address Details: %s", billing_address_details)
 
         billing_address_section.wait_for_element(BillingAddressSection.SAME_ADDRESS_CHECKBOX)
         billing_address_section.unselect_ship_to_same_address()
@@ -3,7 +3,7 @@ from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
+from utils.wait_policy import WaitPolicy
 
 from pages.checkout.billing_address_section import BillingAddressSection
 from pages.checkout.checkout_page import CheckoutPage
@@ -37,9 +37,12 @@ class ShippingAddressSection(BasePage):
         shipping_data = load_test_data["checkout_fields"]["mandatory_shipping_address_section"]
 
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(self.COUNTRY_DROPDOWN) and
-                EC.element_to_be_clickable(self.STATE_DROPDOWN)
+            self.wait_until(
+                EC.all_of(
+                    EC.element_to_be_clickable(self.COUNTRY_DROPDOWN),
+                    EC.element_to_be_clickable(self.STATE_DROPDOWN)
+                ),
+                WaitPolicy.AJAX
             )
 
             self._select_dropdown(self.COUNTRY_DROPDOWN, shipping_data["country_dropdown"])
@@ -53,7 +56,7 @@ class ShippingAddressSection(BasePage):
             self.click(self.CONTINUE_BUTTON)
 
         except Exception as e:
-            self.logger.error(f"Failed to enter mandatory shipping address: {str(e)}")
+            self.logger.error("Failed to enter mandatory shipping address: %s", e)
             raise
 
     def enter_all_shipping_address(self, load_test_data):
@@ -62,9 +65,12 @@ class ShippingAddressSection(BasePage):
         shipping_data = load_test_data["checkout_fields"]["all_billing_address_section"]
 
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(self.COUNTRY_DROPDOWN) and
-                EC.element_to_be_clickable(self.STATE_DROPDOWN)
+            self.wait_until(
+                EC.all_of(
+                    EC.element_to_be_clickable(self.COUNTRY_DROPDOWN),
+                    EC.element_to_be_clickable(self.STATE_DROPDOWN)
+                ),
+                WaitPolicy.AJAX
             )
 
             self._fill_shipping_field(self.COMPANY_FIELD, shipping_data["company"])
@@ -81,11 +87,11 @@ class ShippingAddressSection(BasePage):
             self.click(self.CONTINUE_BUTTON)
 
         except Exception as e:
-            self.logger.error(f"Failed to enter all shipping address: {str(e)}")
+            self.logger.error("Failed to enter all shipping address: %s", e)
             raise
 
     def _select_dropdown(self, dropdown_locator, value):
-        select = Select(self.driver.find_element(*dropdown_locator))
+        select = Select(self.wait_for_element(*dropdown_locator))
         select.select_by_visible_text(value)
 
     def _fill_shipping_field(self, field_locator, value):
@@ -115,18 +121,18 @@ class ShippingAddressSection(BasePage):
         }
 
         for field_locator, expected_placeholder in expected_placeholders.items():
-            self.logger.info(f"Validating placeholder for field: {field_locator}")
+            self.logger.info("Validating placeholder for field: %s", field_locator)
             checkout_page._validate_placeholder_for_field(driver, field_locator, expected_placeholder)
 
         self.logger.info("All Shipping address fields have the correct placeholders.")
 
     def submit_shipping_form_without_fields(self):
         self._select_dropdown(self.SHIPPING_ADDRESS_DROPDOWN, "New Address")
-        self.driver.find_element(*self.CONTINUE_BUTTON).click()
+        self.find_element(self.CONTINUE_BUTTON).click()
         self.logger.info("Clicked Continue button without filling shipping form.")
 
         try:
-            alert = WebDriverWait(self.driver, 5).until(EC.alert_is_present())
+            alert = self.wait_until(EC.alert_is_present(), WaitPolicy.AJAX)
             alert_text = alert.text.strip()
             expected_message = (
                 "City is required, Street address is required, Phone is required, "
@@ -150,7 +156,7 @@ class ShippingAddressSection(BasePage):
 
         billing_address_section = checkout_page.get_billing_address_section()
         billing_address_details = billing_address_section.get_billing_address_details()
-        self.logger.info(f"Billing Address Details: {billing_address_details}")
+        self.logger.info("Billing Address Details: %s", billing_address_details)
 
         billing_address_section.wait_for_element(BillingAddressSection.SAME_ADDRESS_CHECKBOX)
         billing_address_section.unselect_ship_to_same_address()
@@ -182,7 +188,7 @@ class ShippingAddressSection(BasePage):
 
         billing_address_section = checkout_page.get_billing_address_section()
         billing_address_details = billing_address_section.get_billing_address_details()
-        self.logger.info(f"Billing Address Details: {billing_address_details}")
+        self.logger.info("Billing Address Details: %s", billing_address_details)
 
         billing_address_section.wait_for_element(BillingAddressSection.SAME_ADDRESS_CHECKBOX)
         billing_address_section.unselect_ship_to_same_address()
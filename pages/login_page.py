@@ -3,12 +3,11 @@ import os
 import pyperclip
 from selenium.webdriver import ActionChains, Keys
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from tests.test_registration import TestUserRegistration
 from utils.driver_factory import DriverFactory
-import logging
 from pages.base_page import BasePage
+from utils.wait_policy import WaitPolicy
 
 
 class LoginPage(BasePage):
@@ -38,14 +37,9 @@ class LoginPage(BasePage):
     PASSWORD_CHANGE_POPUP = (By.CLASS_NAME, "close")
     LOGIN_FORM_FIELDS = (By.XPATH, "//div[@class='form-fields']")
 
-    def __init__(self, driver):
-        super().__init__(driver)
-        self.logger = logging.getLogger("LoginPage")
-        logging.basicConfig(level=logging.INFO)
-
     # --- Page Actions ---
     def open_url(self, url="https://demo.nopcommerce.com/login?returnUrl=%2F"):
-        self.driver.get(url)
+        super().open_url(url)
 
     def click_submit_login(self):
         self.click(self.SUBMIT_LOGIN_BUTTON)
@@ -128,7 +122,7 @@ class LoginPage(BasePage):
         current_type = password_field.get_attribute("type")
         new_type = "text" if current_type == "password" else "password"
         self.driver.execute_script("arguments[0].setAttribute('type', arguments[1]);", password_field, new_type)
-        self.logger.info(f"Toggled password visibility to: {new_type}")
+        self.logger.info("Toggled password visibility to: %s", new_type)
 
 
 
@@ -138,7 +132,7 @@ class LoginPage(BasePage):
 
         test_data = load_test_data['mandatory_fields']
 
-        if self.is_element_visible(By.XPATH, self.LOGOUT_BUTTON[1]):
+        if self.is_present_now(*self.LOGOUT_BUTTON):
             self.click_logout()
 
         self.click(self.LOGIN_BUTTON)
@@ -162,9 +156,7 @@ class LoginPage(BasePage):
         self.logger.info("Login successful.")
 
     def logout_user(self):
-        locator_strategy, locator_value = self.LOGOUT_BUTTON
-
-        if self.is_element_visible(locator_strategy, locator_value):
+        if self.is_present_now(*self.LOGOUT_BUTTON):
             self.click_logout()
             self.logger.info("Logged out successfully.")
         else:
@@ -192,7 +184,7 @@ class LoginPage(BasePage):
 
         invalid_email_data = {"username": "invalidemail@example.com"}
 
-        if self.is_element_visible(By.XPATH, self.LOGOUT_BUTTON[1]):
+        if self.is_present_now(*self.LOGOUT_BUTTON):
             self.click_logout()
 
         self.click(self.LOGIN_BUTTON)
@@ -213,7 +205,7 @@ class LoginPage(BasePage):
 
         invalid_password_data = {"password": "InvalidPassword123!"}
 
-        if self.is_element_visible(By.XPATH, self.LOGOUT_BUTTON[1]):
+        if self.is_present_now(*self.LOGOUT_BUTTON):
             self.click_logout()
 
         self.click(self.LOGIN_BUTTON)
@@ -230,7 +222,7 @@ class LoginPage(BasePage):
         registration_test = TestUserRegistration()
         registration_test.test_mandatory_fields_registration(driver, load_test_data)
 
-        if self.is_element_visible(By.XPATH, self.LOGOUT_BUTTON[1]):
+        if self.is_present_now(*self.LOGOUT_BUTTON):
             self.click_logout()
 
         self.click(self.LOGIN_BUTTON)
@@ -249,7 +241,7 @@ class LoginPage(BasePage):
 
         test_data = load_test_data['mandatory_fields']
 
-        if self.is_element_visible(By.XPATH, self.LOGOUT_BUTTON[1]):
+        if self.is_present_now(*self.LOGOUT_BUTTON):
             self.click_logout()
 
         self.click(self.LOGIN_BUTTON)
@@ -297,7 +289,7 @@ class LoginPage(BasePage):
         }
 
         for field_locator, expected_placeholder in expected_placeholders.items():
-            field = self.wait_for_element(field_locator, timeout=10)
+            field = self.wait_for_element(field_locator)
             if field:
                 self.wait_for_placeholder(driver, field_locator, expected_placeholder)
             else:
@@ -371,13 +363,12 @@ class LoginPage(BasePage):
         self.enter_text(self.CONFIRM_PASSWORD_FIELD, new_password)
         self.click(self.CHANGE_PASSWORD_BUTTON)
 
-        WebDriverWait(driver, 10).until(EC.visibility_of_element_located(self.PASSWORD_CHANGE_POPUP))
-        popup_element = driver.find_element(*self.PASSWORD_CHANGE_POPUP)
+        popup_element = self.wait_until(EC.visibility_of_element_located(self.PASSWORD_CHANGE_POPUP), WaitPolicy.AJAX)
         popup_element.click()
-        WebDriverWait(driver, 10).until_not(EC.visibility_of_element_located(self.PASSWORD_CHANGE_POPUP))
+        self.wait_until_absent(*self.PASSWORD_CHANGE_POPUP)
 
-        if self.is_element_visible(self.LOGOUT_BUTTON[0], self.LOGOUT_BUTTON[1]):
-            WebDriverWait(driver, 10).until(EC.element_to_be_clickable((self.LOGOUT_BUTTON[0], self.LOGOUT_BUTTON[1])))
+        if self.is_present_now(*self.LOGOUT_BUTTON):
+            self.wait_until(EC.element_to_be_clickable(self.LOGOUT_BUTTON))
             self.click(self.LOGOUT_BUTTON)
 
         # Login with old password, which should fail
@@ -451,8 +442,11 @@ class LoginPage(BasePage):
         self.load_cookies(driver, 'cookies.json')
         driver.refresh()
 
-        # To fix: Wait for the popup to be visible and clickable, if it's present
-        if self.wait_for_element_to_be_visible(self.POPUP_BAR_NOTIFICATION):
+        # The account link appears once the reloaded page has rendered with the restored session.
+        logged_in = login_page.is_element_visible(*self.MY_ACCOUNT_LINK)
+
+        # The page has finished loading by now, so a single look tells whether the popup is there.
+        if login_page.is_present_now(*self.POPUP_BAR_NOTIFICATION):
             self.logger.info("Popup displayed after reopening the browser.")
             close_button = driver.find_element(*self.POPUP_BAR_NOTIFICATION).find_element(By.CSS_SELECTOR, "span.close")
             close_button.click()
@@ -460,10 +454,10 @@ class LoginPage(BasePage):
             self.logger.info("No popup displayed after reopening the browser.")
 
         # Verify session persistence
-        if self.wait_for_element_to_be_visible(self.MY_ACCOUNT_LINK):
+        if logged_in:
             self.logger.info("Login successful after reopening the browser.")
         else:
-            assert self.is_element_visible(*self.ERROR_MESSAGE), \
+            assert login_page.is_element_visible(*self.ERROR_MESSAGE), \
                 "Session was not maintained after reopening the browser."
 
         self.logger.info("Session persisted after reopening the browser.")
@@ -472,7 +466,7 @@ class LoginPage(BasePage):
         try:
             os.remove('cookies.json')
         except OSError as e:
-            self.logger.error(f"Failed to delete cookies file: {e}")
+            self.logger.error("Failed to delete cookies file: %s", e)
 
     def ui_of_login_page(self):
         self.open_url()
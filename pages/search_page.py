@@ -1,9 +1,9 @@
 from selenium.webdriver import Keys
 from selenium.webdriver.common.by import By
-import logging
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
 from pages.base_page import BasePage
+from utils.step_timings import timed_step
+from utils.wait_policy import WaitPolicy
 import time
 
 class SearchPage(BasePage):
@@ -42,22 +42,23 @@ class SearchPage(BasePage):
     COMPARE_PRODUCT_LINK = (By.LINK_TEXT, "Compare products list")
     COMPARE_PRODUCT_ERROR = (By.CLASS_NAME, "no-data")
 
-    def __init__(self, driver):
-        super().__init__(driver)
-        self.logger = logging.getLogger("SearchPage")
-        logging.basicConfig(level=logging.INFO)
-
     def open_url(self, url="https://demo.nopcommerce.com/"):
-        self.driver.get(url)
+        super().open_url(url)
+
+    @timed_step()
+    def _open_home_page(self):
+        self.open_url()
 
     # Search and Validation
+    @timed_step()
     def _search_for_product(self, search_data):
         self.enter_text(self.SEARCH_FIELD, search_data)
         self.click(self.SEARCH_BUTTON)
-        self.logger.info(f"Searching for product: {search_data}")
+        self.logger.info("Searching for product: %s", search_data)
 
+    @timed_step()
     def _validate_search_results(self, search_data):
-        search_results = self.driver.find_elements(By.CSS_SELECTOR, ".product-item")
+        search_results = self.wait_for_elements(self.PRODUCT_ITEM)
         assert len(search_results) > 0, "No products found in the search results."
         assert any(search_data in result.text for result in search_results), \
             f"The product '{search_data}' is not found in the search results."
@@ -71,11 +72,10 @@ class SearchPage(BasePage):
     def _validate_multiple_products_found(self, locator):
         product_items = self.get_elements(locator)
         assert len(product_items) > 1, "Search results did not return multiple products."
-        self.logger.info(f"Found {len(product_items)} products in search results.")
+        self.logger.info("Found %s products in search results.", len(product_items))
 
     def _validate_product_description(self, search_data_description):
-        self.wait_for_element(self.DESCRIPTION_FIELD)
-        full_description = self.driver.find_element(By.CLASS_NAME, "full-description").text
+        full_description = self.wait_for_element(self.DESCRIPTION_FIELD).text
 
         assert search_data_description in full_description, \
             f"The product description does not contain '{search_data_description}'. Full description found: {full_description}"
@@ -90,19 +90,15 @@ class SearchPage(BasePage):
         self.click(self.ADVANCED_SEARCH_CHECKBOX)
         self.select_dropdown_option(self.CATEGORY_DROPDOWN, category)
         self.click(self.SEARCH_KEYWORD_BUTTON)
-        self.logger.info(f"Search for product '{product}' with category '{category}' executed.")
+        self.logger.info("Search for product '%s' with category '%s' executed.", product, category)
 
     def search_valid_product(self, load_test_data):
         search_data = load_test_data["product_search"]["valid_product"]
-        self.open_url()
+        self._open_home_page()
         self._search_for_product(search_data)
+        self._validate_search_results(search_data)
 
-        search_results = self.driver.find_elements(By.CSS_SELECTOR, ".product-item")
-        assert len(search_results) > 0, "No products found in the search results."
-        assert any(search_data in result.text for result in search_results), \
-            f"The product '{search_data}' is not found in the search results."
-
-        self.logger.info(f"Successfully searched for valid product: {search_data}")
+        self.logger.info("Successfully searched for valid product: %s", search_data)
 
     def search_invalid_product(self, load_test_data):
         test_data = load_test_data["product_search"]["invalid_product"]
@@ -112,7 +108,7 @@ class SearchPage(BasePage):
         assert self.is_element_visible(self.ERROR_MESSAGE[0], self.ERROR_MESSAGE[1]), \
             "Error message for no products found not displayed."
 
-        self.logger.info(f"Attempted to search for invalid product: {test_data}")
+        self.logger.info("Attempted to search for invalid product: %s", test_data)
 
     def empty_search(self):
         self.open_url()
@@ -131,12 +127,12 @@ class SearchPage(BasePage):
         self.open_url()
         self._search_for_product(search_data)
 
-        search_results = self.driver.find_elements(By.CSS_SELECTOR, ".product-item")
+        search_results = self.wait_for_elements(self.PRODUCT_ITEM)
         assert len(search_results) > 1, "Less than two products found in the search results."
         assert any(search_data in result.text for result in search_results), \
             f"The product '{search_data}' is not found in the search results."
 
-        self.logger.info(f"Attempted to search for multiple products: {search_data}")
+        self.logger.info("Attempted to search for multiple products: %s", search_data)
 
     def search_using_search_keyboard_field(self, driver, load_test_data):
         invalid_product = load_test_data["product_search"]["invalid_product"]
@@ -148,7 +144,7 @@ class SearchPage(BasePage):
         self.enter_text(self.SEARCH_KEYWORD_FIELD, valid_product)
         self.click(self.SEARCH_KEYWORD_BUTTON)
 
-        search_results = driver.find_elements(By.CSS_SELECTOR, ".product-item")
+        search_results = self.wait_for_elements(self.PRODUCT_ITEM)
         assert len(search_results) > 0, "No products found in the search results."
         assert any(valid_product in result.text for result in search_results), \
             f"The product '{valid_product}' is not found in the search results."
@@ -160,13 +156,13 @@ class SearchPage(BasePage):
 
         self.open_url()
 
-        search_field = driver.find_element(*SearchPage.SEARCH_FIELD)
+        search_field = self.wait_for_element(*SearchPage.SEARCH_FIELD)
         search_field.send_keys(search_data_valid)
 
         search_field.send_keys(Keys.TAB)
         search_field.send_keys(Keys.ENTER)
 
-        search_results = driver.find_elements(By.CSS_SELECTOR, ".product-item")
+        search_results = self.wait_for_elements(self.PRODUCT_ITEM)
         assert len(search_results) > 0, "No products found in the search results."
 
         assert any(search_data_valid in result.text for result in search_results), \
@@ -177,7 +173,7 @@ class SearchPage(BasePage):
 
     # Product Interaction
     def _click_first_product_in_results(self):
-        search_results = self.driver.find_elements(By.CSS_SELECTOR, ".product-item")
+        search_results = self.wait_for_elements(self.PRODUCT_ITEM)
         assert search_results, "No search results available"
         first_product = search_results[0]
         first_product.find_element(By.CLASS_NAME, "picture").click()
@@ -185,16 +181,16 @@ class SearchPage(BasePage):
 
     def select_first_product(self):
         self.wait_for_element(self.ITEM_GRID)
-        products = self.driver.find_elements(*self.PRODUCT_ITEM)
+        products = self.get_elements(self.PRODUCT_ITEM)
         assert products, "No products found in the item grid."
-        self.logger.info(f"Found {len(products)} product(s) in grid.")
+        self.logger.info("Found %s product(s) in grid.", len(products))
         products[0].find_element(By.CLASS_NAME, "picture").click()
         self.logger.info("Clicked the first product.")
 
     def search_with_description(self, search_text):
         self.enter_text(self.SEARCH_FIELD, search_text)
         self.click(self.SEARCH_BUTTON)
-        self.logger.info(f"Entered search text: {search_text}")
+        self.logger.info("Entered search text: %s", search_text)
 
         self.click(self.ADVANCED_SEARCH_CHECKBOX)
         self.click(self.PRODUCT_DESC_SEARCH_CHECKBOX)
@@ -202,7 +198,7 @@ class SearchPage(BasePage):
         self.logger.info("Enabled advanced search with product description.")
 
     def add_products_to_compare(self):
-        product_items = self.get_elements((By.CLASS_NAME, "product-item"))
+        product_items = self.wait_for_elements(self.PRODUCT_ITEM)
         assert len(product_items) > 1, "Less than two products found for comparison."
 
         product_items[0].find_element(*self.ADD_TO_COMPARE_BUTTON).click()
@@ -212,7 +208,7 @@ class SearchPage(BasePage):
 
     def navigate_to_compare_page(self):
         self.click(self.COMPARE_PRODUCT_LINK)
-        WebDriverWait(self.driver, 10).until(EC.url_contains("compare"))
+        self.wait_until(EC.url_contains("compare"), WaitPolicy.NAVIGATION)
         assert "compare" in self.driver.current_url, "User was not navigated to the Product Compare Page."
 
     def validate_compare_page_display(self):
@@ -230,9 +226,7 @@ class SearchPage(BasePage):
         self.select_dropdown_option(self.SORT_BY_DROPDOWN, option)
         time.sleep(2)
 
-        WebDriverWait(self.driver, 20).until(
-            EC.presence_of_all_elements_located((By.CLASS_NAME, "price"))
-        )
+        self.wait_until(EC.presence_of_all_elements_located((By.CLASS_NAME, "price")), WaitPolicy.AJAX)
 
         product_items = self.get_elements(self.PRODUCT_ITEM)
 
@@ -247,8 +241,8 @@ class SearchPage(BasePage):
             for product in product_items
         ]
 
-        self.logger.info(f"Product Names: {product_names}")
-        self.logger.info(f"Product Prices: {product_prices}")
+        self.logger.info("Product Names: %s", product_names)
+        self.logger.info("Product Prices: %s", product_prices)
 
         if option == "Price: Low to High":
             expected = sorted(product_prices)
@@ -266,7 +260,7 @@ class SearchPage(BasePage):
             self.logger.info("Sorting by 'Created on' is not implemented.")
             return
 
-        self.logger.info(f"Sorting validated successfully for option: {option}")
+        self.logger.info("Sorting validated successfully for option: %s", option)
 
     def search_by_category(self, load_test_data):
         valid_product = load_test_data["product_search"]["valid_product"]
@@ -291,7 +285,7 @@ class SearchPage(BasePage):
         self.click(self.SUB_CATEGORIES_SEARCH_CHECKBOX)
         self.click(self.SEARCH_KEYWORD_BUTTON)
 
-        search_results = self.driver.find_elements(By.CSS_SELECTOR, ".product-item")
+        search_results = self.wait_for_elements(self.PRODUCT_ITEM)
         assert len(search_results) > 0, "No products found when searching with subcategories enabled."
         self.logger.info("Successfully searched with subcategory filter enabled.")
 
@@ -314,11 +308,7 @@ class SearchPage(BasePage):
     def validate_product_display(self, driver, view_mode):
         self.click(view_mode)
 
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_all_elements_located((By.CLASS_NAME, "product-item"))
-        )
-
-        product_items = driver.find_elements(By.CLASS_NAME, "product-item")
+        product_items = self.wait_for_elements((By.CLASS_NAME, "product-item"))
         assert len(product_items) == 1, f"{view_mode} view did not display a single product as expected."
 
         assert self.is_element_visible(*self.ADD_TO_CART_BUTTON), "Add to Cart option missing."
@@ -346,9 +336,9 @@ class SearchPage(BasePage):
         self.enter_text(SearchPage.SEARCH_FIELD, search_multiple_products)
         self.click(SearchPage.SEARCH_BUTTON)
 
-        product_items = driver.find_elements(By.CLASS_NAME, "product-item")
+        product_items = self.wait_for_elements((By.CLASS_NAME, "product-item"))
         assert len(product_items) > 1, "Multiple products not displayed as expected in the search results."
-        self.logger.info(f"Multiple products displayed: {len(product_items)} found.")
+        self.logger.info("Multiple products displayed: %s found.", len(product_items))
 
     def pages_views_products(self, driver, load_test_data):
         search_multiple_products = load_test_data["multiple_products_search"]["multiple_products"]
@@ -363,9 +353,9 @@ class SearchPage(BasePage):
         self.click(self.NEXT_PAGE_BUTTON)
         self.click(self.PREVIOUS_PAGE_BUTTON)
 
-        product_items = driver.find_elements(By.CLASS_NAME, "product-item")
+        product_items = self.wait_for_elements((By.CLASS_NAME, "product-item"))
         assert len(product_items) > 1, "Multiple products not displayed as expected in the search results."
-        self.logger.info(f"Multiple products displayed: {len(product_items)} found.")
+        self.logger.info("Multiple products displayed: %s found.", len(product_items))
 
     def display_number_of_products(self, driver, load_test_data):
         search_criteria = load_test_data["multiple_products_search"]["multiple_products"]
@@ -376,22 +366,19 @@ class SearchPage(BasePage):
         self.click(SearchPage.SEARCH_BUTTON)
 
         # Wait for search results to appear
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_all_elements_located((By.CLASS_NAME, "product-item"))
-        )
-
-        initial_items = [item for item in driver.find_elements(By.CLASS_NAME, "product-item") if item.is_displayed()]
+        initial_items = self.wait_until(EC.visibility_of_all_elements_located((By.CLASS_NAME, "product-item")))
         assert len(initial_items) > 1, "Search did not return multiple products as expected."
 
         for option in display_options:
             self.select_dropdown_option(SearchPage.DISPLAY_DROPDOWN, option)
 
-            WebDriverWait(driver, 10).until(
+            self.wait_until(
                 lambda d: len([e for e in d.find_elements(By.CLASS_NAME, "product-item") if e.is_displayed()]) <= int(
-                    option)
+                    option),
+                WaitPolicy.AJAX
             )
 
-            product_items = [item for item in driver.find_elements(By.CLASS_NAME, "product-item") if
+            product_items = [item for item in self.wait_for_elements((By.CLASS_NAME, "product-item")) if
                              item.is_displayed()]
             assert len(product_items) <= int(
                 option), f"Expected up to {option} products, but found {len(product_items)}."
@@ -411,8 +398,8 @@ class SearchPage(BasePage):
         for page in pages_to_test:
             driver.get(f"{driver.current_url}{page}")
 
-            search_box = driver.find_element(By.ID, "small-searchterms")
-            search_button = driver.find_element(By.XPATH, "//button[@class='button-1 search-box-button']")
+            search_box = self.wait_for_element(self.SEARCH_FIELD)
+            search_button = self.wait_for_element(self.SEARCH_BUTTON)
 
             assert search_box.is_displayed(), f"Search textbox is not displayed on {page}."
             assert search_button.is_displayed(), f"Search button is not displayed on {page}."
@@ -421,28 +408,28 @@ class SearchPage(BasePage):
 
     # Helper Functions
     def _validate_placeholder_for_field(self, driver, field_locator, expected_placeholder):
-        field = self.wait_for_element(field_locator, timeout=10)
+        field = self.wait_for_element(field_locator)
         if field:
             actual_placeholder = field.get_attribute("placeholder")
             assert actual_placeholder == expected_placeholder, \
                 f"Placeholder mismatch! Expected: '{expected_placeholder}', but got: '{actual_placeholder}'"
-            self.logger.info(f"Placeholder for field '{field_locator}' is correct.")
+            self.logger.info("Placeholder for field '%s' is correct.", field_locator)
         else:
-            self.logger.error(f"Field '{field_locator}' not found.")
+            self.logger.error("Field '%s' not found.", field_locator)
 
     def navigate_from_sitemap(self, driver):
         self.open_url()
         self.scroll_to_footer()
 
-        sitemap_link = driver.find_element(By.LINK_TEXT, "Sitemap")
+        sitemap_link = self.wait_for_element(By.LINK_TEXT, "Sitemap")
         sitemap_link.click()
 
-        search_link = driver.find_element(By.LINK_TEXT, "Search")
+        search_link = self.wait_for_element(By.LINK_TEXT, "Search")
         search_link.click()
 
         current_url = driver.current_url
         assert "search" in current_url, f"User was not navigated to the 'Search' page. Current URL: {current_url}"
-        self.logger.info(f"User successfully navigated to the Search page. Current URL: {current_url}")
+        self.logger.info("User successfully navigated to the Search page. Current URL: %s", current_url)
 
     def heading_url_and_title(self, driver, load_test_data):
         search_data_valid = load_test_data["product_search"]["valid_product"]
@@ -452,7 +439,7 @@ class SearchPage(BasePage):
         self.enter_text(SearchPage.SEARCH_FIELD, search_data_valid)
         self.click(SearchPage.SEARCH_BUTTON)
 
-        page_heading = driver.find_element(By.CSS_SELECTOR, ".page-title h1").text
+        page_heading = self.get_element_text((By.CSS_SELECTOR, ".page-title h1"))
         assert page_heading == "Search", f"Expected page heading 'Search', but got '{page_heading}'."
 
         page_url = driver.current_url
@@ -1,38 +1,331 @@
 import allure
 import pytest
+from config.config import Config
+from utils.adaptive_timeouts import AdaptiveTimeouts
+from utils.allure_steps import AllureSteps
+from utils.browser_events import BrowserEventRecorder
 from utils.driver_factory import DriverFactory
+from utils.duration_scheduler import DurationScheduling, TestDurations, TestGroups
+from utils.evidence import Evidence
+from utils.latency_calibration import LatencyCalibration
+from utils.latency_histogram import LatencyHistograms
+from utils.log_buffer import failure_log_path
+from utils.logger import clear_worker_logs, failure_log_buffer, merge_worker_logs, setup_logging, shutdown_logging
+from utils.page_metrics import PageMetrics
+from utils.perf_budgets import PerfBudgets
+from utils.perf_history import PerfHistory
+from utils.screencast import ScreencastRecorder
+from utils.screenshot_pipeline import ScreenshotPipeline
+from utils.step_timings import StepTimings
+from utils.test_profiler import TestProfiler
+from utils.time_breakdown import TimeBreakdown
+from utils.tracing import Tracer, write_report as write_critical_paths
+import logging
 import sys
+import time
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Define the path for screenshots
-SCREENSHOT_DIR = os.path.join(os.path.dirname(__file__), 'screenshots')
+# Pending failure screenshot and clip of the current test, collected once the driver has been torn down
+SCREENSHOT_FUTURE = pytest.StashKey()
+SCREENCAST_FUTURE = pytest.StashKey()
+PERF_REPORT = pytest.StashKey()
+SESSION_STARTED_AT = pytest.StashKey()
+PROFILE_REPORT = pytest.StashKey()
+CRITICAL_PATHS = pytest.StashKey()
+PROFILE_MODE = pytest.StashKey()
+TEST_FAILED = pytest.StashKey()
+ROOT_SPAN = pytest.StashKey()
 
 def pytest_addoption(parser):
     parser.addoption("--browser", action="store", default="chrome", help="Browser to use: chrome or firefox")
     parser.addoption("--headless", action="store_true", help="Run tests in headless mode")
+    parser.addoption("--net-profile", action="store", default=None,
+                     help="Emulate a network profile from Config.NET_PROFILES (Chrome only), e.g. slow3g")
+    parser.addoption("--cpu-throttle", action="store", type=float, default=None,
+                     help="CPU slowdown factor (Chrome only), e.g. 4")
+    parser.addoption("--profile-tests", action="store", nargs="?", const=Config.PROFILE_MODE, default=None,
+                     choices=sorted(TestProfiler.MODES),
+                     help="Profile every test: 'sample' (default) or 'cprofile'; without it only tests marked profile")
+
+UNIT_TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "unit")
+
+
+def _is_unit_test(nodeid):
+    """Unit tests run without a browser and are kept out of the run's timings, traces and history."""
+    return nodeid.startswith("tests/unit/")
+
+
+def _unit_tests_only(config):
+    paths = [os.path.abspath(arg.split("::")[0]) for arg in config.args]
+    return bool(paths) and all(os.path.commonpath([path, UNIT_TESTS_DIR]) == UNIT_TESTS_DIR for path in paths)
+
+
+def _runs_tests(config):
+    """False for invocations that only inspect the suite, such as --collect-only, --help or --fixtures."""
+    option = config.option
+    return not any(getattr(option, name, False) for name in
+                   ("collectonly", "help", "version", "markers", "showfixtures", "show_fixtures_per_test"))
+
+
+def pytest_configure(config):
+    is_worker = hasattr(config, "workerinput")
+    if not is_worker:
+        clear_worker_logs()
+        PageMetrics.clear_results()
+        StepTimings.clear_results()
+        LatencyHistograms.clear_results()
+        TimeBreakdown.clear_results()
+        TestProfiler.clear_results()
+        Tracer.clear_results()
+        TestGroups.clear()
+    setup_logging()
+    if Config.TIME_BREAKDOWN:
+        TimeBreakdown.install_sleep_hook()
+
+    # Calibrate once in the controller before xdist spawns workers, so they inherit the scale.
+    if not is_worker and _runs_tests(config) and not _unit_tests_only(config) and Config.CALIBRATE_TIMEOUTS \
+            and "TIMEOUT_SCALE" not in os.environ:
+        LatencyCalibration.calibrate()
+
+def pytest_xdist_make_scheduler(config, log):
+    if Config.DURATION_SCHEDULING and config.getvalue("dist") == "load":
+        return DurationScheduling(config, log)
+    return None
+
+
+def pytest_collection_modifyitems(config, items):
+    # Marker mistakes are reported here, as usage errors, rather than as INTERNALERRORs while the tests run.
+    try:
+        for item in items:
+            item.stash[PROFILE_MODE] = TestProfiler.mode_for(config.getoption("--profile-tests"),
+                                                             item.get_closest_marker("profile"))
+        TestGroups.sort_items(items)
+    except ValueError as e:
+        raise pytest.UsageError(str(e)) from e
+    # The scheduler runs in the controller, which never sees the items themselves.
+    if hasattr(config, "workerinput") and config.workerinput["workerid"] == "gw0":
+        TestGroups.write(items)
+
+
+def pytest_runtest_logreport(report):
+    # Worker reports are replayed in the controller, so durations are recorded once, there.
+    if Config.WORKER_ID == "main" and not _is_unit_test(report.nodeid):
+        TestDurations.record(report.nodeid, report.duration)
+
 
 @pytest.fixture
 def driver(request):
     browser = request.config.getoption("--browser")
     headless = request.config.getoption("--headless")
 
-    driver = DriverFactory.get_driver(browser, headless)
+    driver = DriverFactory.get_driver(browser, headless, request.config.getoption("--net-profile"),
+                                      request.config.getoption("--cpu-throttle"))
     driver.maximize_window()
     yield driver
-    driver.quit()
+    DriverFactory.quit_driver(driver)
+
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    if _is_unit_test(item.nodeid):
+        yield
+        return
+    if Config.TIME_BREAKDOWN:
+        TimeBreakdown.begin(item.nodeid)
+    profile_mode = item.stash.get(PROFILE_MODE, None)
+    profiler = TestProfiler.start(profile_mode) if profile_mode else None
+    yield
+    if profiler is not None:
+        TestProfiler.finish(profiler, item.nodeid)
+    TimeBreakdown.finish()
+
 
+# Setup and teardown are fixture time as a whole, driver launch and quit included.
+@pytest.hookimpl(wrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    with TimeBreakdown.measure("fixtures"):
+        return (yield)
 
 
-@pytest.hookimpl(tryfirst=True)
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    with TimeBreakdown.measure("fixtures"):
+        return (yield)
+
+
+def pytest_runtest_setup(item):
+    # One trace per attempt, so that a rerun gets its own Allure steps.
+    item.stash[TEST_FAILED] = False
+    if Config.TRACING and not _is_unit_test(item.nodeid):
+        item.stash[ROOT_SPAN] = Tracer.begin(item.nodeid)
+    Evidence.begin(item.name, item.config.getoption("--browser"), getattr(item, "execution_count", 1))
+    log_buffer = failure_log_buffer()
+    if log_buffer is not None:
+        log_buffer.clear()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    # Page metrics are collected before teardown so a strict budget breach fails the test itself.
+    driver = item.funcargs.get("driver")
+    try:
+        result = yield
+    finally:
+        pages = PageMetrics.finish(driver, item.nodeid) if driver is not None else []
+
+    breaches = PerfBudgets.check(pages) if Config.PERF_BUDGETS else []
+    if breaches:
+        descriptions = [PerfBudgets.describe(breach) for breach in breaches]
+        item.user_properties.append(("perf_budget_breaches", descriptions))
+        allure.attach("\n".join(descriptions), name="Performance budget breaches",
+                      attachment_type=allure.attachment_type.TEXT)
+        if item.get_closest_marker("perf_budget_strict"):
+            raise AssertionError("Performance budget exceeded:\n" + "\n".join(descriptions))
+        logging.warning("Performance budget exceeded in %s: %s", item.nodeid, "; ".join(descriptions))
+    return result
+
+
+def _attach_artifact(item, key, name):
+    future = item.stash[key]
+    del item.stash[key]
+    try:
+        artifact = future.result()
+        if artifact is not None:
+            path, mime_type = artifact
+            allure.attach.file(path, name=name, attachment_type=mime_type, extension=os.path.splitext(path)[1][1:])
+    except Exception as e:
+        logging.warning("Could not attach %s for %s: %s", name, item.nodeid, e)
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
 def pytest_runtest_makereport(item, call):
-    if call.excinfo is not None and 'driver' in item.funcargs:
+    # Only grab the bytes here; encoding and writing run on the pipeline thread while the driver quits.
+    if call.excinfo is not None and call.when != "teardown" and 'driver' in item.funcargs:
         driver = item.funcargs['driver']
-        browser = os.getenv('BROWSER', 'unknown')
-        screenshot_filename = f"screenshot_{item.name}_{browser}.png"
-        screenshot_path = os.path.join(SCREENSHOT_DIR, screenshot_filename)
+        browser = item.config.getoption("--browser")
+        attempt = getattr(item, "execution_count", 1)
+        if Config.SCREENSHOT_ON_FAILURE and Config.FULL_PAGE_SCREENSHOT_ON_FAILURE:
+            try:
+                item.stash[SCREENSHOT_FUTURE] = ScreenshotPipeline.submit(
+                    driver.get_screenshot_as_png(), item.name, browser, attempt)
+            except Exception as e:
+                logging.warning("Could not take failure screenshot for %s: %s", item.nodeid, e)
+        recorder = ScreencastRecorder.for_driver(driver)
+        if recorder is not None:
+            item.stash[SCREENCAST_FUTURE] = recorder.submit_clip(item.name, browser, attempt, time.time())
+        browser_events = BrowserEventRecorder.for_driver(driver)
+        if browser_events is not None:
+            try:
+                events_json = browser_events.dump()
+                events_path = os.path.splitext(failure_log_path(item.nodeid, attempt))[0] + "_browser_events.json"
+                os.makedirs(os.path.dirname(events_path), exist_ok=True)
+                with open(events_path, "w") as events_file:
+                    events_file.write(events_json)
+                allure.attach(events_json, name="Browser console and network",
+                              attachment_type=allure.attachment_type.JSON)
+            except Exception as e:
+                logging.warning("Could not save browser events for %s: %s", item.nodeid, e)
+
+    # An exception raised before the yield would surface as an INTERNALERROR, not as the test's failure.
+    if call.when == "teardown":
+        try:
+            Evidence.attach_pending()
+        except Exception as e:
+            logging.warning("Could not attach element evidence for %s: %s", item.nodeid, e)
+        for key, name in ((SCREENSHOT_FUTURE, "Failure Screenshot"), (SCREENCAST_FUTURE, "Failure Screencast")):
+            if key in item.stash:
+                _attach_artifact(item, key, name)
+
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed:
+        item.stash[TEST_FAILED] = True
+    # allure-pytest writes the result in pytest_runtest_logfinish, so the steps go in while it is still open.
+    if call.when == "teardown" and ROOT_SPAN in item.stash:
+        spans = Tracer.finish(item.stash[ROOT_SPAN], passed=not item.stash[TEST_FAILED])
+        del item.stash[ROOT_SPAN]
+        if Config.ALLURE_STEPS:
+            try:
+                AllureSteps.replay(item.config, spans)
+            except Exception as e:
+                logging.warning("Could not add Allure steps for %s: %s", item.nodeid, e)
+    log_buffer = failure_log_buffer()
+    # A failure in any phase is written out; a test that is rerun later still gets its log per attempt.
+    if report.failed and log_buffer is not None:
+        attempt = getattr(item, "execution_count", 1)
+        log_text = log_buffer.flush_to_file(failure_log_path(item.nodeid, attempt))
+        allure.attach(log_text, name=f"Test log (attempt {attempt})", attachment_type=allure.attachment_type.TEXT)
+
+
+def pytest_sessionstart(session):
+    session.config.stash[PERF_REPORT] = None
+    session.config.stash[PROFILE_REPORT] = None
+    session.config.stash[CRITICAL_PATHS] = None
+    session.config.stash[SESSION_STARTED_AT] = time.time()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    ScreenshotPipeline.shutdown()
+    AdaptiveTimeouts.save()
+    LatencyHistograms.dump()
+    StepTimings.dump()
+    TestProfiler.dump()
+    Tracer.flush()
+
+    # Workers have written their page metrics by now; only the controller records the run.
+    config = session.config
+    if not hasattr(config, "workerinput"):
+        LatencyHistograms.merge_and_export()
+        TimeBreakdown.write_report()
+        config.stash[PROFILE_REPORT] = TestProfiler.merge_and_export()
+        config.stash[CRITICAL_PATHS] = write_critical_paths(Config.TRACE_TOP_FLOWS)
+        if not config.option.collectonly:
+            TestDurations.save()
+    if Config.PERF_HISTORY and not hasattr(config, "workerinput") and not config.option.collectonly \
+            and not _unit_tests_only(config):
+        connection = PerfHistory.connect()
+        try:
+            run_id = PerfHistory.record_run(connection, config.stash[SESSION_STARTED_AT])
+            if run_id is not None:
+                config.stash[PERF_REPORT] = PerfHistory.write_report(PerfHistory.compare(connection, run_id))
+        finally:
+            connection.close()
+
+
+def pytest_unconfigure(config):
+    shutdown_logging()
+    # Workers have exited by the time the controller unconfigures, so their files are complete.
+    if not hasattr(config, "workerinput"):
+        merge_worker_logs()
+
+
+def pytest_terminal_summary(terminalreporter):
+    terminalreporter.write_line(LatencyCalibration.summary())
+    perf_report = terminalreporter.config.stash.get(PERF_REPORT, None)
+    if perf_report:
+        terminalreporter.write_line(perf_report)
+    if not hasattr(terminalreporter.config, "workerinput"):
+        step_summary = StepTimings.summary()
+        if step_summary:
+            terminalreporter.write_line(step_summary)
+    profile_report = terminalreporter.config.stash.get(PROFILE_REPORT, None)
+    if profile_report:
+        terminalreporter.write_line(profile_report)
+    critical_paths = terminalreporter.config.stash.get(CRITICAL_PATHS, None)
+    if critical_paths:
+        terminalreporter.section("critical paths")
+        terminalreporter.write_line(critical_paths)
 
-        os.makedirs(SCREENSHOT_DIR, exist_ok=True)
-        driver.save_screenshot(screenshot_path)
-        allure.attach.file(screenshot_path, name="Failure Screenshot", attachment_type=allure.attachment_type.PNG)
+    # user_properties travel with the report, so breaches from xdist workers show up here too.
+    breaches = [(report.nodeid, description)
+                for reports in terminalreporter.stats.values() for report in reports
+                if getattr(report, "when", None) == "call"
+                for name, descriptions in getattr(report, "user_properties", []) if name == "perf_budget_breaches"
+                for description in descriptions]
+    if breaches:
+        terminalreporter.section("performance budget breaches")
+        for nodeid, description in breaches:
+            terminalreporter.write_line(f"{nodeid}: {description}")
@@ -17,6 +17,7 @@ def load_test_data():
 
 @allure.epic("Order Management")
 @allure.feature("Checkout")
+@pytest.mark.precondition("product_in_cart")
 class TestCheckoutPage:
 
     @allure.story("TC_CO_001: Validate navigation to Checkout page with an empty Shopping Cart")
@@ -24,6 +25,7 @@ class TestCheckoutPage:
     @allure.label("Regression")
     @allure.description(
         "This test validates that clicking on 'Checkout' header option navigates the user to an empty 'Shopping Cart' page.")
+    @pytest.mark.precondition("anonymous")
     def test_checkout_navigation_empty_cart(self, driver, load_test_data):
         checkout_page = CheckoutPage(driver)
 
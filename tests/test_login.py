@@ -15,6 +15,7 @@ def load_test_data():
 
 @allure.epic("User Authentication")
 @allure.feature("Login")
+@pytest.mark.precondition("logged_in")
 class TestUserLogin:
 
     @allure.story("TC_RF_001: Validate logging into the Application using valid credentials")
@@ -34,6 +35,7 @@ class TestUserLogin:
     @allure.label("Regression")
     @allure.description(
         "This test verifies that a user cannot log in with invalid credentials and an appropriate error message is displayed.")
+    @pytest.mark.precondition("anonymous")
     def test_invalid_login(self, driver, load_test_data):
         login_page = LoginPage(driver)
 
@@ -49,6 +51,7 @@ class TestUserLogin:
     @allure.label("Regression")
     @allure.description(
         "This test verifies that a user cannot log in with an invalid email and valid password, or valid email and invalid password.")
+    @pytest.mark.precondition("anonymous")
     def test_invalid_email_or_password(self, driver, load_test_data):
         login_page = LoginPage(driver)
 
@@ -67,6 +70,7 @@ class TestUserLogin:
     @allure.label("Regression")
     @allure.description(
         "This test verifies that a user cannot log in without providing any credentials and an appropriate error message is displayed.")
+    @pytest.mark.precondition("anonymous")
     def test_login_without_credentials(self, driver, load_test_data):
         login_page = LoginPage(driver)
 
@@ -84,6 +88,7 @@ class TestUserLogin:
     @allure.label("Regression")
     @allure.description(
         "This test verifies that the 'Forgotten Password' link is visible on the Login page and works correctly, redirecting to the password reset page.")
+    @pytest.mark.precondition("anonymous")
     def test_forgotten_password_link(self, driver):
         login_page = LoginPage(driver)
 
@@ -111,6 +116,7 @@ class TestUserLogin:
     @allure.label("Regression")
     @allure.description(
         "This test verifies that the E-Mail Address and Password text fields on the Login page have the correct placeholder text.")
+    @pytest.mark.precondition("anonymous")
     def test_field_placeholders(self, driver):
         login_page = LoginPage(driver)
 
@@ -226,6 +232,7 @@ class TestUserLogin:
     @allure.label("Regression")
     @allure.description(
         "This test validates that the user can navigate to different pages (Register Account, Sitemap, etc.) from the Login page.")
+    @pytest.mark.precondition("anonymous")
     def test_navigation_from_login_page(self, driver, load_test_data):
         login_page = LoginPage(driver)
 
@@ -237,6 +244,7 @@ class TestUserLogin:
     @allure.severity(Severity.MINOR)
     @allure.label("Regression")
     @allure.description("This test validates the UI elements on the Login page, ensuring that all elements are displayed and aligned properly.")
+    @pytest.mark.precondition("anonymous")
     def test_ui_of_login_page(self, driver):
         login_page = LoginPage(driver)
 
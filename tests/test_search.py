@@ -13,6 +13,7 @@ def load_test_data():
 
 @allure.epic("Product Management")
 @allure.feature("Search")
+@pytest.mark.precondition("anonymous")
 class TestUserSearch:
 
     @allure.story("TC_SF_001: Validate searching with an existing Product Name")
@@ -53,6 +54,7 @@ class TestUserSearch:
     @allure.label("Regression")
     @allure.description(
         "This test validates that searching for an existing product after logging in displays the correct product in the search results.")
+    @pytest.mark.precondition("logged_in")
     def test_search_product_after_login(self, driver, load_test_data):
         login_page = LoginPage(driver)
         login_page.login_user(driver, load_test_data)
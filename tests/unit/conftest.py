@@ -0,0 +1,24 @@
+import pytest
+from config.config import Config
+from utils.adaptive_timeouts import AdaptiveTimeouts
+from utils.latency_histogram import LatencyHistograms
+from utils.step_timings import StepTimings
+from utils.tracing import Tracer
+
+
+@pytest.fixture(autouse=True)
+def isolated_reports(monkeypatch, tmp_path):
+    """Keep unit tests' waits, histograms, spans and report files out of the real run's history."""
+    reports_dir = tmp_path / "reports"
+    monkeypatch.setattr(Config, "REPORTS_DIR", str(reports_dir))
+    monkeypatch.setattr(Config, "PERF_DIR", str(reports_dir / "perf"))
+    monkeypatch.setattr(Config, "PROFILE_DIR", str(reports_dir / "perf" / "profiles"))
+    monkeypatch.setattr(Config, "WAIT_HISTORY_DIR", str(reports_dir / "wait_history"))
+    monkeypatch.setattr(Config, "LOG_DIR", str(reports_dir / "logs"))
+    monkeypatch.setattr(Config, "TEST_DURATIONS_PATH", str(reports_dir / "perf" / "test_durations.json"))
+    monkeypatch.setattr(AdaptiveTimeouts, "_history", {})
+    monkeypatch.setattr(AdaptiveTimeouts, "_recorded", {})
+    monkeypatch.setattr(AdaptiveTimeouts, "_loaded", True)
+    monkeypatch.setattr(LatencyHistograms, "_histograms", {})
+    monkeypatch.setattr(StepTimings, "_pending", [])
+    monkeypatch.setattr(Tracer, "_pending", [])
@@ -0,0 +1,109 @@
+import glob
+import json
+import logging
+import os
+import subprocess
+import sys
+import textwrap
+from pages.base_page import BasePage
+from utils.allure_steps import REDACTED, step_parameters
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def _values(parameters):
+    return {parameter.name: parameter.value for parameter in parameters}
+
+
+def test_skips_self_and_driver_and_keeps_plain_arguments():
+    parameters = _values(step_parameters((("self", "driver", "query"), (object(), object(), "laptop"), {})))
+    assert parameters == {"query": "'laptop'"}
+
+
+def test_redacts_sensitive_parameter_names():
+    parameters = _values(step_parameters((("self", "email", "password"), (None, "a@b.c", "s3cret"), {})))
+    assert parameters == {"email": "'a@b.c'", "password": REDACTED}
+
+
+def test_redacts_keyword_arguments():
+    parameters = _values(step_parameters((("self",), (None,), {"card_number": "4111111111111111"})))
+    assert parameters == {"card_number": REDACTED}
+
+
+def test_redacts_text_typed_into_sensitive_field():
+    parameters = _values(step_parameters((("self", "locator", "text"), (None, ("id", "Password"), "s3cret"), {})))
+    assert parameters["text"] == REDACTED
+    assert parameters["locator"] == "('id', 'Password')"
+
+
+def test_keeps_text_typed_into_other_fields():
+    parameters = _values(step_parameters((("self", "locator", "text"), (None, ("id", "Email"), "a@b.c"), {})))
+    assert parameters["text"] == "'a@b.c'"
+
+
+def test_redacts_sensitive_keys_in_nested_test_data():
+    data = {"login": {"email": "a@b.c", "password": "s3cret"}, "payment": [{"cvv": "123", "name": "A"}]}
+    shown = _values(step_parameters((("self", "load_test_data"), (None, data), {})))["load_test_data"]
+    assert "s3cret" not in shown and "123" not in shown
+    assert "a@b.c" in shown and "'name': 'A'" in shown
+
+
+def test_truncates_long_values():
+    shown = _values(step_parameters((("self", "query"), (None, "x" * 1000), {})))["query"]
+    assert len(shown) < 1000 and shown.endswith("...")
+
+
+def test_steps_are_written_to_the_allure_result(tmp_path):
+    (tmp_path / "conftest.py").write_text("from tests.conftest import *\n")
+    (tmp_path / "test_flow.py").write_text(textwrap.dedent("""
+        from pages.base_page import BasePage
+
+        class FlowPage(BasePage):
+            def __init__(self):
+                pass
+
+            def sign_in(self, email, password):
+                self._submit()
+
+            def _submit(self):
+                pass
+
+        def test_flow():
+            FlowPage().sign_in("a@b.c", "s3cret")
+    """))
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT, REPORTS_DIR=str(tmp_path / "reports"), TIMEOUT_SCALE="1",
+               TRACING="True", ALLURE_STEPS="True", PERF_HISTORY="False")
+    result = subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "-p", "no:rerunfailures",
+                             f"--alluredir={tmp_path / 'allure'}", "test_flow.py"],
+                            cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    [result_path] = glob.glob(str(tmp_path / "allure" / "*-result.json"))
+    with open(result_path) as result_file:
+        [step] = json.load(result_file)["steps"]
+    assert step["name"].startswith("FlowPage.sign_in (")
+    assert step["status"] == "passed" and step["stop"] >= step["start"]
+    assert {"name": "password", "value": REDACTED} in step["parameters"]
+    assert [child["name"].split(" ")[0] for child in step["steps"]] == ["FlowPage._submit"]
+
+
+class TypedField:
+    def __init__(self):
+        self.typed = []
+
+    def clear(self):
+        pass
+
+    def send_keys(self, text):
+        self.typed.append(text)
+
+
+def test_enter_text_does_not_log_text_typed_into_sensitive_field(monkeypatch, caplog):
+    field = TypedField()
+    monkeypatch.setattr(BasePage, "wait_for_element", lambda self, *locator: field)
+    with caplog.at_level(logging.INFO):
+        BasePage(None).enter_text(("id", "CardNumber"), "4111111111111111")
+        BasePage(None).enter_text(("id", "Email"), "a@b.c")
+    assert field.typed == ["4111111111111111", "a@b.c"]
+    assert "4111111111111111" not in caplog.text
+    assert REDACTED in caplog.text and "a@b.c" in caplog.text
@@ -0,0 +1,47 @@
+import pytest
+from utils.duration_scheduler import DurationScheduling, TestDurations, TestGroups
+
+COLLECTION = ["a", "b", "c", "d", "e", "f"]
+GROUPS = {"d": "g", "e": "g"}
+PRECONDITIONS = {"a": "logged_in", "c": "logged_in"}
+
+
+def _plan(monkeypatch, durations):
+    monkeypatch.setattr(TestDurations, "load", staticmethod(lambda: durations))
+    monkeypatch.setattr(TestGroups, "read", classmethod(lambda cls: (GROUPS, PRECONDITIONS)))
+    scheduler = DurationScheduling.__new__(DurationScheduling)
+    scheduler.node2pending = {"gw0": [], "gw1": []}
+    scheduler.pending = []
+    scheduler.log = lambda *args: None
+    scheduler._plan(COLLECTION)
+    return scheduler
+
+
+def test_units_are_queued_longest_first(monkeypatch):
+    # f has no history and is assumed to take the median known duration, 4.
+    scheduler = _plan(monkeypatch, {"a": 1, "b": 10, "c": 5, "d": 3, "e": 4})
+
+    assert scheduler.expected == [1, 10, 5, 3, 4, 4]
+    assert scheduler.batch_limit == pytest.approx(27 / 2 / 2)
+    # b (10), group g: e, d (7), logged_in batch: c, a (6), f (4).
+    assert scheduler.pending == [1, 4, 3, 2, 0, 5]
+    assert scheduler.unit_of[4] == scheduler.unit_of[3] == "group:g"
+    assert scheduler.unit_of[2] == scheduler.unit_of[0]
+    assert scheduler.precondition_of == {0: "logged_in", 1: None, 2: "logged_in", 3: None, 4: None, 5: None}
+
+
+def test_precondition_batches_are_capped(monkeypatch):
+    # c (5) and a (3) together would exceed half a worker's share, 29 / 2 / 2.
+    scheduler = _plan(monkeypatch, {"a": 3, "b": 10, "c": 5, "d": 3, "e": 4})
+
+    assert scheduler.unit_of[2] != scheduler.unit_of[0]
+    assert scheduler.pending == [1, 4, 3, 2, 5, 0]
+
+
+def test_ties_keep_collection_order(monkeypatch):
+    scheduler = _plan(monkeypatch, dict.fromkeys(COLLECTION, 2))
+
+    # Group g (4) first; the rest take 2 each and keep the order they were collected in. The cap (12 / 2 / 2)
+    # leaves room for one logged_in test per batch, so a and c are separate units.
+    assert scheduler.pending == [3, 4, 0, 1, 2, 5]
+    assert scheduler.unit_of[0] != scheduler.unit_of[2]
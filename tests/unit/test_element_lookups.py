@@ -0,0 +1,29 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from pages.base_page import BasePage
+
+PRODUCT_ITEM = (By.CSS_SELECTOR, ".product-item")
+
+
+class RenderingDriver:
+    """A page whose product list renders after a few lookups, as with AJAX results and no implicit wait."""
+
+    _web_element_cls = WebElement
+
+    def __init__(self, empty_lookups):
+        self.empty_lookups = empty_lookups
+        self.lookups = 0
+
+    def find_elements(self, by, value):
+        self.lookups += 1
+        return [] if self.lookups <= self.empty_lookups else [object(), object()]
+
+
+def test_get_elements_waits_for_rendering():
+    driver = RenderingDriver(empty_lookups=2)
+    assert len(BasePage(driver).get_elements(PRODUCT_ITEM)) == 2
+    assert driver.lookups == 3
+
+
+def test_get_elements_returns_empty_list_on_timeout():
+    assert BasePage(RenderingDriver(empty_lookups=10 ** 6)).get_elements(PRODUCT_ITEM, timeout=0.2) == []
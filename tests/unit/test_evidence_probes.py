@@ -0,0 +1,27 @@
+from pages.base_page import PRESENCE_SCRIPT
+from pages.registration_page import RegistrationPage
+from utils.evidence import Evidence
+
+
+class NoErrorsDriver:
+    """A registration form without any field error on it."""
+
+    def __init__(self):
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        return False if script == PRESENCE_SCRIPT else None
+
+    def find_elements(self, *locator):
+        raise AssertionError("evidence was captured for an optional probe")
+
+
+def test_clearing_absent_errors_captures_no_evidence():
+    Evidence.begin("test", "chrome", 1)
+    driver = NoErrorsDriver()
+
+    RegistrationPage(driver).clear_error_messages()
+
+    assert Evidence._local.pending == []
+    assert driver.scripts == [PRESENCE_SCRIPT] * 5
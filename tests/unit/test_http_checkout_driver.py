@@ -0,0 +1,44 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from utils import http_checkout_driver
+from utils.http_checkout_driver import CheckoutError, StressRun
+
+
+class FakeSession:
+    failures = []
+
+    def __init__(self, *args):
+        self.session = self
+
+    def close(self):
+        pass
+
+    def find_product(self):
+        return "1"
+
+    def add_to_cart(self, product_id):
+        pass
+
+    def open_checkout(self):
+        return ""
+
+    def save_billing(self, checkout_page):
+        raise self.failures.pop(0)
+
+
+def test_errors_of_any_type_are_counted_by_failing_step(monkeypatch):
+    FakeSession.failures = [KeyError("update_section"), CheckoutError("checkout/OpcSaveBilling/ rejected the step"),
+                            CheckoutError("Country 'X' not offered")]
+    # The deadline check passes once per failure, then ends the user's loop.
+    clock = iter([0, 0, 0, 2])
+    monkeypatch.setattr(http_checkout_driver, "CheckoutSession", FakeSession)
+    monkeypatch.setattr(http_checkout_driver, "time",
+                        SimpleNamespace(monotonic=lambda: next(clock), perf_counter=time.perf_counter))
+    stress_run = StressRun(users=1, duration=0)
+
+    asyncio.run(stress_run._user(0, {}, deadline=1))
+
+    assert stress_run.errors == {"save_billing (KeyError)": 1, "save_billing (CheckoutError)": 2}
+    assert stress_run.orders == 0
+    assert len(stress_run.latencies["open_checkout"]) == 3
@@ -0,0 +1,43 @@
+import time
+from types import SimpleNamespace
+from config.config import Config
+from utils import latency_calibration
+from utils.latency_calibration import LatencyCalibration
+
+
+class FakeSession:
+    status_codes = []
+
+    def __init__(self):
+        self.statuses = iter(self.status_codes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def _respond(self, *args, **kwargs):
+        status = next(self.statuses)
+        if status >= 500:
+            time.sleep(0.2)
+        return SimpleNamespace(ok=200 <= status < 300, status_code=status, content=b"")
+
+    head = get = _respond
+
+
+def test_error_responses_are_not_timed(monkeypatch):
+    monkeypatch.setattr(latency_calibration.requests, "Session", FakeSession)
+    monkeypatch.setattr(FakeSession, "status_codes", [503, 503, 200, 200])
+    round_trip, page_load = LatencyCalibration.measure("http://shop.test", probes=2)
+    assert round_trip < 0.05 and page_load < 0.05
+
+
+def test_scale_is_kept_when_every_probe_fails(monkeypatch):
+    monkeypatch.setattr(latency_calibration.requests, "Session", FakeSession)
+    monkeypatch.setattr(FakeSession, "status_codes", [503] * 6)
+    monkeypatch.setattr(Config, "CALIBRATION_PROBES", 3)
+    monkeypatch.setattr(Config, "TIMEOUT_SCALE", 1.5)
+    monkeypatch.setattr(LatencyCalibration, "scale", None)
+    assert LatencyCalibration.calibrate() == 1.5
+    assert Config.TIMEOUT_SCALE == 1.5 and LatencyCalibration.scale is None
@@ -0,0 +1,18 @@
+import pytest
+from utils.latency_histogram import SUB_BUCKETS, LatencyHistogram
+
+
+@pytest.mark.parametrize("micros, bucket", [
+    (0, 0), (1, 0), (2, SUB_BUCKETS), (3, SUB_BUCKETS + SUB_BUCKETS // 2),
+    (1024, 10 * SUB_BUCKETS), (1535, 10 * SUB_BUCKETS + 15), (1536, 10 * SUB_BUCKETS + 16),
+])
+def test_bucket_of(micros, bucket):
+    assert LatencyHistogram.bucket_of(micros) == bucket
+
+
+def test_buckets_are_ordered_and_their_midpoints_are_close():
+    values = [1, 7, 31, 100, 999, 1000, 65_537, 1_000_000, 29_999_999]
+    buckets = [LatencyHistogram.bucket_of(value) for value in values]
+    assert buckets == sorted(buckets)
+    for value, bucket in zip(values, buckets):
+        assert abs(LatencyHistogram.bucket_value(bucket) - value) / value <= 1 / SUB_BUCKETS
@@ -0,0 +1,65 @@
+import threading
+import time
+from utils import load_runner
+from utils.load_runner import LoadRunner, format_report
+from utils.step_timings import StepTimings, timed_step
+
+
+class FakeDriver:
+    def delete_all_cookies(self):
+        pass
+
+
+def test_sessions_start_at_different_flows_and_browsers_start_one_at_a_time(monkeypatch):
+    started = []
+    starting = threading.Semaphore(1)
+
+    def get_driver(browser, headless):
+        assert starting.acquire(blocking=False), "two browsers were starting at once"
+        time.sleep(0.02)
+        starting.release()
+        return FakeDriver()
+
+    monkeypatch.setattr(load_runner.DriverFactory, "get_driver", staticmethod(get_driver))
+    monkeypatch.setattr(load_runner.DriverFactory, "quit_driver", staticmethod(lambda driver: None))
+    monkeypatch.setattr(load_runner, "FLOWS", {
+        name: (lambda name: lambda driver, test_data: started.append((threading.current_thread().name, name)))(name)
+        for name in ("search", "guest_checkout")})
+    runner = LoadRunner(["search", "guest_checkout"], sessions=2, duration=60, iterations=2)
+    runner.deadline = time.monotonic() + 60
+
+    threads = [threading.Thread(target=runner._session, args=(index, time.monotonic(), {}), name=f"session-{index}")
+               for index in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert runner.errors == {}
+    assert [name for thread, name in started if thread == "session-0"] == ["search", "guest_checkout"]
+    assert [name for thread, name in started if thread == "session-1"] == ["guest_checkout", "search"]
+
+
+@timed_step()
+def _find_product():
+    raise AssertionError("No products found in the search results.")
+
+
+@timed_step()
+def _search_and_add_product():
+    _find_product()
+
+
+def test_errors_are_counted_by_the_innermost_failing_step(monkeypatch):
+    monkeypatch.setattr(load_runner.DriverFactory, "get_driver", staticmethod(lambda browser, headless: FakeDriver()))
+    monkeypatch.setattr(load_runner.DriverFactory, "quit_driver", staticmethod(lambda driver: None))
+    monkeypatch.setattr(load_runner, "FLOWS", {"guest_checkout": lambda driver, test_data: _search_and_add_product(),
+                                               "search": lambda driver, test_data: driver.missing_page()})
+    runner = LoadRunner(["guest_checkout", "search"], sessions=1, duration=60, iterations=4)
+    runner.deadline = time.monotonic() + 60
+    monkeypatch.setattr(StepTimings, "sinks", [runner._record_step])
+
+    runner._session(0, time.monotonic(), {})
+
+    assert runner.errors == {"guest_checkout/find_product (AssertionError)": 2, "search (AttributeError)": 2}
+    assert "error guest_checkout/find_product (AssertionError): 2" in format_report(runner.report(1))
@@ -0,0 +1,54 @@
+import logging
+import sys
+from utils.log_buffer import RingBufferHandler
+
+
+def _record(msg, *args, exc_info=None):
+    return logging.LogRecord("pages", logging.INFO, __file__, 1, msg, args, exc_info)
+
+
+def _buffer(**limits):
+    handler = RingBufferHandler(**limits)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+def test_plain_records_are_kept_unformatted():
+    handler = _buffer()
+    record = _record("Entering text '%s' into field: %s", "laptop", ("id", "q"))
+    handler.emit(record)
+    assert handler.records[0][0] is record
+
+
+def test_records_with_live_objects_are_frozen():
+    handler = _buffer()
+    element = object()
+    record = _record("Found %s", element)
+    handler.emit(record)
+    kept = handler.records[0][0]
+    assert kept is not record and kept.args is None and kept.msg == f"Found {element}"
+
+
+def test_exceptions_are_kept_as_text(tmp_path):
+    handler = _buffer()
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        handler.emit(_record("Failed", exc_info=sys.exc_info()))
+    assert handler.records[0][0].exc_info is None
+    assert "ValueError: boom" in handler.flush_to_file(str(tmp_path / "log.txt"))
+
+
+def test_oldest_records_are_evicted(tmp_path):
+    handler = _buffer(max_records=2)
+    for index in range(3):
+        handler.emit(_record("step %s", index))
+    assert handler.flush_to_file(str(tmp_path / "log.txt")) == "step 1\nstep 2\n"
+    assert handler.size == 0
+
+
+def test_byte_limit_counts_arguments():
+    handler = _buffer(max_bytes=100)
+    handler.emit(_record("%s", "x" * 60))
+    handler.emit(_record("%s", "y" * 60))
+    assert len(handler.records) == 1 and handler.size == len("%s") + 60
@@ -0,0 +1,52 @@
+import pytest
+from config.config import Config
+from pages.checkout.checkout_page import CheckoutPage
+from pages.search_page import SearchPage
+from utils.page_metrics import COLLECT_SCRIPT, OBSERVER_SCRIPT, PageMetrics
+from utils.perf_budgets import PerfBudgets
+
+STORE = "https://demo.nopcommerce.com"
+
+
+class FakeDriver:
+    """A driver without CDP: only documents the observer script was injected into report metrics."""
+
+    session_id = "fake"
+
+    def __init__(self):
+        self.url = None
+        self.observed = []
+
+    def get(self, url):
+        self.url = url
+
+    def execute_script(self, script, *args):
+        if script == OBSERVER_SCRIPT and self.url not in self.observed:
+            self.observed.append(self.url)
+        if script == COLLECT_SCRIPT:
+            return [{"doc_id": str(index), "url": url, "navigation": {"ttfb": 9000}}
+                    for index, url in enumerate(self.observed)]
+        return None
+
+
+@pytest.mark.parametrize("path, route", [
+    ("/", "home"), ("/search?q=laptop", "search"), ("/cart", "cart"),
+    ("/onepagecheckout", "checkout"), ("/login?returnUrl=%2F", "login"), ("/computers", None),
+])
+def test_route_for(path, route):
+    assert PerfBudgets.route_for(STORE + path) == route
+
+
+@pytest.mark.parametrize("page_class, path, route", [
+    (SearchPage, "/search?q=laptop", "search"), (CheckoutPage, "/cart", "cart"),
+    (CheckoutPage, "/onepagecheckout", "checkout"),
+])
+def test_pages_opened_by_search_and_checkout_are_checked(monkeypatch, tmp_path, page_class, path, route):
+    monkeypatch.setattr(Config, "PAGE_METRICS", True)
+    monkeypatch.setattr(Config, "PERF_DIR", str(tmp_path))
+    driver = FakeDriver()
+
+    page_class(driver).open_url(STORE + path)
+    pages = PageMetrics.finish(driver, "test")
+
+    assert [(breach["route"], breach["metric"]) for breach in PerfBudgets.check(pages)] == [(route, "ttfb_ms")]
@@ -0,0 +1,31 @@
+import pytest
+from selenium.common import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+
+
+class ScriptDriver:
+    """Answers every execute_script with a fixed result, or raises it."""
+
+    def __init__(self, result):
+        self.result = result
+
+    def execute_script(self, script, *args):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_script_errors_are_not_taken_for_absence():
+    page = BasePage(ScriptDriver(JavascriptException("document is not defined")))
+    with pytest.raises(JavascriptException):
+        page.is_present_now(By.ID, "logout")
+
+
+def test_wait_until_absent_returns_when_gone():
+    BasePage(ScriptDriver(False)).wait_until_absent(By.CLASS_NAME, "close", timeout=0.1)
+
+
+def test_wait_until_absent_raises_when_still_displayed():
+    with pytest.raises(TimeoutException, match="still displayed"):
+        BasePage(ScriptDriver(True)).wait_until_absent(By.CLASS_NAME, "close", timeout=0.1)
@@ -0,0 +1,23 @@
+import threading
+from utils.screenshot_pipeline import ScreenshotPipeline
+
+
+def test_shutdown_waits_for_jobs_that_take_the_lock():
+    started = threading.Event()
+    release = threading.Event()
+
+    def job():
+        started.set()
+        release.wait(5)
+        with ScreenshotPipeline._lock:
+            return "stored"
+
+    future = ScreenshotPipeline.run(job)
+    started.wait(5)
+    shutdown = threading.Thread(target=ScreenshotPipeline.shutdown, daemon=True)
+    shutdown.start()
+    release.set()
+    shutdown.join(5)
+
+    assert not shutdown.is_alive()
+    assert future.result(0) == "stored"
@@ -0,0 +1,57 @@
+import math
+from statistics import NormalDist
+import pytest
+from utils.stats import mann_whitney_u, median, percentile, rank
+
+
+def _upper_tail(z):
+    return 1 - NormalDist().cdf(z)
+
+
+def test_rank_averages_ties():
+    assert rank([10, 20, 20, 30]) == [1, 2.5, 2.5, 4]
+
+
+def test_u_for_fully_separated_samples():
+    u, p = mann_whitney_u([4, 5, 6], [1, 2, 3])
+    assert u == 9
+    assert p == pytest.approx(_upper_tail((9 - 4.5 - 0.5) / math.sqrt(9 / 12 * 7)))
+
+
+def test_u_with_ties_uses_the_tie_corrected_variance():
+    # Ranks 1, 3, 3 | 3, 5.5, 5.5; tie term (3^3 - 3) + (2^3 - 2) = 30.
+    u, p = mann_whitney_u([1, 2, 2], [2, 3, 3])
+    assert u == 1
+    assert p == pytest.approx(_upper_tail((1 - 4.5 - 0.5) / math.sqrt(9 / 12 * (7 - 30 / 30))))
+
+
+def test_u_of_identical_samples_has_no_evidence():
+    assert mann_whitney_u([5, 5], [5, 5]) == (2, 1.0)
+
+
+def test_u_for_one_value_per_side():
+    assert mann_whitney_u([2], [1]) == (1, 0.5)
+
+
+def test_u_needs_both_samples():
+    with pytest.raises(ValueError):
+        mann_whitney_u([], [1])
+
+
+@pytest.mark.parametrize("values, expected", [([7], 7), ([3, 1, 2], 2), ([4, 1, 3, 2], 2.5), ([2, 2, 9], 2)])
+def test_median(values, expected):
+    assert median(values) == expected
+
+
+@pytest.mark.parametrize("q, expected", [(0, 1), (50, 5), (90, 9), (91, 10), (100, 10)])
+def test_percentile_is_nearest_rank(q, expected):
+    assert percentile(list(range(10, 0, -1)), q) == expected
+
+
+def test_percentile_of_a_single_value():
+    assert percentile([3.5], 99) == 3.5
+
+
+def test_percentile_needs_values():
+    with pytest.raises(ValueError):
+        percentile([], 50)
@@ -0,0 +1,29 @@
+import os
+from utils.step_timings import StepTimings
+
+
+def test_steps_are_written_once_at_dump():
+    for duration in range(1, 11):
+        StepTimings.record("search", duration, True)
+    assert not os.path.exists(StepTimings.results_path())
+
+    StepTimings.dump()
+    with open(StepTimings.results_path()) as results_file:
+        assert len(results_file.readlines()) == 10
+
+
+def test_long_runs_are_written_in_batches(monkeypatch):
+    monkeypatch.setattr(StepTimings, "BATCH_SIZE", 3)
+    for _ in range(4):
+        StepTimings.record("search", 1.0, True)
+    with open(StepTimings.results_path()) as results_file:
+        assert len(results_file.readlines()) == 3
+    assert len(StepTimings._pending) == 1
+
+
+def test_summary_uses_nearest_rank_p90():
+    for duration in range(1, 11):
+        StepTimings.record("search", duration, True)
+    StepTimings.record("search", 100, False)
+    StepTimings.dump()
+    assert "median 5.50, p90 9.00, max 10.00 (n=10)" in StepTimings.summary()
@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+import textwrap
+import pytest
+from utils.test_profiler import TestProfiler
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def test_unmarked_tests_are_profiled_only_with_the_option():
+    assert TestProfiler.mode_for(None, None) is None
+    assert TestProfiler.mode_for("cprofile", None) == "cprofile"
+
+
+def test_marker_mode_wins_over_the_option():
+    assert TestProfiler.mode_for("sample", pytest.mark.profile("cprofile").mark) == "cprofile"
+    assert TestProfiler.mode_for("cprofile", pytest.mark.profile.mark) == "cprofile"
+
+
+def test_unknown_marker_mode_is_a_usage_error_at_collection(tmp_path):
+    (tmp_path / "conftest.py").write_text("from tests.conftest import *\n")
+    (tmp_path / "test_marked.py").write_text(textwrap.dedent("""
+        import pytest
+
+        @pytest.mark.profile("flame")
+        def test_marked():
+            pass
+    """))
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT, REPORTS_DIR=str(tmp_path / "reports"), TIMEOUT_SCALE="1",
+               PERF_HISTORY="False")
+    result = subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "-p", "no:rerunfailures",
+                             f"--alluredir={tmp_path / 'allure'}", "test_marked.py"],
+                            cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert result.returncode == pytest.ExitCode.USAGE_ERROR, result.stdout + result.stderr
+    assert "Unknown profiling mode: flame" in result.stderr
+    assert "INTERNALERROR" not in result.stdout + result.stderr
@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def test_critical_paths_are_printed_in_the_terminal_summary(tmp_path):
+    (tmp_path / "conftest.py").write_text("from tests.conftest import *\n")
+    (tmp_path / "test_flow.py").write_text(textwrap.dedent("""
+        import time
+        from pages.base_page import BasePage
+
+        class FlowPage(BasePage):
+            def __init__(self):
+                pass
+
+            def checkout(self):
+                self._confirm()
+
+            def _confirm(self):
+                time.sleep(0.01)
+
+        def test_flow():
+            FlowPage().checkout()
+    """))
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT, REPORTS_DIR=str(tmp_path / "reports"), TIMEOUT_SCALE="1",
+               TRACING="True", PERF_HISTORY="False")
+    result = subprocess.run([sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "-p", "no:rerunfailures",
+                             f"--alluredir={tmp_path / 'allure'}", "test_flow.py"],
+                            cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    summary = result.stdout.split("critical paths", 1)[1]
+    assert "FlowPage.checkout: slowest" in summary
+    assert "slowest sub-step FlowPage._confirm" in summary
@@ -0,0 +1,70 @@
+import json
+import os
+import pytest
+from types import SimpleNamespace
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from config.config import Config
+from utils.adaptive_timeouts import AdaptiveTimeouts
+from utils.wait_policy import WaitPolicy
+
+LOCATOR = ("id", "search")
+
+
+def _learn(monkeypatch, seconds):
+    key = AdaptiveTimeouts.key(WaitPolicy.ELEMENT, LOCATOR)
+    monkeypatch.setattr(AdaptiveTimeouts, "_history", {key: [seconds] * Config.ADAPTIVE_MIN_SAMPLES})
+    monkeypatch.setattr(Config, "ADAPTIVE_TIMEOUTS", True)
+
+
+def test_configured_timeout_is_scaled(monkeypatch):
+    monkeypatch.setattr(Config, "TIMEOUT_SCALE", 3)
+    assert WaitPolicy.resolve(WaitPolicy.AJAX) == Config.AJAX_TIMEOUT * 3
+
+
+def test_explicit_timeout_is_not_scaled(monkeypatch):
+    monkeypatch.setattr(Config, "TIMEOUT_SCALE", 3)
+    assert WaitPolicy.resolve(WaitPolicy.ELEMENT, timeout=5, locator=LOCATOR) == 5
+
+
+def test_learned_timeout_is_not_scaled(monkeypatch):
+    monkeypatch.setattr(Config, "TIMEOUT_SCALE", 4)
+    _learn(monkeypatch, 3)
+    assert WaitPolicy.resolve(WaitPolicy.ELEMENT, locator=LOCATOR) == 3 * Config.ADAPTIVE_SAFETY_FACTOR
+
+
+def test_learned_timeout_respects_ceiling_under_scaling(monkeypatch):
+    monkeypatch.setattr(Config, "TIMEOUT_SCALE", 4)
+    _learn(monkeypatch, 100)
+    assert WaitPolicy.resolve(WaitPolicy.ELEMENT, locator=LOCATOR) == Config.ADAPTIVE_TIMEOUT_CEILING
+
+
+def test_learned_timeouts_are_kept_per_base_url(monkeypatch):
+    _learn(monkeypatch, 3)
+    monkeypatch.setattr(Config, "BASE_URL", "https://staging.example.com/")
+    assert WaitPolicy.resolve(WaitPolicy.ELEMENT, locator=LOCATOR) == WaitPolicy.timeout(WaitPolicy.ELEMENT)
+
+
+def test_timed_out_wait_backs_off_to_configured_timeout(monkeypatch):
+    _learn(monkeypatch, 0.5)
+    assert WaitPolicy.resolve(WaitPolicy.ELEMENT, locator=LOCATOR) == Config.ADAPTIVE_MIN_TIMEOUT
+
+    class NeverReady:
+        def find_element(self, *locator):
+            raise NoSuchElementException()
+
+    with pytest.raises(TimeoutException):
+        WaitPolicy.until(NeverReady(), EC.presence_of_element_located(LOCATOR), timeout=0.01, locator=LOCATOR)
+    assert WaitPolicy.resolve(WaitPolicy.ELEMENT, locator=LOCATOR) == WaitPolicy.timeout(WaitPolicy.ELEMENT)
+
+    AdaptiveTimeouts.save()
+    with open(os.path.join(Config.WAIT_HISTORY_DIR, f"{Config.WORKER_ID}.json")) as history_file:
+        assert json.load(history_file) == {AdaptiveTimeouts.key(WaitPolicy.ELEMENT, LOCATOR): [None]}
+
+
+def test_apply_turns_implicit_waits_off():
+    calls = []
+    driver = SimpleNamespace(implicitly_wait=lambda seconds: calls.append(("implicit", seconds)),
+                             set_page_load_timeout=lambda seconds: calls.append(("page_load", seconds)))
+    WaitPolicy.apply(driver)
+    assert calls == [("implicit", 0), ("page_load", WaitPolicy.timeout(WaitPolicy.NAVIGATION))]
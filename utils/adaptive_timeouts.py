@@ -0,0 +1,109 @@
+import glob
+import json
+import math
+import os
+import threading
+from config.config import Config
+from utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+class AdaptiveTimeouts:
+    """Per-locator timeouts derived from how long each wait took in earlier runs.
+
+    Every wait is recorded under the environment (Config.BASE_URL), its action
+    class and locator. Once a locator has enough completed waits its timeout
+    becomes p99 x safety factor, bounded by a floor and a fixed ceiling. A wait
+    that timed out is stored as None: its real duration is unknown, so while one
+    is among the kept samples the configured timeout is used whenever it is the
+    longer of the two. Each xdist worker persists to its own file, so no locking
+    is needed; loading merges all of them.
+    """
+    _history = {}
+    _recorded = {}
+    _loaded = False
+    _lock = threading.Lock()
+
+    @staticmethod
+    def key(action, locator):
+        by, value = locator
+        return f"{Config.BASE_URL.rstrip('/')}|{action}|{by}={value}"
+
+    @classmethod
+    def load(cls):
+        """Read the samples persisted by every worker in earlier runs."""
+        with cls._lock:
+            if cls._loaded:
+                return
+            for path in glob.glob(os.path.join(Config.WAIT_HISTORY_DIR, "*.json")):
+                try:
+                    with open(path, "r") as history_file:
+                        samples = json.load(history_file)
+                except (OSError, ValueError) as e:
+                    logger.error("Skipping unreadable wait history %s: %s", path, e)
+                    continue
+                for key, durations in samples.items():
+                    cls._history.setdefault(key, []).extend(durations)
+            cls._loaded = True
+
+    @classmethod
+    def record(cls, action, locator, seconds):
+        with cls._lock:
+            cls._recorded.setdefault(cls.key(action, locator), []).append(round(seconds, 3))
+
+    @classmethod
+    def record_timeout(cls, action, locator):
+        """Record a wait that gave up; only its lower bound, the timeout, is known."""
+        with cls._lock:
+            cls._recorded.setdefault(cls.key(action, locator), []).append(None)
+
+    @classmethod
+    def timeout(cls, action, locator, default):
+        """Return the learned timeout for a locator, or the default without enough history.
+
+        Timeouts recorded earlier in this run count too, so a locator backs off to
+        the default right after its first timed-out wait.
+        """
+        if not Config.ADAPTIVE_TIMEOUTS:
+            return default
+        cls.load()
+        key = cls.key(action, locator)
+        with cls._lock:
+            samples = cls._history.get(key, []) + cls._recorded.get(key, [])
+        durations = sorted(sample for sample in samples if sample is not None)
+        if len(durations) < Config.ADAPTIVE_MIN_SAMPLES:
+            return default
+
+        p99 = durations[min(len(durations) - 1, math.ceil(0.99 * len(durations)) - 1)]
+        learned = p99 * Config.ADAPTIVE_SAFETY_FACTOR
+        learned = min(max(learned, Config.ADAPTIVE_MIN_TIMEOUT), Config.ADAPTIVE_TIMEOUT_CEILING)
+        if len(durations) < len(samples):
+            return max(learned, default)
+        return learned
+
+    @classmethod
+    def save(cls):
+        """Append this run's samples to the worker's history file, keeping the newest ones."""
+        with cls._lock:
+            if not cls._recorded:
+                return
+            os.makedirs(Config.WAIT_HISTORY_DIR, exist_ok=True)
+            path = os.path.join(Config.WAIT_HISTORY_DIR, f"{Config.WORKER_ID}.json")
+
+            samples = {}
+            if os.path.exists(path):
+                try:
+                    with open(path, "r") as history_file:
+                        samples = json.load(history_file)
+                except (OSError, ValueError) as e:
+                    logger.error("Discarding unreadable wait history %s: %s", path, e)
+
+            for key, durations in cls._recorded.items():
+                samples[key] = (samples.get(key, []) + durations)[-Config.ADAPTIVE_MAX_SAMPLES:]
+
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "w") as history_file:
+                json.dump(samples, history_file)
+            os.replace(temp_path, path)
+            cls._recorded = {}
@@ -0,0 +1,103 @@
+import re
+from allure_commons.model2 import Parameter, Status, StatusDetails, TestStepResult
+from config.config import Config
+from utils.tracing import STATUS_ERROR
+
+REDACTED = "****"
+SENSITIVE = re.compile(Config.ALLURE_REDACT_PATTERN, re.IGNORECASE)
+# Arguments that only repeat what the step name already says.
+SKIPPED_ARGUMENTS = {"self", "cls", "driver"}
+
+
+def _scrub(value):
+    if isinstance(value, dict):
+        return {key: REDACTED if SENSITIVE.search(str(key)) else _scrub(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)) and not _is_locator(value):
+        return type(value)(_scrub(item) for item in value)
+    return value
+
+
+def _is_locator(value):
+    return isinstance(value, tuple) and len(value) == 2 and all(isinstance(part, str) for part in value)
+
+
+def is_sensitive_locator(value):
+    """True for a locator whose value looks like a password, card or token field."""
+    return _is_locator(value) and bool(SENSITIVE.search(value[1]))
+
+
+def step_parameters(arguments):
+    """Allure parameters for a call, with sensitive values redacted.
+
+    A value is redacted when its parameter name looks sensitive, when it sits
+    under a sensitive key of a dict, or when it is text typed into a field
+    whose locator looks sensitive, as in enter_text(PASSWORD_FIELD, password).
+    """
+    names, args, kwargs = arguments
+    values = dict(zip(names, args))
+    values.update(kwargs)
+    sensitive_target = any(is_sensitive_locator(value) for value in values.values())
+
+    parameters = []
+    for name, value in values.items():
+        if name in SKIPPED_ARGUMENTS:
+            continue
+        if SENSITIVE.search(name) or (sensitive_target and isinstance(value, str)):
+            shown = REDACTED
+        else:
+            shown = repr(_scrub(value))
+            if len(shown) > Config.ALLURE_STEP_ARG_LENGTH:
+                shown = shown[:Config.ALLURE_STEP_ARG_LENGTH] + "..."
+        parameters.append(Parameter(name=name, value=shown))
+    return parameters
+
+
+class AllureSteps:
+    """Replays a test's page-object spans as nested Allure steps once the test is over.
+
+    Nothing touches Allure while the test runs; the tracer already has the
+    timings, so the steps are built in one batch at the end with their real
+    start and stop times and land in the Allure timeline like hand-written
+    allure.step blocks.
+    """
+
+    @staticmethod
+    def _reporter(config):
+        listener = config.pluginmanager.get_plugin("allure_listener")
+        return listener.allure_logger if listener is not None else None
+
+    @classmethod
+    def replay(cls, config, spans):
+        """Attach the spans of a finished trace to the running Allure test result; root span excluded."""
+        reporter = cls._reporter(config)
+        test_result = reporter.get_test(None) if reporter is not None else None
+        if test_result is None or not spans:
+            return
+
+        children = {}
+        for span in spans:
+            children.setdefault(span["parent_span_id"], []).append(span)
+        root = next(span for span in spans if not span["parent_span_id"])
+        test_result.steps.extend(cls._steps(root["span_id"], children))
+
+    @classmethod
+    def _steps(cls, parent_id, children):
+        steps = []
+        for span in sorted(children.get(parent_id, []), key=lambda child: child["start"]):
+            duration_ms = (span["end"] - span["start"]) / 1e6
+            failed = span["status"] == STATUS_ERROR
+            if duration_ms < Config.ALLURE_STEP_MIN_MS and not failed:
+                continue
+            if not failed:
+                status = Status.PASSED
+            elif span["error_type"] is not None and issubclass(span["error_type"], AssertionError):
+                status = Status.FAILED
+            else:
+                status = Status.BROKEN
+            steps.append(TestStepResult(
+                name=f"{span['name']} ({duration_ms / 1000:.2f}s)", status=status,
+                statusDetails=StatusDetails(message=span["message"]) if failed else None,
+                parameters=step_parameters(span["arguments"]) if span["arguments"] else [],
+                start=span["start"] // 1_000_000, stop=span["end"] // 1_000_000,
+                steps=cls._steps(span["span_id"], children)))
+        return steps
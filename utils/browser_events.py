@@ -0,0 +1,121 @@
+import json
+import threading
+import time
+from collections import deque
+from config.config import Config
+from utils.cdp_listener import CdpListener
+from utils.logger import setup_logger
+
+logger = setup_logger()
+
+# Resource types whose requests are summarised; images, fonts and stylesheets are left out as noise.
+NETWORK_RESOURCE_TYPES = {"Document", "XHR", "Fetch"}
+
+
+class BrowserEventRecorder:
+    """Keeps a bounded ring of browser console messages and request/response summaries.
+
+    Chrome feeds it through the shared CdpListener (Runtime and Network
+    domains); Firefox, which has no CDP, feeds console messages and
+    JavaScript errors through WebDriver BiDi log events. Nothing is written
+    unless the test fails, when dump() renders the ring as JSON.
+    """
+
+    _bidi_recorders = {}
+
+    def __init__(self):
+        self.events = deque(maxlen=Config.BROWSER_EVENTS_MAX)
+        self.pending_requests = {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def attach(cls, driver):
+        """Subscribe a recorder to the driver's event source; call before the CDP listener starts."""
+        recorder = cls()
+        if driver.caps.get("browserName", "").lower() == "firefox":
+            cls._attach_bidi(driver, recorder)
+            return recorder
+
+        listener = CdpListener.for_driver(driver, create=True)
+        listener.recorders["browser_events"] = recorder
+        listener.subscribe(lambda devtools: devtools.runtime.ConsoleAPICalled, recorder._on_console,
+                           lambda session, devtools: session.execute(devtools.runtime.enable()))
+        listener.subscribe(lambda devtools: devtools.runtime.ExceptionThrown, recorder._on_exception)
+        listener.subscribe(lambda devtools: devtools.network.RequestWillBeSent, recorder._on_request,
+                           lambda session, devtools: session.execute(devtools.network.enable()))
+        listener.subscribe(lambda devtools: devtools.network.ResponseReceived, recorder._on_response)
+        listener.subscribe(lambda devtools: devtools.network.LoadingFailed, recorder._on_loading_failed)
+        return recorder
+
+    @classmethod
+    def for_driver(cls, driver):
+        recorder = cls._bidi_recorders.get(driver.session_id)
+        if recorder is not None:
+            return recorder
+        listener = CdpListener.for_driver(driver)
+        return listener.recorders.get("browser_events") if listener is not None else None
+
+    @classmethod
+    def detach(cls, driver):
+        cls._bidi_recorders.pop(driver.session_id, None)
+
+    @classmethod
+    def _attach_bidi(cls, driver, recorder):
+        try:
+            driver.script.add_console_handler(recorder._on_bidi_console)
+            driver.script.add_error_handler(recorder._on_bidi_error)
+            cls._bidi_recorders[driver.session_id] = recorder
+        except Exception as e:
+            logger.warning("Browser console capture is not available for this session: %s", e)
+
+    def _record(self, kind, **fields):
+        with self.lock:
+            self.events.append({"time": round(time.time(), 3), "kind": kind, **fields})
+
+    async def _on_console(self, session, devtools, event):
+        text = " ".join(str(arg.value if arg.value is not None else arg.description) for arg in event.args)
+        self._record("console", level=event.type_, text=text)
+
+    async def _on_exception(self, session, devtools, event):
+        details = event.exception_details
+        description = details.exception.description if details.exception is not None else None
+        self._record("exception", text=description or details.text, url=details.url, line=details.line_number)
+
+    async def _on_request(self, session, devtools, event):
+        if event.type_ is None or event.type_.value not in NETWORK_RESOURCE_TYPES:
+            return
+        with self.lock:
+            # Requests that never complete must not grow the map without bound.
+            if len(self.pending_requests) >= Config.BROWSER_EVENTS_MAX:
+                self.pending_requests.pop(next(iter(self.pending_requests)))
+            self.pending_requests[event.request_id] = (event.request.method, event.request.url, float(event.timestamp))
+
+    async def _on_response(self, session, devtools, event):
+        with self.lock:
+            request = self.pending_requests.pop(event.request_id, None)
+        if request is None:
+            return
+        method, url, started = request
+        self._record("network", method=method, url=url, status=event.response.status,
+                     type=event.type_.value, duration_ms=round((float(event.timestamp) - started) * 1000, 1))
+
+    async def _on_loading_failed(self, session, devtools, event):
+        with self.lock:
+            request = self.pending_requests.pop(event.request_id, None)
+        if request is None:
+            return
+        method, url, started = request
+        self._record("network", method=method, url=url, status=None, error=event.error_text,
+                     duration_ms=round((float(event.timestamp) - started) * 1000, 1))
+
+    def _on_bidi_console(self, message):
+        self._record("console", level=message.level, text=message.text, url=message.source,
+                     line=message.line_number)
+
+    def _on_bidi_error(self, error):
+        self._record("exception", text=error.message, url=error.source, line=error.line_number)
+
+    def dump(self):
+        """Render the ring as JSON, oldest event first."""
+        with self.lock:
+            return json.dumps(list(self.events), indent=2)
@@ -0,0 +1,96 @@
+import threading
+import trio
+from utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+class CdpListener:
+    """Runs one Chrome DevTools Protocol session per driver on a background thread.
+
+    Recorders register a subscription with subscribe() before start(): the
+    setup coroutine enables what they need (Page.startScreencast, Network.enable,
+    ...), and the handler coroutine is called for every event of the given type.
+    Events are pushed by the browser over the CDP websocket, so nothing polls
+    the driver and the test thread never waits on the listener.
+    """
+
+    _listeners = {}
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.subscriptions = []
+        self.recorders = {}
+        self.thread = None
+        self.ready = threading.Event()
+        self._trio_token = None
+        self._cancel_scope = None
+
+    @classmethod
+    def for_driver(cls, driver, create=False):
+        """Return the listener attached to the driver, optionally creating it."""
+        listener = cls._listeners.get(driver.session_id)
+        if listener is None and create:
+            listener = cls._listeners[driver.session_id] = cls(driver)
+        return listener
+
+    @classmethod
+    def stop_for_driver(cls, driver):
+        listener = cls._listeners.pop(driver.session_id, None)
+        if listener is not None:
+            listener.stop()
+
+    def subscribe(self, event_type, handler, setup=None, buffer_size=64):
+        """Register a subscription.
+
+        event_type is called with the devtools module and returns the event class,
+        because the module is only known once the session is open. handler and
+        setup are coroutines taking (session, devtools[, event]).
+        """
+        self.subscriptions.append((event_type, handler, setup, buffer_size))
+
+    def start(self, timeout=10):
+        if self.thread is not None or not self.subscriptions:
+            return
+        self.thread = threading.Thread(target=trio.run, args=(self._main,), name="cdp-listener", daemon=True)
+        self.thread.start()
+        # Wait until the domains are enabled so the first page load of the test is observed.
+        if not self.ready.wait(timeout):
+            logger.warning("CDP listener did not start within %s seconds.", timeout)
+
+    def stop(self, timeout=5):
+        if self.thread is None:
+            return
+        if self._trio_token is not None:
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._trio_token)
+            except trio.RunFinishedError:
+                pass
+        self.thread.join(timeout)
+        self.thread = None
+
+    async def _main(self):
+        with trio.CancelScope() as self._cancel_scope:
+            self._trio_token = trio.lowlevel.current_trio_token()
+            try:
+                async with self.driver.bidi_connection() as connection:
+                    session, devtools = connection.session, connection.devtools
+                    async with trio.open_nursery() as nursery:
+                        for event_type, handler, setup, buffer_size in self.subscriptions:
+                            receiver = session.listen(event_type(devtools), buffer_size=buffer_size)
+                            nursery.start_soon(self._dispatch, receiver, handler, session, devtools)
+                            if setup is not None:
+                                await setup(session, devtools)
+                        self.ready.set()
+            except Exception as e:
+                logger.warning("CDP listener stopped: %s", e)
+            finally:
+                self.ready.set()
+
+    @staticmethod
+    async def _dispatch(receiver, handler, session, devtools):
+        async for event in receiver:
+            try:
+                await handler(session, devtools, event)
+            except Exception as e:
+                logger.debug("CDP event handler failed for %s: %s", type(event).__name__, e)
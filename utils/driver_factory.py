@@ -3,22 +3,31 @@ from webdriver_manager.firefox import GeckoDriverManager
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.chrome.options import Options
 from config.config import Config
+from utils.browser_events import BrowserEventRecorder
+from utils.cdp_listener import CdpListener
+from utils.page_metrics import PageMetrics
+from utils.screencast import ScreencastRecorder
+from utils.step_timings import StepTimings
+from utils.time_breakdown import TimeBreakdown
+from utils.wait_policy import WaitPolicy
 from selenium import webdriver
 import logging
 import os
 
-logging.basicConfig(level=logging.INFO)
-
 class DriverFactory:
     @staticmethod
-    def get_driver(browser: str, headless: bool):
+    def get_driver(browser: str, headless: bool, net_profile=None, cpu_throttle=None):
         browser = browser.lower()
 
-        logging.info(f"Initializing WebDriver for '{browser}' browser. Headless mode: {headless}")
+        logging.info("Initializing WebDriver for '%s' browser. Headless mode: %s", browser, headless)
 
         if browser == "chrome":
-            return DriverFactory._get_undetected_chrome_driver(headless)
+            driver = DriverFactory._get_undetected_chrome_driver(headless)
+            DriverFactory._apply_throttling(driver, net_profile, cpu_throttle)
+            return driver
         if browser == "firefox":
+            if net_profile or cpu_throttle:
+                logging.warning("Network and CPU throttling need CDP and are ignored for Firefox.")
             return DriverFactory._get_firefox_driver(headless)
 
         raise ValueError(f"Unsupported browser: {browser}")
@@ -34,12 +43,55 @@ class DriverFactory:
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--remote-debugging-port=9222")
 
         driver = uc.Chrome(options=chrome_options, use_subprocess=True)
-        driver.implicitly_wait(Config.IMPLICIT_WAIT)
+        if Config.TIME_BREAKDOWN:
+            TimeBreakdown.instrument_driver(driver)
+        WaitPolicy.apply(driver)
+        PageMetrics.install(driver)
+        DriverFactory._start_cdp_recorders(driver)
         return driver
 
+    @staticmethod
+    def _apply_throttling(driver, net_profile, cpu_throttle):
+        """Emulate a network profile from Config.NET_PROFILES and/or slow the CPU down by a factor."""
+        labels = []
+        if net_profile:
+            if net_profile not in Config.NET_PROFILES:
+                raise ValueError(f"Unknown network profile: {net_profile}. Known: {', '.join(Config.NET_PROFILES)}")
+            conditions = Config.NET_PROFILES[net_profile]
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+                "offline": False,
+                "latency": conditions["latency_ms"],
+                "downloadThroughput": conditions["download_kbps"] * 1000 / 8,
+                "uploadThroughput": conditions["upload_kbps"] * 1000 / 8,
+            })
+            labels.append(net_profile)
+        if cpu_throttle and cpu_throttle > 1:
+            driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": cpu_throttle})
+            labels.append(f"cpu{cpu_throttle:g}x")
+
+        StepTimings.profile = "+".join(labels) or "none"
+        if labels:
+            logging.info("Throttling applied: %s", StepTimings.profile)
+
+    @staticmethod
+    def _start_cdp_recorders(driver):
+        if Config.SCREENCAST_ON_FAILURE:
+            ScreencastRecorder.attach(driver)
+        if Config.BROWSER_EVENTS_ON_FAILURE:
+            BrowserEventRecorder.attach(driver)
+        listener = CdpListener.for_driver(driver)
+        if listener is not None:
+            listener.start()
+
+    @staticmethod
+    def quit_driver(driver):
+        CdpListener.stop_for_driver(driver)
+        BrowserEventRecorder.detach(driver)
+        driver.quit()
+
     @staticmethod
     def _get_firefox_driver(headless):
         firefox_options = webdriver.FirefoxOptions()
@@ -51,8 +103,14 @@ class DriverFactory:
         firefox_options.add_argument("--disable-gpu")
         firefox_options.set_preference("layout.css.devPixelsPerPx", "1.0")
         firefox_options.set_preference("dom.webnotifications.enabled", False)
+        # Firefox has no CDP; console capture goes through WebDriver BiDi instead.
+        firefox_options.enable_bidi = Config.BROWSER_EVENTS_ON_FAILURE
 
         service = FirefoxService(GeckoDriverManager().install())
         driver = webdriver.Firefox(service=service, options=firefox_options)
-        driver.implicitly_wait(Config.IMPLICIT_WAIT)
+        if Config.TIME_BREAKDOWN:
+            TimeBreakdown.instrument_driver(driver)
+        WaitPolicy.apply(driver)
+        if Config.BROWSER_EVENTS_ON_FAILURE:
+            BrowserEventRecorder.attach(driver)
         return driver
\ No newline at end of file
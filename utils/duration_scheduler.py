@@ -0,0 +1,221 @@
+import glob
+import json
+import os
+from xdist.scheduler import LoadScheduling
+from config.config import Config
+from utils.stats import median
+
+
+class TestDurations:
+    """Per-test durations from previous runs, kept as a moving average in Config.TEST_DURATIONS_PATH.
+
+    A test's duration is its setup, call and teardown together, summed over
+    reruns, as reported to the controller.
+    """
+
+    __test__ = False
+    _current = {}
+
+    @staticmethod
+    def load():
+        if not os.path.exists(Config.TEST_DURATIONS_PATH):
+            return {}
+        with open(Config.TEST_DURATIONS_PATH, "r") as durations_file:
+            return json.load(durations_file)
+
+    @classmethod
+    def record(cls, nodeid, seconds):
+        cls._current[nodeid] = cls._current.get(nodeid, 0.0) + seconds
+
+    @classmethod
+    def save(cls):
+        if not cls._current:
+            return
+        durations = cls.load()
+        weight = Config.TEST_DURATIONS_WEIGHT
+        for nodeid, seconds in cls._current.items():
+            previous = durations.get(nodeid)
+            durations[nodeid] = round(seconds if previous is None else weight * seconds + (1 - weight) * previous, 3)
+        os.makedirs(os.path.dirname(Config.TEST_DURATIONS_PATH), exist_ok=True)
+        with open(Config.TEST_DURATIONS_PATH, "w") as durations_file:
+            json.dump(durations, durations_file, indent=2, sort_keys=True)
+
+    @staticmethod
+    def estimate(nodeids, durations):
+        """Expected seconds per test; tests without history are assumed to take the median known duration."""
+        default = median(list(durations.values())) if durations else Config.DEFAULT_TEST_DURATION
+        return {nodeid: durations.get(nodeid, default) for nodeid in nodeids}
+
+
+class TestGroups:
+    """Tests that must, or preferably should, run together on one worker.
+
+    @pytest.mark.xdist_group("name") binds tests to one worker.
+    @pytest.mark.precondition("logged_in") declares the browser state a test
+    starts from; tests sharing a precondition are dealt out in batches and
+    kept on the worker that already ran that state. The controller never
+    collects items, so each worker writes what it collected to a file that
+    the scheduler reads once every worker is done.
+    """
+
+    __test__ = False
+    # Serial runs order tests by precondition, in this order; unmarked tests go first.
+    PRECONDITIONS = ("anonymous", "logged_in", "product_in_cart")
+
+    @staticmethod
+    def path(worker_id=None):
+        return os.path.join(Config.PERF_DIR, f"test_groups_{worker_id or Config.WORKER_ID}.json")
+
+    @staticmethod
+    def precondition_of(item):
+        marker = item.get_closest_marker("precondition")
+        return marker.args[0] if marker is not None else None
+
+    @classmethod
+    def sort_items(cls, items):
+        """Run tests with the same precondition back to back; the order within a precondition is kept."""
+        rank = {name: position for position, name in enumerate(cls.PRECONDITIONS, start=1)}
+        preconditions = {item.nodeid: cls.precondition_of(item) for item in items}
+        unknown = {name for name in preconditions.values() if name is not None and name not in rank}
+        if unknown:
+            raise ValueError(f"Unknown precondition(s): {', '.join(sorted(unknown))}. "
+                             f"Known: {', '.join(cls.PRECONDITIONS)}")
+        items.sort(key=lambda item: rank.get(preconditions[item.nodeid], 0))
+
+    @classmethod
+    def write(cls, items):
+        groups = {}
+        preconditions = {}
+        for item in items:
+            marker = item.get_closest_marker("xdist_group")
+            if marker is not None:
+                groups[item.nodeid] = marker.kwargs.get("name", marker.args[0] if marker.args else "default")
+            precondition = cls.precondition_of(item)
+            if precondition is not None:
+                preconditions[item.nodeid] = precondition
+        os.makedirs(Config.PERF_DIR, exist_ok=True)
+        with open(cls.path(), "w") as groups_file:
+            json.dump({"groups": groups, "preconditions": preconditions}, groups_file)
+
+    @classmethod
+    def read(cls):
+        """The xdist groups and preconditions by node id, as written by the first worker."""
+        paths = glob.glob(cls.path("*"))
+        if not paths:
+            return {}, {}
+        with open(paths[0], "r") as groups_file:
+            data = json.load(groups_file)
+        return data["groups"], data["preconditions"]
+
+    @classmethod
+    def clear(cls):
+        for path in glob.glob(cls.path("*")):
+            os.remove(path)
+
+
+class DurationScheduling(LoadScheduling):
+    """xdist load scheduling that dispatches the longest work first (LPT).
+
+    Tests of one xdist group form a single unit whose duration is their sum.
+    Tests sharing a precondition are packed into units of at most half a
+    worker's fair share of the run, and every other test is a unit of its
+    own. Units are queued longest first and a worker is handed another whole
+    unit whenever fewer than two of its tests are pending (a worker holds back
+    its last test until it knows the next one). Until the run's tail, a worker
+    takes the longest unit with the precondition it last ran rather than the
+    longest overall, so it seldom has to switch browser state. Long checkout
+    tests start early instead of being the tail of the run, and the run's wall
+    time approaches the total test time divided by the number of workers.
+    """
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        # Initial distribution already happened, newly added nodes just take work.
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.node_precondition = {}
+        self._plan(self.collection)
+        if not self.collection:
+            return
+        # Deal the longest units out one per worker before any worker gets its second.
+        for target in (1, 2):
+            for node in self.nodes:
+                self._fill(node, target)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def _plan(self, collection):
+        """Split the collection into units and queue them longest first."""
+        durations = TestDurations.estimate(collection, TestDurations.load())
+        self.expected = [durations[nodeid] for nodeid in collection]
+        groups, preconditions = TestGroups.read()
+        # Precondition batches are capped so that they never outweigh the balancing.
+        self.batch_limit = sum(self.expected) / max(len(self.nodes), 1) / 2
+
+        units = {}
+        batches = {}
+        for index in sorted(range(len(collection)), key=lambda index: -self.expected[index]):
+            nodeid = collection[index]
+            if nodeid in groups:
+                units.setdefault(f"group:{groups[nodeid]}", []).append(index)
+            elif nodeid in preconditions:
+                precondition = preconditions[nodeid]
+                batch = batches.get(precondition)
+                if batch is None or sum(self.expected[member] for member in units[batch]) + self.expected[index] \
+                        > self.batch_limit:
+                    batch = batches[precondition] = f"precondition:{precondition}:{len(units)}"
+                    units[batch] = []
+                units[batch].append(index)
+            else:
+                units[nodeid] = [index]
+
+        ordered = sorted(units.items(), key=lambda unit: -sum(self.expected[index] for index in unit[1]))
+        self.log("dispatching", len(ordered), "units, longest first:", ordered[0][0] if ordered else None)
+        self.unit_of = {index: key for key, indices in ordered for index in indices}
+        self.precondition_of = {index: preconditions.get(collection[index]) for index in range(len(collection))}
+        self.pending[:] = [index for _, indices in ordered for index in indices]
+
+    def check_schedule(self, node, duration=0):
+        if node.shutting_down:
+            return
+        if not self.pending:
+            node.shutdown()
+            return
+        self._fill(node, 2)
+        self.log("num items waiting for node:", len(self.pending))
+
+    def _fill(self, node, target):
+        """Send whole units to the node until it has at least target tests pending."""
+        while self.pending and len(self.node2pending[node]) < target:
+            start = self._next_unit(node)
+            unit = self.unit_of[self.pending[start]]
+            end = start + 1
+            while end < len(self.pending) and self.unit_of[self.pending[end]] == unit:
+                end += 1
+            tests = self.pending[start:end]
+            del self.pending[start:end]
+            self.node2pending[node].extend(tests)
+            self.node_precondition[node] = self.precondition_of[tests[-1]]
+            node.send_runtest_some(tests)
+
+    def _next_unit(self, node):
+        """Position in pending of the unit to send: the longest with the node's precondition, else the head."""
+        precondition = self.node_precondition.get(node)
+        # In the tail of the run, balance matters more than warm browser state.
+        if precondition is None or sum(self.expected[index] for index in self.pending) \
+                < self.batch_limit * len(self.nodes):
+            return 0
+        for position, index in enumerate(self.pending):
+            if self.precondition_of[index] == precondition:
+                return position
+        return 0
@@ -0,0 +1,61 @@
+import threading
+import allure
+from config.config import Config
+from utils.logger import setup_logger
+from utils.screenshot_pipeline import ScreenshotPipeline
+
+logger = setup_logger()
+
+
+class Evidence:
+    """Collects element-scoped failure evidence: a cropped screenshot and the element's outer HTML.
+
+    BasePage calls capture() from its locator-based failure paths. The PNG
+    crop is encoded on the screenshot pipeline thread; conftest calls begin()
+    at test setup and attach_pending() in the teardown report, on the test
+    thread, where allure can attach to the current test.
+    """
+
+    _local = threading.local()
+
+    @classmethod
+    def begin(cls, test_name, browser, attempt):
+        cls._local.test = (test_name, browser, attempt)
+        cls._local.pending = []
+
+    @classmethod
+    def capture(cls, driver, locator, reason):
+        """Record evidence for the first element matching the locator; never raises."""
+        test = getattr(cls._local, "test", None)
+        if test is None:
+            return
+        test_name, browser, attempt = test
+
+        try:
+            elements = driver.find_elements(*locator)
+            if not elements:
+                cls._local.pending.append((reason, None, f"No element matched {locator} at {driver.current_url}"))
+                return
+
+            element = elements[0]
+            outer_html = element.get_attribute("outerHTML")
+            screenshot = None
+            if Config.SCREENSHOT_ON_FAILURE and element.is_displayed() \
+                    and element.size["width"] and element.size["height"]:
+                screenshot = ScreenshotPipeline.submit(element.screenshot_as_png, test_name, browser, attempt,
+                                                       label="element")
+            cls._local.pending.append((reason, screenshot, outer_html))
+        except Exception as e:
+            logger.warning("Could not capture evidence for %s: %s", locator, e)
+
+    @classmethod
+    def attach_pending(cls):
+        """Attach everything captured during the current test to allure."""
+        pending = getattr(cls._local, "pending", [])
+        cls._local.pending = []
+        for reason, screenshot, outer_html in pending:
+            if screenshot is not None:
+                path, mime_type = screenshot.result()
+                allure.attach.file(path, name=f"{reason} (element)", attachment_type=mime_type,
+                                   extension=path.rsplit(".", 1)[-1])
+            allure.attach(outer_html, name=f"{reason} (outerHTML)", attachment_type=allure.attachment_type.HTML)
@@ -0,0 +1,317 @@
+"""HTTP-only order placement stress driver for the nopCommerce one-page checkout.
+
+Each virtual user replays the request sequence the browser sends: search, add to cart, open
+the one-page checkout, save billing, shipping method, payment method and payment info, and
+confirm. It uses its own requests.Session, run through asyncio.to_thread, so a few hundred
+users fit on one machine.
+
+Example:
+    python -m utils.http_checkout_driver --users 200 --duration 300 --ramp-up 60 --card
+"""
+import argparse
+import asyncio
+import html
+import json
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+import requests
+from config.config import Config
+from utils.logger import setup_logger, setup_logging, shutdown_logging
+from utils.stats import percentile
+
+logger = setup_logger()
+
+CHECK_MONEY_ORDER = "Payments.CheckMoneyOrder"
+MANUAL_CARD = "Payments.Manual"
+
+
+class CheckoutError(Exception):
+    """A checkout step answered with an unexpected status or payload."""
+
+
+class StepFailed(Exception):
+    """Any error raised by one step of the order, tagged with the step's name."""
+
+    def __init__(self, step, error):
+        super().__init__(f"{step}: {type(error).__name__}: {error}")
+        self.step = step
+        self.error = error
+
+
+def _attributes(tag):
+    return {name.lower(): html.unescape(value) for name, value in re.findall(r'([\w.\-]+)="([^"]*)"', tag)}
+
+
+def input_value(page, name):
+    for tag in re.findall(r"<input[^>]*>", page):
+        attributes = _attributes(tag)
+        if attributes.get("name") == name:
+            return attributes.get("value", "")
+    return None
+
+
+def select_options(page, name):
+    """(value, text) pairs of the <select> with the given name."""
+    match = re.search(r'<select[^>]*name="%s"[^>]*>(.*?)</select>' % re.escape(name), page, re.S)
+    if not match:
+        return []
+    return [(html.unescape(value), html.unescape(text).strip())
+            for value, text in re.findall(r'<option[^>]*value="([^"]*)"[^>]*>(.*?)</option>', match.group(1), re.S)]
+
+
+def radio_values(page, name):
+    return [_attributes(tag).get("value") for tag in re.findall(r"<input[^>]*>", page)
+            if _attributes(tag).get("name") == name]
+
+
+class CheckoutSession:
+    """One virtual user's cookie jar and the checkout request sequence."""
+
+    def __init__(self, base_url, test_data, pay_by_card=False, timeout=30):
+        self.base_url = base_url
+        self.session = requests.Session()
+        self.timeout = timeout
+        self.billing = test_data["checkout_fields"]["full_billing_address_section"]
+        self.card = test_data["payment_with_card"]
+        self.product_name = test_data["product_search"]["valid_product"]
+        self.pay_by_card = pay_by_card
+        self.token = None
+
+    def _request(self, method, path, **kwargs):
+        response = self.session.request(method, urljoin(self.base_url, path), timeout=self.timeout, **kwargs)
+        if response.status_code >= 400:
+            raise CheckoutError(f"{method} {path} returned {response.status_code}")
+        token = input_value(response.text, "__RequestVerificationToken")
+        if token:
+            self.token = token
+        return response
+
+    def _post_step(self, path, data):
+        """Post an OPC step; nopCommerce answers JSON and reports validation problems in it."""
+        response = self._request("POST", path, data={**data, "__RequestVerificationToken": self.token},
+                                 headers={"X-Requested-With": "XMLHttpRequest"})
+        try:
+            payload = response.json()
+        except ValueError:
+            raise CheckoutError(f"{path} did not answer JSON")
+        if payload.get("error") or payload.get("success") is False:
+            raise CheckoutError(f"{path} rejected the step: {payload.get('message') or payload.get('error')}")
+        return payload
+
+    def find_product(self):
+        response = self._request("GET", "search", params={"q": self.product_name})
+        match = re.search(r'data-productid="(\d+)"', response.text)
+        if not match:
+            raise CheckoutError(f"Product '{self.product_name}' not found")
+        return match.group(1)
+
+    def add_to_cart(self, product_id):
+        response = self._request("POST", f"addproducttocart/catalog/{product_id}/1/1",
+                                 data={"__RequestVerificationToken": self.token},
+                                 headers={"X-Requested-With": "XMLHttpRequest"})
+        if not response.json().get("success"):
+            raise CheckoutError(f"Adding product {product_id} to the cart failed")
+
+    def open_checkout(self):
+        response = self._request("GET", "onepagecheckout")
+        if "/login" in response.url:
+            raise CheckoutError("Store does not allow anonymous checkout")
+        return response.text
+
+    def save_billing(self, checkout_page):
+        countries = select_options(checkout_page, "BillingNewAddress.CountryId")
+        country_id = next((value for value, text in countries
+                           if text.lower().startswith(self.billing["country_dropdown"].lower())), None)
+        if country_id is None:
+            raise CheckoutError(f"Country '{self.billing['country_dropdown']}' not offered")
+        states = self._request("GET", "country/getstatesbycountryid", params={"countryId": country_id}).json()
+        state_id = next((str(state["id"]) for state in states if state["name"] == self.billing["state_dropdown"]), "0")
+
+        return self._post_step("checkout/OpcSaveBilling/", {
+            "BillingNewAddress.FirstName": self.billing["first_name"],
+            "BillingNewAddress.LastName": self.billing["last_name"],
+            "BillingNewAddress.Email": self.billing["email"],
+            "BillingNewAddress.Company": self.billing["company"],
+            "BillingNewAddress.CountryId": country_id,
+            "BillingNewAddress.StateProvinceId": state_id,
+            "BillingNewAddress.City": self.billing["city"],
+            "BillingNewAddress.Address1": self.billing["address1"],
+            "BillingNewAddress.Address2": self.billing["address2"],
+            "BillingNewAddress.ZipPostalCode": self.billing["zip_code"],
+            "BillingNewAddress.PhoneNumber": self.billing["phone_number"],
+            "BillingNewAddress.FaxNumber": self.billing["fax_number"],
+            "ShipToSameAddress": "true",
+        })
+
+    def save_shipping_method(self, billing_response):
+        section = billing_response.get("update_section", {}).get("html", "")
+        options = radio_values(section, "shipping_option")
+        if not options:
+            raise CheckoutError("No shipping method offered")
+        return self._post_step("checkout/OpcSaveShippingMethod/", {"shipping_option": options[0]})
+
+    def save_payment_method(self):
+        method = MANUAL_CARD if self.pay_by_card else CHECK_MONEY_ORDER
+        return self._post_step("checkout/OpcSavePaymentMethod/", {"paymentmethod": method})
+
+    def save_payment_info(self):
+        data = {}
+        if self.pay_by_card:
+            data = {"CreditCardType": self.card["card_type"], "CardholderName": self.card["cardholder_name"],
+                    "CardNumber": self.card["card_number"], "ExpireMonth": self.card["expiry_month"],
+                    "ExpireYear": self.card["expiry_year"], "CardCode": self.card["cvv"]}
+        return self._post_step("checkout/OpcSavePaymentInfo/", data)
+
+    def confirm(self):
+        payload = self._post_step("checkout/OpcConfirmOrder/", {})
+        if not payload.get("redirect") and not payload.get("success"):
+            raise CheckoutError("Order was not confirmed")
+        return payload
+
+
+class StressRun:
+    """Runs virtual users concurrently and keeps per-step latencies and error counts."""
+
+    STEPS = ["find_product", "add_to_cart", "open_checkout", "save_billing", "save_shipping_method",
+             "save_payment_method", "save_payment_info", "confirm"]
+
+    def __init__(self, users, duration, ramp_up=0, think_time=0, pay_by_card=False, base_url=None):
+        self.users = users
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.think_time = think_time
+        self.pay_by_card = pay_by_card
+        self.base_url = base_url or Config.BASE_URL
+        self.latencies = {step: [] for step in self.STEPS + ["order"]}
+        self.errors = {}
+        self.orders = 0
+
+    def _timed(self, step, function, *args):
+        started = time.perf_counter()
+        try:
+            result = function(*args)
+        except Exception as e:
+            raise StepFailed(step, e) from e
+        self.latencies[step].append(time.perf_counter() - started)
+        return result
+
+    def place_order(self, session):
+        """The blocking request sequence for one order; runs on a worker thread."""
+        started = time.perf_counter()
+        product_id = self._timed("find_product", session.find_product)
+        self._timed("add_to_cart", session.add_to_cart, product_id)
+        checkout_page = self._timed("open_checkout", session.open_checkout)
+        billing = self._timed("save_billing", session.save_billing, checkout_page)
+        self._timed("save_shipping_method", session.save_shipping_method, billing)
+        self._timed("save_payment_method", session.save_payment_method)
+        self._timed("save_payment_info", session.save_payment_info)
+        self._timed("confirm", session.confirm)
+        self.latencies["order"].append(time.perf_counter() - started)
+
+    async def _user(self, index, test_data, deadline):
+        await asyncio.sleep(self.ramp_up * index / max(self.users, 1))
+        while time.monotonic() < deadline:
+            # A fresh session per order: new cookies, new cart, new guest customer.
+            session = CheckoutSession(self.base_url, test_data, self.pay_by_card)
+            try:
+                await asyncio.to_thread(self.place_order, session)
+                self.orders += 1
+            except Exception as e:
+                # One virtual user's surprise must not end the run; errors are counted per failing step.
+                error = f"{e.step} ({type(e.error).__name__})" if isinstance(e, StepFailed) else type(e).__name__
+                self.errors[error] = self.errors.get(error, 0) + 1
+                logger.debug("Virtual user %s: order failed: %s", index, e)
+            finally:
+                session.session.close()
+            if self.think_time:
+                await asyncio.sleep(random.uniform(0.5, 1.5) * self.think_time)
+
+    async def _run(self, test_data):
+        # asyncio.to_thread uses the default executor; size it so every user can have a request in flight.
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=self.users))
+        deadline = time.monotonic() + self.ramp_up + self.duration
+        await asyncio.gather(*(self._user(index, test_data, deadline) for index in range(self.users)))
+
+    def run(self):
+        with open(Config.TEST_DATA_PATH, "r") as test_data_file:
+            test_data = json.load(test_data_file)
+        started = time.monotonic()
+        asyncio.run(self._run(test_data))
+        return self.report(time.monotonic() - started)
+
+    @staticmethod
+    def histogram(values):
+        """Counts per power-of-two millisecond bucket, e.g. {"<=256ms": 12}."""
+        buckets = {}
+        for value in values:
+            bound = 1
+            while bound < value * 1000:
+                bound *= 2
+            buckets[bound] = buckets.get(bound, 0) + 1
+        return {f"<={bound}ms": count for bound, count in sorted(buckets.items())}
+
+    def report(self, elapsed):
+        failed = sum(self.errors.values())
+        attempts = self.orders + failed
+        steps = {}
+        for step, values in self.latencies.items():
+            if values:
+                steps[step] = {"count": len(values), "p50": round(percentile(values, 50), 3),
+                               "p90": round(percentile(values, 90), 3), "p99": round(percentile(values, 99), 3),
+                               "max": round(max(values), 3)}
+        return {
+            "users": self.users,
+            "elapsed_seconds": round(elapsed, 1),
+            "orders": self.orders,
+            "failed_orders": failed,
+            "error_rate": round(failed / attempts, 4) if attempts else 0.0,
+            "orders_per_second": round(self.orders / max(elapsed - self.ramp_up, 1e-9), 3),
+            "errors": self.errors,
+            "steps": steps,
+            "order_histogram": self.histogram(self.latencies["order"]),
+        }
+
+
+def format_report(report):
+    lines = [f"{report['orders']} orders placed, {report['failed_orders']} failed "
+             f"(error rate {report['error_rate']:.1%}) by {report['users']} users in {report['elapsed_seconds']}s; "
+             f"{report['orders_per_second']} orders/s"]
+    for step, stats in report["steps"].items():
+        lines.append(f"  {step}: p50 {stats['p50']}s, p90 {stats['p90']}s, p99 {stats['p99']}s, "
+                     f"max {stats['max']}s (n={stats['count']})")
+    if report["order_histogram"]:
+        lines.append("  order latency: " + ", ".join(f"{bucket}: {count}"
+                                                     for bucket, count in report["order_histogram"].items()))
+    for error, count in sorted(report["errors"].items(), key=lambda pair: -pair[1]):
+        lines.append(f"  error {error}: {count}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress the one-page checkout over plain HTTP.")
+    parser.add_argument("--users", type=int, default=50, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=120, help="Seconds to run after ramp-up")
+    parser.add_argument("--ramp-up", type=float, default=30, help="Seconds over which users are started")
+    parser.add_argument("--think-time", type=float, default=0, help="Mean pause between orders, seconds")
+    parser.add_argument("--card", action="store_true", help="Pay with the payment_with_card test data")
+    parser.add_argument("--base-url", default=Config.BASE_URL)
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+    args = parser.parse_args()
+
+    setup_logging()
+    try:
+        report = StressRun(args.users, args.duration, args.ramp_up, args.think_time, args.card, args.base_url).run()
+    finally:
+        shutdown_logging()
+
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
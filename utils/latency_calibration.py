@@ -0,0 +1,88 @@
+import os
+import statistics
+import time
+import requests
+from config.config import Config
+from utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+class LatencyCalibration:
+    """Measures how fast the environment under test responds and scales timeouts to match.
+
+    A few probe requests to Config.BASE_URL give a round-trip time (HEAD) and a
+    page-load time (full GET). Each is compared to its reference value, and the
+    slower ratio becomes the timeout scale factor. The factor is bounded, and
+    both Config and the environment are updated so that xdist workers spawned
+    afterwards inherit it.
+    """
+    round_trip = None
+    page_load = None
+    scale = None
+
+    @staticmethod
+    def measure(url=None, probes=None):
+        """Return the median round-trip and page-load times in seconds.
+
+        Probes answered with an error status are not timed; an error page is no
+        measure of how fast the application serves. Raises requests.HTTPError
+        when no probe of either kind succeeded.
+        """
+        url = url or Config.BASE_URL
+        probes = probes or Config.CALIBRATION_PROBES
+        timeout = Config.NAVIGATION_TIMEOUT
+        round_trips, page_loads = [], []
+
+        with requests.Session() as session:
+            for _ in range(probes):
+                started = time.perf_counter()
+                response = session.head(url, timeout=timeout, allow_redirects=True)
+                if response.ok:
+                    round_trips.append(time.perf_counter() - started)
+                else:
+                    logger.debug("Calibration HEAD %s returned %s; sample ignored", url, response.status_code)
+
+                started = time.perf_counter()
+                response = session.get(url, timeout=timeout)
+                response.content
+                if response.ok:
+                    page_loads.append(time.perf_counter() - started)
+                else:
+                    logger.debug("Calibration GET %s returned %s; sample ignored", url, response.status_code)
+
+        if not round_trips or not page_loads:
+            raise requests.HTTPError(f"No successful calibration probe against {url}")
+        return statistics.median(round_trips), statistics.median(page_loads)
+
+    @staticmethod
+    def scale_factor(round_trip, page_load):
+        ratio = max(round_trip / Config.CALIBRATION_REFERENCE_RTT,
+                    page_load / Config.CALIBRATION_REFERENCE_LOAD)
+        return min(max(ratio, Config.MIN_TIMEOUT_SCALE), Config.MAX_TIMEOUT_SCALE)
+
+    @staticmethod
+    def calibrate():
+        """Measure the environment and apply the resulting scale to every explicit timeout."""
+        try:
+            round_trip, page_load = LatencyCalibration.measure()
+        except requests.RequestException as e:
+            logger.error("Latency calibration failed, keeping timeout scale %s: %s", Config.TIMEOUT_SCALE, e)
+            return Config.TIMEOUT_SCALE
+
+        LatencyCalibration.round_trip = round_trip
+        LatencyCalibration.page_load = page_load
+        LatencyCalibration.scale = LatencyCalibration.scale_factor(round_trip, page_load)
+
+        Config.TIMEOUT_SCALE = LatencyCalibration.scale
+        os.environ["TIMEOUT_SCALE"] = str(LatencyCalibration.scale)
+        logger.info("Calibrated against %s: round trip %.3fs, page load %.3fs, timeout scale %.2f", Config.BASE_URL, round_trip, page_load, LatencyCalibration.scale)
+        return LatencyCalibration.scale
+
+    @staticmethod
+    def summary():
+        if LatencyCalibration.scale is None:
+            return f"Timeout scale factor: {Config.TIMEOUT_SCALE:.2f} (not calibrated)"
+        return (f"Timeout scale factor: {LatencyCalibration.scale:.2f} "
+                f"(round trip {LatencyCalibration.round_trip * 1000:.0f} ms, "
+                f"page load {LatencyCalibration.page_load * 1000:.0f} ms against {Config.BASE_URL})")
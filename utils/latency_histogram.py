@@ -0,0 +1,167 @@
+import functools
+import glob
+import json
+import math
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+from config.config import Config
+
+# Sub-buckets per power of two; 32 keeps every recorded value within about 3% of its bucket.
+SUB_BUCKETS = 32
+
+
+class LatencyHistogram:
+    """Log-linear (HDR-style) histogram of latencies in microseconds.
+
+    Values are counted in buckets whose width grows with their magnitude, so
+    memory depends on the range of latencies seen, never on the number of
+    samples, and histograms from different workers merge by adding counts.
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @staticmethod
+    def bucket_of(micros):
+        micros = max(int(micros), 1)
+        exponent = micros.bit_length() - 1
+        return exponent * SUB_BUCKETS + int((micros / (1 << exponent) - 1) * SUB_BUCKETS)
+
+    @staticmethod
+    def bucket_value(bucket):
+        """Midpoint of a bucket, in microseconds."""
+        exponent, sub_bucket = divmod(bucket, SUB_BUCKETS)
+        return (1 << exponent) * (1 + (sub_bucket + 0.5) / SUB_BUCKETS)
+
+    def record(self, seconds):
+        micros = seconds * 1_000_000
+        bucket = self.bucket_of(micros)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.total += 1
+        self.min = micros if self.min is None else min(self.min, micros)
+        self.max = micros if self.max is None else max(self.max, micros)
+
+    def merge(self, other):
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.total += other.total
+        if other.total:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def percentile(self, q):
+        """Value at percentile q in seconds, within the bucket resolution; exact for the maximum."""
+        if not self.total:
+            return None
+        rank = max(1, math.ceil(q / 100 * self.total))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(max(self.bucket_value(bucket), self.min), self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    def summary(self):
+        return {"count": self.total, "p50": self.percentile(50), "p90": self.percentile(90),
+                "p99": self.percentile(99), "max": self.max / 1_000_000 if self.total else None}
+
+    def to_dict(self):
+        return {"counts": {str(bucket): count for bucket, count in self.counts.items()},
+                "total": self.total, "min": self.min, "max": self.max}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.counts = {int(bucket): count for bucket, count in data["counts"].items()}
+        histogram.total, histogram.min, histogram.max = data["total"], data["min"], data["max"]
+        return histogram
+
+
+class LatencyHistograms:
+    """Process-wide histograms keyed by "action|locator", dumped per worker and merged at session end."""
+
+    _histograms = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, action, locator, seconds):
+        with cls._lock:
+            for key in (f"{action}|{locator}", f"{action}|*"):
+                histogram = cls._histograms.get(key)
+                if histogram is None:
+                    histogram = cls._histograms[key] = LatencyHistogram()
+                histogram.record(seconds)
+
+    @staticmethod
+    def worker_path(worker_id=None):
+        return os.path.join(Config.PERF_DIR, f"latency_histograms_{worker_id or Config.WORKER_ID}.json")
+
+    @classmethod
+    def clear_results(cls):
+        for path in glob.glob(cls.worker_path("*")):
+            os.remove(path)
+
+    @classmethod
+    def dump(cls):
+        """Write this process's histograms to its per-worker file."""
+        with cls._lock:
+            data = {key: histogram.to_dict() for key, histogram in cls._histograms.items()}
+        if not data:
+            return
+        os.makedirs(Config.PERF_DIR, exist_ok=True)
+        with open(cls.worker_path(), "w") as histogram_file:
+            json.dump(data, histogram_file)
+
+    @classmethod
+    def merge_and_export(cls):
+        """Merge every worker's histograms and export p50/p90/p99/max per key; returns the merged summary."""
+        merged = {}
+        for path in glob.glob(cls.worker_path("*")):
+            with open(path, "r") as histogram_file:
+                for key, data in json.load(histogram_file).items():
+                    merged.setdefault(key, LatencyHistogram()).merge(LatencyHistogram.from_dict(data))
+        if not merged:
+            return {}
+
+        summary = {key: merged[key].summary() for key in sorted(merged)}
+        with open(os.path.join(Config.PERF_DIR, "latency_histograms.json"), "w") as merged_file:
+            json.dump({key: histogram.to_dict() for key, histogram in merged.items()}, merged_file)
+        with open(os.path.join(Config.PERF_DIR, "latency_percentiles.json"), "w") as summary_file:
+            json.dump(summary, summary_file, indent=2)
+        return summary
+
+
+def _locator_label(args, kwargs):
+    locator = kwargs.get("locator", args[0] if args else None)
+    if isinstance(locator, tuple) and len(locator) == 2:
+        return f"{locator[0]}={locator[1]}"
+    if isinstance(locator, str):
+        if locator.startswith(("http://", "https://")):
+            # One key per route, not per query string.
+            return urlsplit(locator).path or "/"
+        if len(args) > 1 and isinstance(args[1], str):
+            return f"{locator}={args[1]}"
+        return locator
+    # Conditions, elements and other objects would make a key per call.
+    return "-"
+
+
+def record_latency(action=None):
+    """Decorator for page-object actions; the locator label is taken from the first argument(s)."""
+    def decorator(function):
+        name = action or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(self, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return function(self, *args, **kwargs)
+            finally:
+                LatencyHistograms.record(name, _locator_label(args, kwargs), time.perf_counter() - started)
+        return wrapper
+    return decorator
@@ -0,0 +1,94 @@
+from functools import lru_cache
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+
+class LazyElement:
+    """WebElement proxy that remembers how it was found and re-finds itself when it goes stale.
+
+    The proxy keeps its locator, its index among the locator's matches and,
+    for child lookups, the proxy it was found from. The underlying element is
+    resolved on first use and cached. If a command fails with
+    StaleElementReferenceException, the proxy looks the element up again once
+    and retries the command. An AJAX re-render then costs one extra lookup
+    instead of a timeout and a whole-test rerun.
+
+    Use lazy_element() to build instances. It mixes this class into the
+    driver's own WebElement class, so proxies are accepted anywhere a
+    WebElement is: execute_script arguments, ActionChains, Select.
+    """
+
+    def __init__(self, driver, locator, index=0, root=None, element=None):
+        self._parent = driver
+        self._locator = locator
+        self._index = index
+        self._root = root
+        self._element = element
+
+    @property
+    def _id(self):
+        return self._resolve().id
+
+    @property
+    def locator(self):
+        return self._locator
+
+    def refresh(self):
+        """Drop the cached element and look it up again from the locator."""
+        self._element = None
+        return self._resolve()
+
+    def _resolve(self):
+        if self._element is None:
+            if self._root is not None:
+                elements = super(LazyElement, self._root).find_elements(*self._locator)
+            else:
+                elements = self._parent.find_elements(*self._locator)
+            if len(elements) <= self._index:
+                raise NoSuchElementException(
+                    f"Element {self._locator}[{self._index}] no longer present; {len(elements)} match(es) found.")
+            self._element = elements[self._index]
+        return self._element
+
+    def _retrying(self, command):
+        try:
+            return command()
+        except StaleElementReferenceException:
+            self.refresh()
+            return command()
+
+    def _execute(self, command, params=None):
+        return self._retrying(lambda: super(LazyElement, self)._execute(command, dict(params or {})))
+
+    def is_displayed(self):
+        return self._retrying(lambda: super(LazyElement, self).is_displayed())
+
+    def get_attribute(self, name):
+        return self._retrying(lambda: super(LazyElement, self).get_attribute(name))
+
+    def get_property(self, name):
+        return self._retrying(lambda: super(LazyElement, self).get_property(name))
+
+    def find_element(self, by=By.ID, value=None):
+        element = self._retrying(lambda: super(LazyElement, self).find_element(by, value))
+        return lazy_element(self._parent, (by, value), 0, root=self, element=element)
+
+    def find_elements(self, by=By.ID, value=None):
+        elements = self._retrying(lambda: super(LazyElement, self).find_elements(by, value))
+        return [lazy_element(self._parent, (by, value), index, root=self, element=element)
+                for index, element in enumerate(elements)]
+
+    def __repr__(self):
+        return f"<LazyElement {self._locator}[{self._index}]>"
+
+
+@lru_cache(maxsize=None)
+def _proxy_class(web_element_cls):
+    return type(f"Lazy{web_element_cls.__name__}", (LazyElement, web_element_cls), {})
+
+
+def lazy_element(driver, locator, index=0, root=None, element=None):
+    """Build a LazyElement for the driver, optionally seeded with an already-found element."""
+    if isinstance(element, LazyElement):
+        return element
+    return _proxy_class(driver._web_element_cls)(driver, locator, index, root, element)
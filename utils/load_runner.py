@@ -0,0 +1,222 @@
+"""Browser-level load mode: runs the existing page-object flows in concurrent headless sessions.
+
+Example:
+    python -m utils.load_runner --flow guest_checkout --sessions 8 --ramp-up 60 --duration 600 --rate 0.2
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from config.config import Config
+from pages.checkout.checkout_page import CheckoutPage
+from pages.search_page import SearchPage
+from utils.driver_factory import DriverFactory
+from utils.logger import setup_logger, setup_logging, shutdown_logging
+from utils.stats import percentile
+from utils.step_timings import StepTimings
+from utils.tracing import Tracer
+
+logger = setup_logger()
+
+FLOWS = {
+    "search": lambda driver, test_data: SearchPage(driver).search_valid_product(test_data),
+    "guest_checkout": lambda driver, test_data: CheckoutPage(driver).checkout_as_guest_user(driver, test_data),
+    "signin_checkout": lambda driver, test_data: CheckoutPage(driver).checkout_as_signin_user(driver, test_data),
+}
+
+
+class ArrivalPacer:
+    """Hands out iteration start times at a fixed overall arrival rate (open workload model).
+
+    Sessions that fall behind start their next iteration immediately; how far
+    behind schedule an iteration started is reported as its lag.
+    """
+
+    def __init__(self, rate, started_at):
+        self.interval = 1 / rate if rate else 0
+        self.next_slot = started_at
+        self.lock = threading.Lock()
+
+    def wait_for_slot(self):
+        if not self.interval:
+            return 0.0
+        with self.lock:
+            slot = self.next_slot
+            self.next_slot += self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        return max(0.0, -delay)
+
+
+class LoadRunner:
+    """Runs N sessions, each looping over a flow until the deadline, and aggregates their timings."""
+
+    def __init__(self, flows, sessions, duration, ramp_up=0, think_time=0, rate=None, browser="chrome",
+                 iterations=None):
+        self.flows = flows
+        self.sessions = sessions
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.think_time = think_time
+        self.rate = rate
+        self.browser = browser
+        self.iterations = iterations
+        self.lock = threading.Lock()
+        # undetected_chromedriver patches one shared chromedriver binary, so browsers are started one at a time.
+        self.driver_lock = threading.Lock()
+        self.flow_timings = {}
+        self.step_timings = {}
+        self.errors = {}
+        # First step that failed in each session's current iteration; nested steps fail from the inside out.
+        self.failed_step = threading.local()
+        self.lags = []
+        self.completed = 0
+        self.deadline = None
+        self.pacer = None
+
+    def _record_step(self, step, duration, passed):
+        if passed:
+            with self.lock:
+                self.step_timings.setdefault(step, []).append(duration)
+        elif getattr(self.failed_step, "name", None) is None:
+            self.failed_step.name = step
+
+    def run(self):
+        with open(Config.TEST_DATA_PATH, "r") as test_data_file:
+            test_data = json.load(test_data_file)
+
+        StepTimings.profile = "load"
+        StepTimings.sinks.append(self._record_step)
+        started_at = time.monotonic()
+        self.deadline = started_at + self.ramp_up + self.duration
+        self.pacer = ArrivalPacer(self.rate, started_at + self.ramp_up) if self.rate else None
+
+        threads = [threading.Thread(target=self._session, args=(index, started_at, test_data),
+                                    name=f"load-session-{index}") for index in range(self.sessions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        StepTimings.sinks.remove(self._record_step)
+        StepTimings.dump()
+        Tracer.flush()
+        return self.report(time.monotonic() - started_at)
+
+    def _session(self, index, started_at, test_data):
+        # Sessions are spread evenly over the ramp-up period.
+        if self.sessions > 1:
+            time.sleep(max(0.0, started_at + self.ramp_up * index / self.sessions - time.monotonic()))
+
+        try:
+            with self.driver_lock:
+                driver = DriverFactory.get_driver(self.browser, True)
+        except Exception as e:
+            logger.error("Session %s could not start a browser: %s", index, e)
+            with self.lock:
+                self.errors["driver_start"] = self.errors.get("driver_start", 0) + 1
+            return
+
+        iteration = 0
+        try:
+            while time.monotonic() < self.deadline and (self.iterations is None or iteration < self.iterations):
+                iteration += 1
+                lag = self.pacer.wait_for_slot() if self.pacer else 0.0
+                if time.monotonic() >= self.deadline:
+                    break
+                # Each session starts at its own flow, so a mix runs every flow from the first iteration on.
+                flow_name = self.flows[(index + iteration - 1) % len(self.flows)]
+                flow_started = time.perf_counter()
+                self.failed_step.name = None
+                try:
+                    FLOWS[flow_name](driver, test_data)
+                    with self.lock:
+                        self.flow_timings.setdefault(flow_name, []).append(time.perf_counter() - flow_started)
+                        self.lags.append(lag)
+                        self.completed += 1
+                except Exception as e:
+                    step = self.failed_step.name
+                    logger.warning("Session %s, %s iteration %s failed at %s: %s", index, flow_name, iteration,
+                                   step or "an untimed step", e)
+                    # Errors are counted per failing step, so one broken page stands out from flaky ones.
+                    error = f"{flow_name}/{step}" if step else flow_name
+                    error = f"{error} ({type(e).__name__})"
+                    with self.lock:
+                        self.errors[error] = self.errors.get(error, 0) + 1
+                    # Start the next iteration from a clean session rather than a half-finished checkout.
+                    driver.delete_all_cookies()
+
+                if self.think_time:
+                    time.sleep(random.uniform(0.5, 1.5) * self.think_time)
+        finally:
+            DriverFactory.quit_driver(driver)
+
+    @staticmethod
+    def _distribution(values):
+        return {"count": len(values), "p50": round(percentile(values, 50), 3), "p90": round(percentile(values, 90), 3),
+                "p99": round(percentile(values, 99), 3), "max": round(max(values), 3)}
+
+    def report(self, elapsed):
+        failed = sum(self.errors.values())
+        attempts = self.completed + failed
+        return {
+            "sessions": self.sessions,
+            "elapsed_seconds": round(elapsed, 1),
+            "completed_flows": self.completed,
+            "failed_flows": failed,
+            "error_rate": round(failed / attempts, 4) if attempts else 0.0,
+            "throughput_per_minute": round(self.completed / max(elapsed - self.ramp_up, 1e-9) * 60, 2),
+            "arrival_lag": self._distribution(self.lags) if self.pacer and self.lags else None,
+            "errors": self.errors,
+            "flows": {name: self._distribution(values) for name, values in sorted(self.flow_timings.items())},
+            "steps": {name: self._distribution(values) for name, values in sorted(self.step_timings.items())},
+        }
+
+
+def format_report(report):
+    lines = [f"{report['completed_flows']} flows completed, {report['failed_flows']} failed "
+             f"(error rate {report['error_rate']:.1%}) in {report['elapsed_seconds']}s with "
+             f"{report['sessions']} sessions; throughput {report['throughput_per_minute']}/min"]
+    for section in ("flows", "steps"):
+        for name, stats in report[section].items():
+            lines.append(f"  {section[:-1]} {name}: p50 {stats['p50']}s, p90 {stats['p90']}s, p99 {stats['p99']}s, "
+                         f"max {stats['max']}s (n={stats['count']})")
+    if report["arrival_lag"]:
+        lines.append(f"  arrival lag p90 {report['arrival_lag']['p90']}s: sessions could not keep up with the rate"
+                     if report["arrival_lag"]["p90"] > 1 else f"  arrival lag p90 {report['arrival_lag']['p90']}s")
+    for error, count in sorted(report["errors"].items(), key=lambda pair: -pair[1]):
+        lines.append(f"  error {error}: {count}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run page-object flows as a browser-level load test.")
+    parser.add_argument("--flow", action="append", choices=sorted(FLOWS), help="Flow to run; repeat to mix flows")
+    parser.add_argument("--sessions", type=int, default=4, help="Concurrent headless browser sessions")
+    parser.add_argument("--duration", type=float, default=300, help="Seconds to run after ramp-up")
+    parser.add_argument("--ramp-up", type=float, default=30, help="Seconds over which sessions are started")
+    parser.add_argument("--think-time", type=float, default=2, help="Mean pause between iterations, seconds")
+    parser.add_argument("--rate", type=float, help="Target flow starts per second across all sessions")
+    parser.add_argument("--iterations", type=int, help="Stop each session after this many iterations")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+    args = parser.parse_args()
+
+    setup_logging()
+    try:
+        runner = LoadRunner(args.flow or ["search"], args.sessions, args.duration, args.ramp_up, args.think_time,
+                            args.rate, args.browser, args.iterations)
+        report = runner.run()
+    finally:
+        shutdown_logging()
+
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
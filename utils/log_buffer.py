@@ -0,0 +1,84 @@
+import copy
+import logging
+import os
+import re
+from collections import deque
+from config.config import Config
+
+# Argument types that are safe to keep unformatted until the buffer is flushed; locators are tuples of these.
+PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def _plain_size(value):
+    """Approximate formatted length of a plain argument, or None when it may hold a live object."""
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, PLAIN_TYPES):
+        return 8
+    if isinstance(value, tuple):
+        sizes = [_plain_size(part) for part in value]
+        return None if None in sizes else sum(sizes) + 4
+    return None
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the current test's most recent log records in memory.
+
+    The buffer is bounded both by record count and by approximate message bytes;
+    the oldest records are evicted first. Nothing is formatted or written unless
+    the test fails, at which point flush_to_file() dumps the trail to a file.
+    """
+
+    def __init__(self, max_records=None, max_bytes=None, level=logging.NOTSET):
+        super().__init__(level)
+        self.max_records = max_records or Config.LOG_BUFFER_MAX_RECORDS
+        self.max_bytes = max_bytes or Config.LOG_BUFFER_MAX_BYTES
+        self.records = deque()
+        self.size = 0
+
+    def emit(self, record):
+        # Most records carry only text, numbers and locators, and are kept as they are until a flush formats
+        # them. Records holding live objects (WebElements, tracebacks and their frames) are frozen to text.
+        values = record.args.values() if isinstance(record.args, dict) else record.args or ()
+        sizes = [_plain_size(value) for value in values]
+        if record.exc_info or not isinstance(record.msg, str) or None in sizes:
+            record = copy.copy(record)
+            if record.exc_info and record.exc_text is None:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.msg, record.args, record.exc_info = record.getMessage(), None, None
+            sizes = []
+
+        size = len(record.msg) + len(record.exc_text or "") + sum(sizes)
+        self.records.append((record, size))
+        self.size += size
+        while self.records and (len(self.records) > self.max_records or self.size > self.max_bytes):
+            self.size -= self.records.popleft()[1]
+
+    def clear(self):
+        self.acquire()
+        try:
+            self.records.clear()
+            self.size = 0
+        finally:
+            self.release()
+
+    def flush_to_file(self, path):
+        """Format the buffered records into a file and return its text; the buffer is emptied."""
+        self.acquire()
+        try:
+            text = "".join(self.format(record) + "\n" for record, _ in self.records)
+            self.records.clear()
+            self.size = 0
+        finally:
+            self.release()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as log_file:
+            log_file.write(text)
+        return text
+
+
+def failure_log_path(nodeid, attempt):
+    """Path of the log written for a failed attempt of a test on this worker."""
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")
+    return os.path.join(Config.LOG_DIR, "failures", f"{safe_name}_{Config.WORKER_ID}_try{attempt}.log")
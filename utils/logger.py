@@ -1,33 +1,133 @@
+import glob
+import gzip
+import heapq
 import logging
+import logging.handlers
 import os
+import queue
+from config.config import Config
+from utils.log_buffer import RingBufferHandler
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+MERGED_LOG_NAME = "test_log.log"
+# Width of the default asctime ("2024-01-31 12:00:00,123"), which sorts lexicographically.
+TIMESTAMP_WIDTH = 23
 
-def setup_logger(log_file="test_log.log", log_level=logging.DEBUG):
-    """Set up a logger with both file and console handlers."""
-    logger = logging.getLogger("TestLogger")
+_listener = None
+_queue_handler = None
+_ring_buffer = None
 
-    # Avoid adding duplicate handlers
-    if logger.hasHandlers():
-        return logger
 
-    logger.setLevel(log_level)
+class GzipFileHandler(logging.FileHandler):
+    """FileHandler that writes a gzip-compressed text stream."""
 
-    # Create a file handler to log messages to a file
-    log_file_path = os.getenv("LOG_FILE_PATH", log_file)
-    file_handler = logging.FileHandler(log_file_path)
-    file_handler.setLevel(log_level)
+    def _open(self):
+        return gzip.open(self.baseFilename, self.mode + "t", encoding=self.encoding or "utf-8", errors=self.errors)
 
-    # Create a console handler to display messages on the console
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(log_level)
 
-    # Create a formatter and attach it to the handlers
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
+def setup_logging(log_level=None):
+    """Route all framework logging through a queue so file I/O happens off the test thread.
 
-    # Add handlers to the logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    Records are put on an in-memory queue by a QueueHandler on the root logger;
+    a QueueListener thread formats them and writes to this worker's own gzip
+    log file, so xdist workers never share a file.
+    With Config.LOG_FAILURES_ONLY the file only takes LOG_FILE_LEVEL and above,
+    and the full trail of each test is kept in a ring buffer instead, see
+    failure_log_buffer(). Call once per process; later calls are no-ops.
+    """
+    global _listener, _queue_handler, _ring_buffer
+    if _listener is not None:
+        return
 
-    return logger
\ No newline at end of file
+    log_level = log_level or Config.LOG_LEVEL
+    os.makedirs(Config.LOG_DIR, exist_ok=True)
+
+    file_handler = GzipFileHandler(worker_log_path(), mode="w")
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    file_handler.setLevel(Config.LOG_FILE_LEVEL if Config.LOG_FAILURES_ONLY else log_level)
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _queue_handler.setLevel(file_handler.level)
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    root_logger.addHandler(_queue_handler)
+
+    if Config.LOG_FAILURES_ONLY:
+        _ring_buffer = RingBufferHandler()
+        _ring_buffer.setFormatter(logging.Formatter(LOG_FORMAT))
+        root_logger.addHandler(_ring_buffer)
+
+
+def failure_log_buffer():
+    """Return the per-test ring buffer, or None when every record goes straight to the file."""
+    return _ring_buffer
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener, _queue_handler, _ring_buffer
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    if _ring_buffer is not None:
+        logging.getLogger().removeHandler(_ring_buffer)
+        _ring_buffer = None
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+    _queue_handler = None
+
+
+def worker_log_path(worker_id=None):
+    return os.path.join(Config.LOG_DIR, f"test_log_{worker_id or Config.WORKER_ID}.log.gz")
+
+
+def clear_worker_logs():
+    """Remove per-worker files left over from an earlier run."""
+    for path in glob.glob(worker_log_path("*")):
+        os.remove(path)
+
+
+def _read_records(path):
+    """Yield one worker's records from disk, keeping continuation lines (tracebacks) with their record."""
+    with gzip.open(path, "rt", encoding="utf-8", errors="replace") as log_file:
+        record = None
+        try:
+            for line in log_file:
+                if record is not None and not line[:4].isdigit():
+                    record += line
+                    continue
+                if record is not None:
+                    yield record
+                record = line
+        except EOFError:
+            # A worker that died mid-write leaves a truncated stream; keep what was readable.
+            pass
+        if record is not None:
+            yield record
+
+
+def merge_worker_logs():
+    """Merge every worker's log into a single time-ordered test_log.log and drop the parts.
+
+    Each part is already in time order, so a streaming k-way merge only holds
+    one pending record per worker in memory, whatever the size of the logs.
+    """
+    parts = sorted(glob.glob(worker_log_path("*")))
+    # heapq.merge is stable, so records in the same millisecond keep worker order.
+    records = heapq.merge(*(_read_records(path) for path in parts), key=lambda record: record[:TIMESTAMP_WIDTH])
+    with open(os.path.join(Config.LOG_DIR, MERGED_LOG_NAME), "w") as merged_file:
+        merged_file.writelines(records)
+
+    for path in parts:
+        os.remove(path)
+
+
+def setup_logger(name="TestLogger"):
+    """Return a named logger; handlers are configured centrally by setup_logging."""
+    return logging.getLogger(name)
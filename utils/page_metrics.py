@@ -0,0 +1,155 @@
+import glob
+import json
+import os
+import threading
+import time
+from config.config import Config
+from utils.logger import setup_logger
+
+logger = setup_logger()
+
+# Installed on every new document. Observers accumulate LCP, CLS and TBT while
+# the page lives; on pagehide the finished record is queued in sessionStorage,
+# so a navigation triggered by a click is still reported by the next document.
+OBSERVER_SCRIPT = """
+(() => {
+    if (window.__pageMetrics) return;
+    const metrics = window.__pageMetrics = {
+        docId: Date.now().toString(36) + Math.random().toString(36).slice(2, 8),
+        lcp: null, cls: 0, tbt: 0, fcp: null, longTasks: 0
+    };
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({type, buffered: true});
+        } catch (e) { /* entry type not supported by this browser */ }
+    };
+    observe('largest-contentful-paint', entry => { metrics.lcp = entry.startTime; });
+    observe('layout-shift', entry => { if (!entry.hadRecentInput) metrics.cls += entry.value; });
+    observe('paint', entry => { if (entry.name === 'first-contentful-paint') metrics.fcp = entry.startTime; });
+    observe('longtask', entry => { metrics.longTasks++; metrics.tbt += Math.max(0, entry.duration - 50); });
+
+    window.__collectPageMetrics = () => {
+        const nav = performance.getEntriesByType('navigation')[0];
+        const resources = performance.getEntriesByType('resource');
+        const byType = {};
+        let transferSize = 0;
+        for (const resource of resources) {
+            byType[resource.initiatorType] = (byType[resource.initiatorType] || 0) + 1;
+            transferSize += resource.transferSize || 0;
+        }
+        return {
+            doc_id: metrics.docId,
+            url: location.href,
+            navigation: nav ? {
+                type: nav.type,
+                ttfb: nav.responseStart - nav.startTime,
+                dom_content_loaded: nav.domContentLoadedEventEnd - nav.startTime,
+                load: nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+                transfer_size: nav.transferSize
+            } : null,
+            resources: {count: resources.length, transfer_size: transferSize, by_type: byType},
+            fcp: metrics.fcp, lcp: metrics.lcp, cls: Math.round(metrics.cls * 10000) / 10000,
+            tbt: metrics.tbt, long_tasks: metrics.longTasks
+        };
+    };
+    addEventListener('pagehide', () => {
+        try {
+            const queued = JSON.parse(sessionStorage.getItem('__pageMetricsQueue') || '[]');
+            queued.push(window.__collectPageMetrics());
+            sessionStorage.setItem('__pageMetricsQueue', JSON.stringify(queued));
+        } catch (e) { /* storage disabled */ }
+    });
+})();
+"""
+
+# Returns documents queued by earlier pagehides plus, optionally, the live document.
+COLLECT_SCRIPT = """
+const includeCurrent = arguments[0];
+let records = [];
+try {
+    records = JSON.parse(sessionStorage.getItem('__pageMetricsQueue') || '[]');
+    sessionStorage.removeItem('__pageMetricsQueue');
+} catch (e) { /* storage disabled */ }
+if (includeCurrent && window.__collectPageMetrics) records.push(window.__collectPageMetrics());
+return records;
+"""
+
+
+class PageMetrics:
+    """Collects Navigation Timing, resource summaries and Web Vitals for every page a test loads.
+
+    On Chrome the observer script is registered with
+    Page.addScriptToEvaluateOnNewDocument, so every document, including ones
+    reached by clicks, is observed from its first byte. Firefox has no CDP:
+    the script is injected after each open_url and relies on buffered
+    observer entries instead, and click navigations are only picked up if
+    they return to an already instrumented document.
+
+    Records are kept per driver session, keyed by document, and written to
+    a per-worker JSONL file in Config.PERF_DIR when the test finishes.
+    """
+
+    _records = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def results_path(worker_id=None):
+        return os.path.join(Config.PERF_DIR, f"page_metrics_{worker_id or Config.WORKER_ID}.jsonl")
+
+    @classmethod
+    def clear_results(cls):
+        """Remove per-worker results left over from an earlier run."""
+        for path in glob.glob(cls.results_path("*")):
+            os.remove(path)
+
+    @classmethod
+    def install(cls, driver):
+        if not Config.PAGE_METRICS:
+            return
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVER_SCRIPT})
+        except Exception as e:
+            logger.debug("Page metrics will be injected after each navigation: %s", e)
+
+    @classmethod
+    def after_navigation(cls, driver):
+        """Drain documents left behind since the last call; called by BasePage.open_url."""
+        if not Config.PAGE_METRICS:
+            return
+        try:
+            # A no-op where the script already ran on document creation.
+            driver.execute_script(OBSERVER_SCRIPT)
+            cls._store(driver, driver.execute_script(COLLECT_SCRIPT, False))
+        except Exception as e:
+            logger.debug("Could not collect page metrics: %s", e)
+
+    @classmethod
+    def finish(cls, driver, test_id):
+        """Collect the live document, write every page of the test to the results file and return the pages."""
+        if not Config.PAGE_METRICS:
+            return []
+        try:
+            cls._store(driver, driver.execute_script(COLLECT_SCRIPT, True))
+        except Exception as e:
+            logger.debug("Could not collect page metrics: %s", e)
+
+        with cls._lock:
+            pages = list(cls._records.pop(driver.session_id, {}).values())
+        if not pages:
+            return pages
+
+        os.makedirs(Config.PERF_DIR, exist_ok=True)
+        finished_at = round(time.time(), 3)
+        with open(cls.results_path(), "a") as results_file:
+            for page in pages:
+                results_file.write(json.dumps({"test": test_id, "worker": Config.WORKER_ID,
+                                               "timestamp": finished_at, **page}) + "\n")
+        return pages
+
+    @classmethod
+    def _store(cls, driver, records):
+        with cls._lock:
+            pages = cls._records.setdefault(driver.session_id, {})
+            for record in records or []:
+                # A later snapshot of the same document has the more complete CLS and TBT.
+                pages[record["doc_id"]] = record
@@ -0,0 +1,68 @@
+import json
+from urllib.parse import urlparse
+from config.config import Config
+
+# Budget keys and how to read the measured value from a PageMetrics record.
+METRICS = {
+    "ttfb_ms": lambda page: (page.get("navigation") or {}).get("ttfb"),
+    "dom_content_loaded_ms": lambda page: (page.get("navigation") or {}).get("dom_content_loaded"),
+    "lcp_ms": lambda page: page.get("lcp"),
+    "cls": lambda page: page.get("cls"),
+    "tbt_ms": lambda page: page.get("tbt"),
+    "transfer_kb": lambda page: (((page.get("navigation") or {}).get("transfer_size") or 0)
+                                 + page["resources"]["transfer_size"]) / 1024 if page.get("resources") else None,
+}
+
+
+class PerfBudgets:
+    """Checks PageMetrics records against the per-route budgets in config/perf_budgets.json.
+
+    Each route declares a path; "/" matches the home page only, any other
+    path matches itself and everything below it. Route budgets override the
+    file's "defaults". Pages on routes that are not listed are not checked.
+    """
+
+    _routes = None
+
+    @classmethod
+    def routes(cls):
+        if cls._routes is None:
+            with open(Config.PERF_BUDGETS_PATH, "r") as budgets_file:
+                budgets = json.load(budgets_file)
+            defaults = budgets.get("defaults", {})
+            cls._routes = {name: {**defaults, **route} for name, route in budgets.get("routes", {}).items()}
+        return cls._routes
+
+    @classmethod
+    def route_for(cls, url):
+        path = urlparse(url).path.rstrip("/") or "/"
+        best_name, best_length = None, -1
+        for name, route in cls.routes().items():
+            route_path = route["path"].rstrip("/") or "/"
+            matches = path == route_path if route_path == "/" else \
+                path == route_path or path.startswith(route_path + "/")
+            if matches and len(route_path) > best_length:
+                best_name, best_length = name, len(route_path)
+        return best_name
+
+    @classmethod
+    def check(cls, pages):
+        """Return one breach dict per page metric over its route's budget."""
+        breaches = []
+        for page in pages:
+            route = cls.route_for(page.get("url", ""))
+            if route is None:
+                continue
+            for metric, budget in cls.routes()[route].items():
+                if metric not in METRICS:
+                    continue
+                value = METRICS[metric](page)
+                if value is not None and value > budget:
+                    breaches.append({"route": route, "url": page["url"], "metric": metric,
+                                     "value": round(value, 3), "budget": budget})
+        return breaches
+
+    @staticmethod
+    def describe(breach):
+        return (f"{breach['route']}: {breach['metric']} {breach['value']} > budget {breach['budget']} "
+                f"({breach['url']})")
@@ -0,0 +1,161 @@
+import argparse
+import glob
+import json
+import os
+import sqlite3
+import time
+from urllib.parse import urlparse
+from config.config import Config
+from utils.page_metrics import PageMetrics
+from utils.perf_budgets import METRICS, PerfBudgets
+from utils.stats import mann_whitney_u, median
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    base_url TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    route TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_by_route ON samples (route, metric, run_id);
+"""
+
+
+class PerfHistory:
+    """Keeps per-route page timing distributions of every run in a local SQLite file.
+
+    record_run() stores the samples PageMetrics wrote during the session.
+    compare() tests each route and metric of a run against the pooled samples
+    of the previous Config.PERF_BASELINE_RUNS runs with a one-sided
+    Mann-Whitney U test, and reports a regression only when it is both
+    significant and larger than Config.PERF_MIN_REGRESSION.
+    """
+
+    @staticmethod
+    def connect(path=None):
+        path = path or Config.PERF_HISTORY_DB
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        connection = sqlite3.connect(path)
+        connection.executescript(SCHEMA)
+        return connection
+
+    @staticmethod
+    def route_of(url):
+        return PerfBudgets.route_for(url) or urlparse(url).path or "/"
+
+    @classmethod
+    def record_run(cls, connection, started_at):
+        """Store this session's page metrics as a new run; returns its id, or None without samples."""
+        samples = []
+        for path in glob.glob(PageMetrics.results_path("*")):
+            with open(path, "r") as results_file:
+                for line in results_file:
+                    page = json.loads(line)
+                    route = cls.route_of(page.get("url", ""))
+                    for metric, read in METRICS.items():
+                        value = read(page)
+                        if value is not None:
+                            samples.append((route, metric, float(value)))
+        if not samples:
+            return None
+
+        with connection:
+            run_id = connection.execute("INSERT INTO runs (started_at, base_url) VALUES (?, ?)",
+                                        (started_at, Config.BASE_URL)).lastrowid
+            connection.executemany("INSERT INTO samples (run_id, route, metric, value) VALUES (?, ?, ?, ?)",
+                                   [(run_id, *sample) for sample in samples])
+        return run_id
+
+    @classmethod
+    def compare(cls, connection, run_id=None, baseline_runs=None, alpha=None):
+        """Compare a run (the latest by default) with the runs before it; returns a list of result dicts."""
+        baseline_runs = baseline_runs or Config.PERF_BASELINE_RUNS
+        alpha = alpha or Config.PERF_REGRESSION_ALPHA
+        if run_id is None:
+            row = connection.execute("SELECT MAX(id) FROM runs").fetchone()
+            run_id = row[0]
+        if run_id is None:
+            return []
+
+        baseline_ids = [row[0] for row in connection.execute(
+            "SELECT id FROM runs WHERE id < ? AND base_url = (SELECT base_url FROM runs WHERE id = ?) "
+            "ORDER BY id DESC LIMIT ?", (run_id, run_id, baseline_runs))]
+        if not baseline_ids:
+            return []
+
+        current = cls._distributions(connection, [run_id])
+        baseline = cls._distributions(connection, baseline_ids)
+        results = []
+        for key, values in sorted(current.items()):
+            reference = baseline.get(key)
+            if reference is None or len(values) < Config.PERF_MIN_SAMPLES \
+                    or len(reference) < Config.PERF_MIN_SAMPLES:
+                continue
+            _, p_value = mann_whitney_u(values, reference)
+            current_median, baseline_median = median(values), median(reference)
+            change = (current_median - baseline_median) / baseline_median if baseline_median else 0.0
+            results.append({
+                "route": key[0], "metric": key[1], "samples": len(values), "baseline_samples": len(reference),
+                "median": round(current_median, 3), "baseline_median": round(baseline_median, 3),
+                "change": round(change, 4), "p_value": round(p_value, 5),
+                "regression": p_value < alpha and change > Config.PERF_MIN_REGRESSION,
+            })
+        return results
+
+    @staticmethod
+    def _distributions(connection, run_ids):
+        placeholders = ",".join("?" * len(run_ids))
+        distributions = {}
+        for route, metric, value in connection.execute(
+                f"SELECT route, metric, value FROM samples WHERE run_id IN ({placeholders})", run_ids):
+            distributions.setdefault((route, metric), []).append(value)
+        return distributions
+
+    @staticmethod
+    def format_report(results):
+        regressions = [result for result in results if result["regression"]]
+        if not results:
+            return "Performance history: no baseline to compare against yet."
+        lines = [f"Performance history: {len(regressions)} regression(s) in {len(results)} route metrics compared."]
+        for result in regressions:
+            lines.append(f"  REGRESSION {result['route']} {result['metric']}: median {result['median']} vs "
+                         f"{result['baseline_median']} ({result['change']:+.0%}, p={result['p_value']:.4f}, "
+                         f"n={result['samples']}/{result['baseline_samples']})")
+        return "\n".join(lines)
+
+    @classmethod
+    def write_report(cls, results):
+        """Write the comparison as JSON and text next to the history database; returns the text."""
+        text = cls.format_report(results)
+        os.makedirs(Config.PERF_DIR, exist_ok=True)
+        with open(os.path.join(Config.PERF_DIR, "regression_report.json"), "w") as report_file:
+            json.dump({"generated_at": time.time(), "results": results}, report_file, indent=2)
+        with open(os.path.join(Config.PERF_DIR, "regression_report.txt"), "w") as report_file:
+            report_file.write(text + "\n")
+        return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare a recorded run with the runs before it.")
+    parser.add_argument("--db", default=Config.PERF_HISTORY_DB, help="History database path")
+    parser.add_argument("--run", type=int, help="Run id to compare; defaults to the latest run")
+    parser.add_argument("--baseline-runs", type=int, default=Config.PERF_BASELINE_RUNS)
+    parser.add_argument("--alpha", type=float, default=Config.PERF_REGRESSION_ALPHA)
+    parser.add_argument("--all", action="store_true", help="Print every compared metric, not only regressions")
+    args = parser.parse_args()
+
+    connection = PerfHistory.connect(args.db)
+    results = PerfHistory.compare(connection, args.run, args.baseline_runs, args.alpha)
+    print(PerfHistory.format_report(results))
+    if args.all:
+        for result in results:
+            print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import base64
+import io
+import threading
+import time
+from collections import deque
+from config.config import Config
+from utils.cdp_listener import CdpListener
+from utils.logger import setup_logger
+from utils.screenshot_pipeline import ScreenshotPipeline
+
+try:
+    from PIL import Image
+except ImportError:  # Without Pillow the clip falls back to its last frame.
+    Image = None
+
+logger = setup_logger()
+
+
+class ScreencastRecorder:
+    """Keeps the last Config.SCREENCAST_SECONDS of Chrome screencast frames in memory.
+
+    Frames arrive as base64 JPEGs from Page.screencastFrame and are stored
+    as-is, so a passing test only pays for receiving and acknowledging them.
+    Decoding and encoding into an animated clip happen only for a failure,
+    on the screenshot pipeline thread.
+    """
+
+    def __init__(self):
+        self.frames = deque(maxlen=Config.SCREENCAST_MAX_FRAMES)
+        self.lock = threading.Lock()
+
+    @classmethod
+    def attach(cls, driver):
+        """Subscribe a recorder to the driver's CDP listener; call before the listener starts."""
+        recorder = cls()
+        listener = CdpListener.for_driver(driver, create=True)
+        listener.recorders["screencast"] = recorder
+        listener.subscribe(lambda devtools: devtools.page.ScreencastFrame, recorder._on_frame, recorder._start)
+        return recorder
+
+    @staticmethod
+    def for_driver(driver):
+        listener = CdpListener.for_driver(driver)
+        return listener.recorders.get("screencast") if listener is not None else None
+
+    @staticmethod
+    async def _start(session, devtools):
+        await session.execute(devtools.page.start_screencast(
+            format_="jpeg", quality=Config.SCREENCAST_QUALITY, max_width=Config.SCREENCAST_MAX_WIDTH,
+            every_nth_frame=Config.SCREENCAST_EVERY_NTH_FRAME))
+
+    async def _on_frame(self, session, devtools, event):
+        timestamp = float(event.metadata.timestamp or time.time())
+        with self.lock:
+            self.frames.append((timestamp, event.data))
+            while self.frames and timestamp - self.frames[0][0] > Config.SCREENCAST_SECONDS:
+                self.frames.popleft()
+        # Chrome sends the next frame only after the previous one is acknowledged.
+        await session.execute(devtools.page.screencast_frame_ack(event.session_id))
+
+    def snapshot(self):
+        """Copy the frames in the ring, for encoding after a failure."""
+        with self.lock:
+            return list(self.frames)
+
+    def submit_clip(self, test_name, browser, attempt, taken_at):
+        """Encode the current ring on the pipeline thread; the future resolves to (path, mime_type) or None."""
+        return ScreenshotPipeline.run(self._encode, self.snapshot(), test_name, browser, attempt, taken_at)
+
+    @staticmethod
+    def _encode(frames, test_name, browser, attempt, taken_at):
+        if not frames:
+            return None
+
+        if Image is None:
+            path = ScreenshotPipeline.artifact_path(test_name, browser, attempt, "screencast", "jpg", taken_at)
+            with open(path, "wb") as frame_file:
+                frame_file.write(base64.b64decode(frames[-1][1]))
+            return path, "image/jpeg"
+
+        images = [Image.open(io.BytesIO(base64.b64decode(data))).convert("RGB") for _, data in frames]
+        # Each frame is shown until the next one arrived; the last one for a second.
+        durations = [max(int((later[0] - earlier[0]) * 1000), 20) for earlier, later in zip(frames, frames[1:])]
+        durations.append(1000)
+
+        path = ScreenshotPipeline.artifact_path(test_name, browser, attempt, "screencast", "webp", taken_at)
+        images[0].save(path, "WEBP", save_all=True, append_images=images[1:], duration=durations, loop=0,
+                       quality=Config.SCREENCAST_QUALITY)
+        logger.debug("Encoded %s screencast frames into %s", len(images), path)
+        return path, "image/webp"
@@ -0,0 +1,111 @@
+import hashlib
+import io
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config.config import Config
+from utils.logger import setup_logger
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; screenshots are then kept as PNG and deduplicated by content hash.
+    Image = None
+
+logger = setup_logger()
+
+MIME_TYPES = {"png": "image/png", "jpg": "image/jpeg", "webp": "image/webp"}
+
+
+class ScreenshotPipeline:
+    """Encodes, deduplicates and stores failure screenshots on a background thread.
+
+    The test thread only grabs the PNG bytes from the driver and submits them.
+    Encoding to WebP/JPEG, hashing and writing happen on a single worker
+    thread, and the returned future is collected later, in the teardown report,
+    to attach the file to allure. A screenshot whose perceptual hash matches one
+    already stored for the same test (typically a rerun failing on the same
+    screen) is not written again; the earlier file is attached instead.
+    """
+
+    _executor = None
+    _lock = threading.Lock()
+    _seen = {}
+
+    @classmethod
+    def submit(cls, png_bytes, test_name, browser, attempt, label="page"):
+        """Queue a screenshot for encoding; the future resolves to (path, mime_type)."""
+        return cls.run(cls._store, png_bytes, test_name, browser, attempt, label, time.time())
+
+    @classmethod
+    def run(cls, function, *args):
+        """Run any other artifact encoding job on the pipeline thread."""
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshots")
+            return cls._executor.submit(function, *args)
+
+    @staticmethod
+    def artifact_path(test_name, browser, attempt, label, extension, taken_at):
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", test_name).strip("_")
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(taken_at)) + f"-{int(taken_at * 1000) % 1000:03d}"
+        os.makedirs(Config.SCREENSHOT_DIR, exist_ok=True)
+        return os.path.join(Config.SCREENSHOT_DIR,
+                            f"{safe_name}_{browser}_{Config.WORKER_ID}_try{attempt}_{label}_{stamp}.{extension}")
+
+    @classmethod
+    def shutdown(cls):
+        # Queued jobs take the lock in _store, so wait for them only after releasing it.
+        with cls._lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @classmethod
+    def _store(cls, png_bytes, test_name, browser, attempt, label, taken_at):
+        image = Image.open(io.BytesIO(png_bytes)) if Image is not None else None
+        fingerprint = cls._fingerprint(image, png_bytes)
+
+        with cls._lock:
+            seen = cls._seen.setdefault(test_name, {})
+            if fingerprint in seen:
+                logger.debug("Screenshot for %s (try %s) matches an earlier one; not stored again.",
+                             test_name, attempt)
+                return seen[fingerprint]
+
+        data, extension = cls._encode(image, png_bytes)
+        path = cls.artifact_path(test_name, browser, attempt, label, extension, taken_at)
+        with open(path, "wb") as screenshot_file:
+            screenshot_file.write(data)
+        logger.debug("Screenshot saved: %s (%s bytes)", path, len(data))
+
+        result = (path, MIME_TYPES[extension])
+        with cls._lock:
+            cls._seen[test_name][fingerprint] = result
+        return result
+
+    @staticmethod
+    def _fingerprint(image, png_bytes):
+        """64-bit difference hash when Pillow is available, otherwise a content hash."""
+        if image is None:
+            return hashlib.sha1(png_bytes).hexdigest()
+        pixels = list(image.convert("L").resize((9, 8)).getdata())
+        bits = 0
+        for row in range(8):
+            for column in range(8):
+                bits = (bits << 1) | (pixels[row * 9 + column] > pixels[row * 9 + column + 1])
+        return f"{bits:016x}"
+
+    @staticmethod
+    def _encode(image, png_bytes):
+        screenshot_format = Config.SCREENSHOT_FORMAT
+        if image is None or screenshot_format == "png":
+            return png_bytes, "png"
+
+        buffer = io.BytesIO()
+        if screenshot_format == "jpg":
+            image.convert("RGB").save(buffer, "JPEG", quality=Config.SCREENSHOT_QUALITY, optimize=True)
+        else:
+            image.save(buffer, "WEBP", quality=Config.SCREENSHOT_QUALITY, method=4)
+        return buffer.getvalue(), screenshot_format
@@ -0,0 +1,59 @@
+import math
+
+
+def rank(values):
+    """Return 1-based ranks, giving tied values the average of their positions."""
+    order = sorted(range(len(values)), key=lambda index: values[index])
+    ranks = [0.0] * len(values)
+    position = 0
+    while position < len(order):
+        end = position
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[position]]:
+            end += 1
+        average = (position + end) / 2 + 1
+        for index in order[position:end + 1]:
+            ranks[index] = average
+        position = end + 1
+    return ranks
+
+
+def mann_whitney_u(sample, baseline):
+    """One-sided Mann-Whitney U test that `sample` tends to be larger than `baseline`.
+
+    Returns (u, p_value) using the normal approximation with tie and continuity
+    corrections, which is adequate from about five values per side.
+    """
+    n1, n2 = len(sample), len(baseline)
+    if not n1 or not n2:
+        raise ValueError("Both samples must be non-empty.")
+
+    combined = list(sample) + list(baseline)
+    ranks = rank(combined)
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+
+    n = n1 + n2
+    tie_counts = {}
+    for value in combined:
+        tie_counts[value] = tie_counts.get(value, 0) + 1
+    tie_term = sum(count ** 3 - count for count in tie_counts.values())
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def median(values):
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    return ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def percentile(values, q):
+    """Nearest-rank percentile, q in [0, 100]."""
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("Cannot take a percentile of no values.")
+    index = max(0, math.ceil(q / 100 * len(ordered)) - 1)
+    return ordered[index]
@@ -0,0 +1,103 @@
+import functools
+import glob
+import json
+import os
+import threading
+import time
+from config.config import Config
+from utils.stats import median, percentile
+
+
+def current_test_id():
+    """Node id of the running test, from the variable pytest keeps up to date."""
+    return os.getenv("PYTEST_CURRENT_TEST", "").rsplit(" (", 1)[0] or None
+
+
+class StepTimings:
+    """Records how long each page-object step takes, tagged with the active throttling profile.
+
+    Steps are kept in memory and written to a per-worker JSONL file in
+    Config.PERF_DIR by dump(), at session end or once BATCH_SIZE of them are
+    pending; summary() aggregates every worker's file per profile and step.
+    """
+
+    BATCH_SIZE = 1000
+
+    profile = "none"
+    # Extra callables (step, duration, passed) notified of every step, e.g. the load runner's collector.
+    sinks = []
+    _lock = threading.Lock()
+    _pending = []
+
+    @staticmethod
+    def results_path(worker_id=None):
+        return os.path.join(Config.PERF_DIR, f"step_timings_{worker_id or Config.WORKER_ID}.jsonl")
+
+    @classmethod
+    def clear_results(cls):
+        for path in glob.glob(cls.results_path("*")):
+            os.remove(path)
+
+    @classmethod
+    def record(cls, step, duration, passed):
+        entry = {"test": current_test_id(), "step": step, "profile": cls.profile, "duration": round(duration, 4),
+                 "passed": passed, "worker": Config.WORKER_ID, "timestamp": round(time.time(), 3)}
+        with cls._lock:
+            cls._pending.append(entry)
+            # Long load runs write in batches; a test session writes once, at its end.
+            if len(cls._pending) >= cls.BATCH_SIZE:
+                cls._dump_locked()
+        for sink in cls.sinks:
+            sink(step, duration, passed)
+
+    @classmethod
+    def dump(cls):
+        with cls._lock:
+            cls._dump_locked()
+
+    @classmethod
+    def _dump_locked(cls):
+        if not cls._pending:
+            return
+        entries, cls._pending = cls._pending, []
+        os.makedirs(Config.PERF_DIR, exist_ok=True)
+        with open(cls.results_path(), "a") as results_file:
+            results_file.writelines(json.dumps(entry) + "\n" for entry in entries)
+
+    @classmethod
+    def summary(cls):
+        """Median, p90 and max seconds per (profile, step) over every worker's file; None without data."""
+        durations = {}
+        for path in glob.glob(cls.results_path("*")):
+            with open(path, "r") as results_file:
+                for line in results_file:
+                    entry = json.loads(line)
+                    if entry["passed"]:
+                        durations.setdefault((entry["profile"], entry["step"]), []).append(entry["duration"])
+        if not durations:
+            return None
+
+        lines = ["Step timings (seconds, passed steps only):"]
+        for (profile, step), values in sorted(durations.items()):
+            lines.append(f"  [{profile}] {step}: median {median(values):.2f}, p90 {percentile(values, 90):.2f}, "
+                         f"max {max(values):.2f} (n={len(values)})")
+        return "\n".join(lines)
+
+
+def timed_step(name=None):
+    """Decorator recording the wall time of a page-object step in StepTimings."""
+    def decorator(function):
+        step = name or function.__name__.lstrip("_")
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            passed = False
+            try:
+                result = function(*args, **kwargs)
+                passed = True
+                return result
+            finally:
+                StepTimings.record(step, time.perf_counter() - started, passed)
+        return wrapper
+    return decorator
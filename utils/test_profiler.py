@@ -0,0 +1,200 @@
+import cProfile
+import glob
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from config.config import Config
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+STDLIB_ROOT = os.path.dirname(os.__file__)
+
+
+def _short_path(filename):
+    if filename.startswith(PROJECT_ROOT):
+        return os.path.relpath(filename, PROJECT_ROOT)
+    if filename.startswith(STDLIB_ROOT) and "-packages" not in filename:
+        return os.path.relpath(filename, STDLIB_ROOT)
+    # Installed packages are named from their import root, not the interpreter's prefix.
+    return re.split(r"[\\/](?:site|dist)-packages[\\/]", filename)[-1]
+
+
+def frame_label(filename, line, name):
+    return f"{name} ({_short_path(filename)}:{line})"
+
+
+class SamplingProfiler:
+    """Samples the stack of the thread that started it from a daemon thread.
+
+    sys._current_frames() is read every Config.PROFILE_INTERVAL_MS, so the
+    profiled thread pays nothing but the GIL hand-off; each sample is worth the
+    profiled wall time divided by the number of samples taken.
+    """
+
+    extension = "folded"
+
+    def __init__(self, interval=None):
+        self.interval = (interval or Config.PROFILE_INTERVAL_MS) / 1000
+        self.thread_id = threading.get_ident()
+        self.stacks = Counter()
+        self.elapsed = 0.0
+        self._stopped = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, name="test-profiler", daemon=True)
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._sampler.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._sampler.join()
+        self.elapsed = time.perf_counter() - self._started
+
+    def _sample(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                # co_qualname only exists from Python 3.11.
+                name = getattr(code, "co_qualname", code.co_name)
+                stack.append(frame_label(code.co_filename, code.co_firstlineno, name))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def write(self, path):
+        """Write the samples in folded-stack format, as consumed by flamegraph.pl and speedscope."""
+        with open(path, "w") as profile_file:
+            for stack, count in self.stacks.most_common():
+                profile_file.write(f"{stack} {count}\n")
+
+    def hot_frames(self):
+        """Self and inclusive seconds per frame."""
+        weight = self.elapsed / max(sum(self.stacks.values()), 1)
+        frames = {}
+        for stack, count in self.stacks.items():
+            labels = stack.split(";")
+            for label in set(labels):
+                frames.setdefault(label, [0.0, 0.0])[1] += count * weight
+            frames[labels[-1]][0] += count * weight
+        return frames
+
+
+class DeterministicProfiler:
+    """cProfile over the test thread; exact call counts at a higher overhead than sampling."""
+
+    extension = "prof"
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def write(self, path):
+        """Write pstats data, which flameprof, snakeviz and gprof2dot turn into call graphs."""
+        self.profile.dump_stats(path)
+
+    def hot_frames(self):
+        return {frame_label(*function): [own_time, cumulative_time]
+                for function, (_, _, own_time, cumulative_time, _) in pstats.Stats(self.profile).stats.items()}
+
+
+class TestProfiler:
+    """Profiles selected tests and aggregates their hot frames over the session.
+
+    A test is profiled when --profile-tests is given or it is marked
+    @pytest.mark.profile; the marker's mode ("sample" or "cprofile") wins over
+    the option's. Each test writes its own profile under Config.PROFILE_DIR,
+    and every worker's hot frames are merged by the controller at session end.
+    """
+
+    __test__ = False
+    MODES = {"sample": SamplingProfiler, "cprofile": DeterministicProfiler}
+
+    _frames = {}
+    _profiled_tests = 0
+
+    @classmethod
+    def mode_for(cls, option, marker):
+        """Profiling mode for a test, or None when it is not profiled."""
+        if marker is not None:
+            mode = marker.kwargs.get("mode", marker.args[0] if marker.args else option or Config.PROFILE_MODE)
+        else:
+            mode = option
+        if mode is not None and mode not in cls.MODES:
+            raise ValueError(f"Unknown profiling mode: {mode}. Known: {', '.join(cls.MODES)}")
+        return mode
+
+    @classmethod
+    def start(cls, mode):
+        profiler = cls.MODES[mode]()
+        profiler.start()
+        return profiler
+
+    @classmethod
+    def finish(cls, profiler, test_id):
+        """Stop the profiler, write the test's profile and fold its frames into the session totals."""
+        profiler.stop()
+        os.makedirs(Config.PROFILE_DIR, exist_ok=True)
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", test_id).strip("_")
+        path = os.path.join(Config.PROFILE_DIR, f"{safe_name}_{Config.WORKER_ID}.{profiler.extension}")
+        profiler.write(path)
+
+        for label, (own, inclusive) in profiler.hot_frames().items():
+            totals = cls._frames.setdefault(label, [0.0, 0.0])
+            totals[0] += own
+            totals[1] += inclusive
+        cls._profiled_tests += 1
+        return path
+
+    @staticmethod
+    def worker_path(worker_id=None):
+        return os.path.join(Config.PROFILE_DIR, f"hot_frames_{worker_id or Config.WORKER_ID}.json")
+
+    @classmethod
+    def clear_results(cls):
+        for path in glob.glob(os.path.join(Config.PROFILE_DIR, "*")):
+            os.remove(path)
+
+    @classmethod
+    def dump(cls):
+        if not cls._profiled_tests:
+            return
+        os.makedirs(Config.PROFILE_DIR, exist_ok=True)
+        with open(cls.worker_path(), "w") as frames_file:
+            json.dump({"tests": cls._profiled_tests, "frames": cls._frames}, frames_file)
+
+    @classmethod
+    def merge_and_export(cls):
+        """Merge every worker's hot frames into hot_frames.json, ordered by self time; None without profiles."""
+        tests = 0
+        frames = {}
+        for path in glob.glob(cls.worker_path("*")):
+            with open(path, "r") as frames_file:
+                data = json.load(frames_file)
+            tests += data["tests"]
+            for label, (own, inclusive) in data["frames"].items():
+                totals = frames.setdefault(label, [0.0, 0.0])
+                totals[0] += own
+                totals[1] += inclusive
+        if not tests:
+            return None
+
+        ranked = [{"frame": label, "self_seconds": round(own, 4), "total_seconds": round(inclusive, 4)}
+                  for label, (own, inclusive) in sorted(frames.items(), key=lambda item: -item[1][0])]
+        with open(os.path.join(Config.PROFILE_DIR, "hot_frames.json"), "w") as frames_file:
+            json.dump({"tests": tests, "frames": ranked}, frames_file, indent=2)
+
+        lines = [f"Hottest frames by self time over {tests} profiled test(s):"]
+        for frame in ranked[:Config.PROFILE_TOP_FRAMES]:
+            lines.append(f"  {frame['self_seconds']:8.3f}s self {frame['total_seconds']:8.3f}s total  {frame['frame']}")
+        return "\n".join(lines)
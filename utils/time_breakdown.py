@@ -0,0 +1,141 @@
+import contextlib
+import functools
+import glob
+import html
+import json
+import os
+import threading
+import time
+from config.config import Config
+
+CATEGORIES = ["harness", "wire", "waits", "sleep", "fixtures"]
+# Time spent inside these is theirs alone: the polling wire calls of a wait count as
+# waiting, and a driver launched by a fixture counts as fixture time.
+ABSORBING = {"waits", "sleep", "fixtures"}
+COLORS = {"harness": "#4e79a7", "wire": "#f28e2b", "waits": "#e15759", "sleep": "#76b7b2", "fixtures": "#59a14f"}
+
+
+class TimeBreakdown:
+    """Exclusive-time accountant splitting each test into harness, wire, waits, sleep and fixture time.
+
+    Instrumented code enters a category with measure(); time is always charged
+    to the innermost category on the stack, and whatever is not charged to
+    anything is Python harness time. Accounting is thread-local and only
+    active between begin() and finish(), so background threads (log listener,
+    screenshot pipeline, CDP listener) are never counted.
+    """
+
+    _local = threading.local()
+    _original_sleep = None
+
+    @classmethod
+    def begin(cls, test_id):
+        cls._local.test_id = test_id
+        cls._local.totals = dict.fromkeys(CATEGORIES[1:], 0.0)
+        cls._local.stack = []
+        cls._local.started = time.perf_counter()
+
+    @classmethod
+    def finish(cls):
+        """Stop accounting for the current test and append its breakdown to the worker's results file."""
+        if getattr(cls._local, "totals", None) is None:
+            return None
+        total = time.perf_counter() - cls._local.started
+        totals = cls._local.totals
+        cls._local.totals = None
+
+        breakdown = {"test": cls._local.test_id, "total": round(total, 4),
+                     "harness": round(max(total - sum(totals.values()), 0.0), 4),
+                     **{category: round(seconds, 4) for category, seconds in totals.items()}}
+        os.makedirs(Config.PERF_DIR, exist_ok=True)
+        with open(cls.results_path(), "a") as results_file:
+            results_file.write(json.dumps(breakdown) + "\n")
+        return breakdown
+
+    @classmethod
+    @contextlib.contextmanager
+    def measure(cls, category):
+        stack = getattr(cls._local, "stack", None)
+        if getattr(cls._local, "totals", None) is None or (stack and stack[-1][0] in ABSORBING):
+            yield
+            return
+
+        now = time.perf_counter()
+        if stack:
+            parent = stack[-1]
+            cls._local.totals[parent[0]] += now - parent[1]
+        stack.append([category, now])
+        try:
+            yield
+        finally:
+            category, entered = stack.pop()
+            now = time.perf_counter()
+            cls._local.totals[category] += now - entered
+            if stack:
+                stack[-1][1] = now
+
+    @classmethod
+    def wrap(cls, category, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with cls.measure(category):
+                return function(*args, **kwargs)
+        return wrapper
+
+    @classmethod
+    def instrument_driver(cls, driver):
+        """Charge every WebDriver command of this driver, element commands included, to wire time."""
+        driver.execute = cls.wrap("wire", driver.execute)
+
+    @classmethod
+    def install_sleep_hook(cls):
+        """Route time.sleep through the accountant; other threads and idle periods pass straight through."""
+        if cls._original_sleep is None:
+            cls._original_sleep = time.sleep
+            time.sleep = cls.wrap("sleep", cls._original_sleep)
+
+    @staticmethod
+    def results_path(worker_id=None):
+        return os.path.join(Config.PERF_DIR, f"time_breakdown_{worker_id or Config.WORKER_ID}.jsonl")
+
+    @classmethod
+    def clear_results(cls):
+        for path in glob.glob(cls.results_path("*")):
+            os.remove(path)
+
+    @classmethod
+    def write_report(cls):
+        """Merge the workers' results into time_breakdown.json and a stacked-bar time_breakdown.html."""
+        breakdowns = []
+        for path in glob.glob(cls.results_path("*")):
+            with open(path, "r") as results_file:
+                breakdowns.extend(json.loads(line) for line in results_file)
+        if not breakdowns:
+            return None
+        breakdowns.sort(key=lambda breakdown: -breakdown["total"])
+
+        totals = {category: round(sum(breakdown[category] for breakdown in breakdowns), 3) for category in CATEGORIES}
+        with open(os.path.join(Config.PERF_DIR, "time_breakdown.json"), "w") as report_file:
+            json.dump({"totals": totals, "tests": breakdowns}, report_file, indent=2)
+
+        longest = breakdowns[0]["total"] or 1
+        rows = []
+        for breakdown in [{"test": "All tests", "total": sum(totals.values()), **totals}] + breakdowns:
+            scale = 100 / (sum(totals.values()) or 1) if breakdown["test"] == "All tests" else 100 / longest
+            segments = "".join(
+                f'<span style="width:{breakdown[category] * scale:.2f}%;background:{COLORS[category]}" '
+                f'title="{category}: {breakdown[category]:.2f}s"></span>'
+                for category in CATEGORIES if breakdown[category] > 0)
+            rows.append(f'<tr><td>{html.escape(breakdown["test"])}</td><td>{breakdown["total"]:.2f}s</td>'
+                        f'<td><div class="bar">{segments}</div></td></tr>')
+        legend = "".join(f'<span class="key" style="background:{COLORS[category]}"></span>{category} '
+                         for category in CATEGORIES)
+        path = os.path.join(Config.PERF_DIR, "time_breakdown.html")
+        with open(path, "w") as report_file:
+            report_file.write(
+                "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Time breakdown</title><style>"
+                "body{font-family:sans-serif;font-size:13px}td{padding:2px 8px;white-space:nowrap}"
+                ".bar{display:flex;width:600px;height:14px}.bar span{display:block;height:100%}"
+                ".key{display:inline-block;width:12px;height:12px;margin:0 4px 0 12px}</style></head><body>"
+                f"<h2>Time breakdown per test</h2><p>{legend}</p><table>{''.join(rows)}</table></body></html>")
+        return path
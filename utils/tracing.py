@@ -0,0 +1,282 @@
+"""Tracing spans for page-object methods, exported as OTLP JSON, and a critical-path analyzer.
+
+Every BasePage subclass is instrumented when it is defined: each public method
+and single-underscore helper becomes a span, nested under the span of its
+caller. Spans of a test share one trace whose root span is the test itself.
+Finished traces are appended to reports/perf/traces_<worker>.jsonl, one OTLP
+ExportTraceServiceRequest per line, which an OpenTelemetry collector's file
+receiver or Jaeger's OTLP import can read.
+
+Example:
+    python -m utils.tracing --top 3
+"""
+import argparse
+import functools
+import glob
+import inspect
+import json
+import os
+import threading
+import time
+from config.config import Config
+
+STATUS_UNSET, STATUS_OK, STATUS_ERROR = 0, 1, 2
+SPAN_KIND_INTERNAL = 1
+
+
+class Tracer:
+    """Thread-local span stacks and the per-worker OTLP exporter.
+
+    A span is a plain dict until export. Outside a test (the load runner, ad hoc
+    scripts) each outermost page-object call starts its own trace.
+    """
+
+    _local = threading.local()
+    _lock = threading.Lock()
+    _pending = []
+
+    @classmethod
+    def _stack(cls):
+        stack = getattr(cls._local, "stack", None)
+        if stack is None:
+            stack = cls._local.stack = []
+        return stack
+
+    @classmethod
+    def start_span(cls, name, attributes=None, arguments=None):
+        """Open a span under the current one; arguments are kept as-is for the Allure steps, never exported."""
+        stack = cls._stack()
+        parent = stack[-1] if stack else None
+        span = {"trace_id": parent["trace_id"] if parent else os.urandom(16).hex(), "span_id": os.urandom(8).hex(),
+                "parent_span_id": parent["span_id"] if parent else "", "name": name,
+                "start": time.time_ns(), "end": None, "status": STATUS_UNSET, "message": "", "error_type": None,
+                "attributes": attributes or {}, "arguments": arguments}
+        stack.append(span)
+        return span
+
+    @classmethod
+    def end_span(cls, span, error=None):
+        span["end"] = time.time_ns()
+        if error is not None:
+            span["status"] = STATUS_ERROR
+            span["message"] = f"{type(error).__name__}: {error}"[:500]
+            span["error_type"] = type(error)
+        stack = cls._stack()
+        stack.remove(span)
+        spans = getattr(cls._local, "spans", None)
+        if spans is None:
+            spans = cls._local.spans = []
+        spans.append(span)
+        if not stack:
+            return cls._flush_local(span)
+        return None
+
+    @classmethod
+    def begin(cls, test_id):
+        """Open the root span of a test; page-object spans of the test nest under it."""
+        return cls.start_span(test_id, {"test.id": test_id, "worker": Config.WORKER_ID})
+
+    @classmethod
+    def finish(cls, root, passed=True):
+        """Close a test's root span and return every span of its trace, in the order they ended."""
+        if not passed:
+            root["status"] = STATUS_ERROR
+        return cls.end_span(root)
+
+    @classmethod
+    def _flush_local(cls, root):
+        spans, cls._local.spans = cls._local.spans, []
+        with cls._lock:
+            cls._pending.extend(spans)
+            # Tests export one trace each; long-running scripts export in batches.
+            if "test.id" in root["attributes"] or len(cls._pending) >= Config.TRACE_BATCH_SPANS:
+                cls._export_locked()
+        return spans
+
+    @classmethod
+    def flush(cls):
+        with cls._lock:
+            cls._export_locked()
+
+    @classmethod
+    def _export_locked(cls):
+        if not cls._pending:
+            return
+        spans, cls._pending = cls._pending, []
+        os.makedirs(Config.PERF_DIR, exist_ok=True)
+        with open(cls.results_path(), "a") as trace_file:
+            trace_file.write(json.dumps(to_otlp(spans)) + "\n")
+
+    @staticmethod
+    def results_path(worker_id=None):
+        return os.path.join(Config.PERF_DIR, f"traces_{worker_id or Config.WORKER_ID}.jsonl")
+
+    @classmethod
+    def clear_results(cls):
+        for path in glob.glob(cls.results_path("*")):
+            os.remove(path)
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans):
+    return {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": Config.TRACE_SERVICE_NAME}}]},
+        "scopeSpans": [{"scope": {"name": "pages"}, "spans": [{
+            "traceId": span["trace_id"], "spanId": span["span_id"], "parentSpanId": span["parent_span_id"],
+            "name": span["name"], "kind": SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(span["start"]), "endTimeUnixNano": str(span["end"]),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in span["attributes"].items()],
+            "status": {"code": span["status"], "message": span["message"]},
+        } for span in spans]}],
+    }]}
+
+
+def traced(function, name):
+    code = inspect.unwrap(function).__code__
+    parameters = code.co_varnames[:code.co_argcount]
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        span = Tracer.start_span(name, {"code.function": function.__name__, "code.namespace": function.__module__},
+                                 (parameters, args, kwargs))
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as e:
+            Tracer.end_span(span, e)
+            raise
+        Tracer.end_span(span)
+        return result
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def instrument_class(cls):
+    """Wrap the public methods and single-underscore helpers defined on cls in spans; dunders are left alone."""
+    if not Config.TRACING:
+        return cls
+    for attribute, value in list(vars(cls).items()):
+        if attribute.startswith("__"):
+            continue
+        name = f"{cls.__name__}.{attribute}"
+        if isinstance(value, (staticmethod, classmethod)):
+            if not getattr(value.__func__, "__traced__", False):
+                setattr(cls, attribute, type(value)(traced(value.__func__, name)))
+        elif inspect.isfunction(value) and not getattr(value, "__traced__", False):
+            setattr(cls, attribute, traced(value, name))
+    return cls
+
+
+class Traced:
+    """Base class whose subclasses, and their subclasses, are instrumented as they are defined."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument_class(cls)
+
+
+def load_spans(paths):
+    spans = []
+    for path in paths:
+        with open(path, "r") as trace_file:
+            for line in trace_file:
+                for resource_spans in json.loads(line)["resourceSpans"]:
+                    for scope_spans in resource_spans["scopeSpans"]:
+                        spans.extend(scope_spans["spans"])
+    return spans
+
+
+def critical_paths(spans):
+    """For each flow, the chain of longest children and its slowest sub-step.
+
+    A flow is an outermost page-object call: a child of a test's root span, or
+    a root span itself outside tests. Page-object calls on one thread run one
+    after another, so the longest child at each level is the critical path and
+    the span on it with the most self time is the step to optimize.
+    """
+    children = {}
+    by_id = {}
+    for span in spans:
+        span["duration"] = (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e9
+        by_id[span["spanId"]] = span
+        children.setdefault(span["parentSpanId"], []).append(span)
+
+    def is_test(span):
+        return any(attribute["key"] == "test.id" for attribute in span["attributes"])
+
+    flows = []
+    for span in spans:
+        parent = by_id.get(span["parentSpanId"])
+        if is_test(span) or (parent is not None and not is_test(parent)):
+            continue
+        path = [span]
+        while children.get(path[-1]["spanId"]):
+            path.append(max(children[path[-1]["spanId"]], key=lambda child: child["duration"]))
+        self_times = [step["duration"] - sum(child["duration"] for child in children.get(step["spanId"], []))
+                      for step in path]
+        slowest = max(range(len(path)), key=lambda index: self_times[index])
+        flows.append({"test": parent["name"] if parent else None, "flow": span["name"],
+                      "duration": round(span["duration"], 3),
+                      "path": [{"name": step["name"], "duration": round(step["duration"], 3),
+                                "self": round(self_time, 3)} for step, self_time in zip(path, self_times)],
+                      "slowest_step": path[slowest]["name"], "slowest_self": round(self_times[slowest], 3)})
+    return flows
+
+
+def format_critical_paths(flows, top=None):
+    """Group flows by name, slowest first, naming the sub-step that is most often the bottleneck."""
+    grouped = {}
+    for flow in flows:
+        grouped.setdefault(flow["flow"], []).append(flow)
+
+    lines = []
+    for name, runs in sorted(grouped.items(), key=lambda item: -max(run["duration"] for run in item[1]))[:top]:
+        slowest_run = max(runs, key=lambda run: run["duration"])
+        bottlenecks = {}
+        for run in runs:
+            bottlenecks[run["slowest_step"]] = bottlenecks.get(run["slowest_step"], 0) + 1
+        bottleneck = max(bottlenecks, key=bottlenecks.get)
+        lines.append(f"{name}: slowest {slowest_run['duration']}s over {len(runs)} run(s); "
+                     f"slowest sub-step {bottleneck} ({bottlenecks[bottleneck]}/{len(runs)} runs)")
+        for step in slowest_run["path"]:
+            lines.append(f"    {step['duration']:8.3f}s  (self {step['self']:.3f}s)  {step['name']}")
+    return "\n".join(lines)
+
+
+def write_report(top=None):
+    """Write every flow's critical path over all workers' traces to critical_paths.json.
+
+    Returns the text form of the top slowest flows, or None without traces.
+    """
+    flows = critical_paths(load_spans(glob.glob(Tracer.results_path("*"))))
+    if not flows:
+        return None
+    with open(os.path.join(Config.PERF_DIR, "critical_paths.json"), "w") as report_file:
+        json.dump(flows, report_file, indent=2)
+    return format_critical_paths(flows, top)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Critical path of every page-object flow in exported traces.")
+    parser.add_argument("paths", nargs="*", help="OTLP JSON lines files; defaults to every worker's traces")
+    parser.add_argument("--top", type=int, help="Show only the N slowest flows")
+    parser.add_argument("--output", help="Write every flow's critical path as JSON to this path")
+    args = parser.parse_args()
+
+    flows = critical_paths(load_spans(args.paths or glob.glob(Tracer.results_path("*"))))
+    print(format_critical_paths(flows, args.top) or "No traces found.")
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(flows, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from config.config import Config
+from utils.adaptive_timeouts import AdaptiveTimeouts
+from utils.time_breakdown import TimeBreakdown
+
+
+class WaitPolicy:
+    """Single source of truth for how long the framework waits.
+
+    Implicit waits are turned off so they never stack on top of explicit waits;
+    every wait instead picks a named timeout by the kind of action it guards.
+    Configured timeouts are multiplied by Config.TIMEOUT_SCALE, which the
+    session-start latency calibration sets for the environment under test.
+    Learned per-locator timeouts are kept per Config.BASE_URL, so they were
+    measured in that environment already, and explicit overrides mean what they
+    say; neither is scaled.
+    """
+    NAVIGATION = "navigation"
+    AJAX = "ajax"
+    ELEMENT = "element"
+    NEGATIVE = "negative"
+
+    @staticmethod
+    def timeout(action=ELEMENT):
+        """Return the configured timeout in seconds for an action class, scaled for the environment."""
+        return WaitPolicy._configured(action) * Config.TIMEOUT_SCALE
+
+    @staticmethod
+    def _configured(action):
+        timeouts = {
+            WaitPolicy.NAVIGATION: Config.NAVIGATION_TIMEOUT,
+            WaitPolicy.AJAX: Config.AJAX_TIMEOUT,
+            WaitPolicy.ELEMENT: Config.ELEMENT_TIMEOUT,
+            WaitPolicy.NEGATIVE: Config.NEGATIVE_CHECK_TIMEOUT,
+        }
+        if action not in timeouts:
+            raise ValueError(f"Unknown wait action: {action}")
+        return timeouts[action]
+
+    @staticmethod
+    def resolve(action=ELEMENT, timeout=None, locator=None):
+        """Return the effective timeout: an explicit override, else learned, else configured and scaled."""
+        if timeout is not None:
+            return timeout
+        configured = WaitPolicy.timeout(action)
+        if locator is None:
+            return configured
+        return AdaptiveTimeouts.timeout(action, locator, configured)
+
+    @staticmethod
+    def apply(driver):
+        """Configure a freshly created driver: no implicit wait, bounded page loads."""
+        driver.implicitly_wait(0)
+        driver.set_page_load_timeout(WaitPolicy.timeout(WaitPolicy.NAVIGATION))
+
+    @staticmethod
+    def wait(driver, action=ELEMENT, timeout=None, locator=None):
+        """Build a WebDriverWait for an action class, or for an explicit override."""
+        timeout = WaitPolicy.resolve(action, timeout, locator)
+        return WebDriverWait(driver, timeout, poll_frequency=Config.POLL_FREQUENCY)
+
+    @staticmethod
+    def until(driver, condition, action=ELEMENT, timeout=None, message="", locator=None):
+        """Wait until the condition returns a truthy value and return it.
+
+        When the locator is known, the time the wait took, or the fact that it timed
+        out, is recorded so later runs can learn a per-locator timeout.
+        """
+        started = time.monotonic()
+        with TimeBreakdown.measure("waits"):
+            try:
+                result = WaitPolicy.wait(driver, action, timeout, locator).until(condition, message)
+            except TimeoutException:
+                if locator is not None:
+                    AdaptiveTimeouts.record_timeout(action, locator)
+                raise
+        if locator is not None:
+            AdaptiveTimeouts.record(action, locator, time.monotonic() - started)
+        return result
+
+    @staticmethod
+    def until_not(driver, condition, action=NEGATIVE, timeout=None, message=""):
+        """Wait until the condition returns a falsy value."""
+        with TimeBreakdown.measure("waits"):
+            return WaitPolicy.wait(driver, action, timeout).until_not(condition, message)
@@ -1,27 +1,27 @@
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from utils.logger import setup_logger
+from utils.wait_policy import WaitPolicy
 
 logger = setup_logger()
 
 class WaitUtil:
     @staticmethod
-    def wait_for_element(driver, locator, condition, timeout=20):
+    def wait_for_element(driver, locator, condition, timeout=None, action=WaitPolicy.ELEMENT):
         """Wait for an element located by the specified locator to satisfy a condition."""
         try:
-            logger.debug(f"Waiting for element with locator: {locator}, Condition: {condition}")
-            return WebDriverWait(driver, timeout).until(condition(locator))
+            logger.debug("Waiting for element with locator: %s, Condition: %s", locator, condition)
+            return WaitPolicy.until(driver, condition(locator), action, timeout, locator=locator)
         except TimeoutException as e:
-            logger.error(f"Timeout while waiting for element: {locator}. Exception: {e}")
+            logger.error("Timeout while waiting for element: %s. Exception: %s", locator, e)
             raise
 
     @staticmethod
-    def wait_for_element_to_be_visible(driver, locator, timeout=20):
+    def wait_for_element_to_be_visible(driver, locator, timeout=None):
         """Wait for an element located by the specified locator to be visible."""
         return WaitUtil.wait_for_element(driver, locator, EC.visibility_of_element_located, timeout)
 
     @staticmethod
-    def wait_for_element_to_be_clickable(driver, locator, timeout=20):
+    def wait_for_element_to_be_clickable(driver, locator, timeout=None):
         """Wait for an element located by the specified locator to be clickable."""
-        return WaitUtil.wait_for_element(driver, locator, EC.element_to_be_clickable, timeout)
\ No newline at end of file
+        return WaitUtil.wait_for_element(driver, locator, EC.element_to_be_clickable, timeout)